@@ -1,27 +1,83 @@
-from flask import Flask, jsonify, request
-from flask_socketio import SocketIO
+import os
+
+# eventlet/gevent must patch the stdlib before any networking module is
+# imported, so this has to run ahead of Flask, redis and mysql imports.
+# .env is parsed first so WEBSOCKET_ASYNC_MODE can be set there too.
+from config.app_config import _ensure_dotenv_loaded
+_ensure_dotenv_loaded()
+# uvicorn runs its own asyncio loop, which must not be green-patched.
+_ASYNC_MODE = os.getenv('WEBSOCKET_ASYNC_MODE', 'eventlet')
+_USE_UVICORN = os.getenv('APP_SERVER', '').lower() == 'uvicorn'
+if not _USE_UVICORN:
+    if _ASYNC_MODE == 'eventlet':
+        import eventlet
+        eventlet.monkey_patch()
+    elif _ASYNC_MODE == 'gevent':
+        from gevent import monkey
+        monkey.patch_all()
+
+from flask import Flask, abort, current_app, request, stream_with_context
 import logging
+import logging.handlers
+import atexit
+import queue
 import sys
-import os
+import threading
+import time
+from collections import defaultdict
+from functools import lru_cache, wraps
 
 # Add the server directory to Python path for imports
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
-from utils.app_state import initialize_app_state, get_app_state
-from websocket.events import register_websocket_events
+from utils.app_state import initialize_app_state, load_app_configuration, get_app_state
+from utils.json_utils import ORJSONProvider, dumps_bytes
 
 # Configure logging
+# Request threads only enqueue records; a background listener does the I/O.
+# File writes are batched and flushed on WARNING, when the buffer fills, or
+# every LOG_FLUSH_INTERVAL seconds so quiet periods still reach the file.
+LOG_FLUSH_INTERVAL = 5.0
+_log_formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+_stream_handler = logging.StreamHandler(sys.stdout)
+_stream_handler.setFormatter(_log_formatter)
+_file_handler = logging.FileHandler('app.log')
+_file_handler.setFormatter(_log_formatter)
+_buffered_file_handler = logging.handlers.MemoryHandler(
+    capacity=1024,
+    flushLevel=logging.WARNING,
+    target=_file_handler
+)
+
+def _flush_log_buffer():
+    """Flush buffered file records on a fixed interval"""
+    while True:
+        time.sleep(LOG_FLUSH_INTERVAL)
+        _buffered_file_handler.flush()
+
+# QueueHandler.prepare merges args into the message at enqueue time, so
+# records are not affected by later changes to mutable arguments
+_log_queue = queue.Queue(-1)
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('app.log')
-    ]
+    handlers=[_queue_handler]
 )
 
+_log_listener = logging.handlers.QueueListener(_log_queue, _stream_handler, _buffered_file_handler)
+_log_listener.start()
+threading.Thread(target=_flush_log_buffer, name='log-flush', daemon=True).start()
+atexit.register(_buffered_file_handler.close)
+atexit.register(_log_listener.stop)
+
 logger = logging.getLogger(__name__)
 
+# Flask settings read from the environment once at import
+SECRET_KEY = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
+FLASK_DEBUG = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
+DEFER_POOLS = os.getenv('APP_DEFER_POOLS', 'False').lower() == 'true'
+
 def create_app():
     """
     Create and configure Flask application.
@@ -30,13 +86,21 @@ def create_app():
         Flask application instance with SocketIO attached
     """
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
     
     # Configure Flask app
-    app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
-    app.config['DEBUG'] = os.getenv('FLASK_DEBUG', 'False').lower() == 'true'
+    app.config['SECRET_KEY'] = SECRET_KEY
+    app.config['DEBUG'] = FLASK_DEBUG
     
-    # Initialize app state
-    if not initialize_app_state(app):
+    # Initialize app state. When pools are deferred (Gunicorn), only the
+    # fork-safe configuration is loaded here and each worker opens its own
+    # pools from the post_worker_init hook in gunicorn.conf.py.
+    if DEFER_POOLS:
+        initialized = load_app_configuration(app)
+    else:
+        initialized = initialize_app_state(app)
+    
+    if not initialized:
         logger.error("Failed to initialize app state")
         sys.exit(1)
     
@@ -49,14 +113,123 @@ def create_app():
     # Attach SocketIO to app for production access
     app.socketio = socketio
     
-    # Register WebSocket events
+    # Register WebSocket events (imported here so the handler module is
+    # only loaded once the app is actually being built)
+    from websocket.events import register_websocket_events
     register_websocket_events(socketio)
     
     # Register HTTP routes
     register_routes(app)
     
+    # Pre-serialize the /config body; app_state.config is read-only and
+    # is not replaced after startup
+    app.extensions['config_bytes'] = _config_body(app_state.config)
+    
+    # Freeze the route list once the URL map is final
+    app.extensions['routes'] = tuple(rule.rule for rule in app.url_map.iter_rules())
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Available routes: %s", app.extensions['routes'])
+    
+    # Pre-serialize the error bodies
+    endpoints = sorted({route for route in app.extensions['routes'] if not route.startswith('/static')})
+    app.extensions['404_body'] = dumps_bytes({
+        'error': 'Endpoint not found',
+        'available_endpoints': endpoints
+    })
+    app.extensions['500_body'] = dumps_bytes({
+        'error': 'Internal server error',
+        'message': 'An unexpected error occurred'
+    })
+    
     return app
 
+def _config_body(config):
+    """
+    Serialize the non-sensitive configuration exposed by /config.
+    
+    Args:
+        config: Read-only application configuration
+        
+    Returns:
+        JSON bytes of the safe configuration
+    """
+    
+    # Return only non-sensitive config
+    safe_config = {
+        'mysql': {
+            'host': config['mysql']['host'],
+            'port': config['mysql']['port'],
+            'database': config['mysql']['database'],
+            'charset': config['mysql']['charset']
+        },
+        'redis': {
+            'host': config['redis']['host'],
+            'port': config['redis']['port'],
+            'db': config['redis']['db']
+        },
+        'websocket': config['websocket'],
+        'timezone': config['timezone'],
+        'environment': config['environment']
+    }
+    
+    return dumps_bytes(safe_config)
+
+@lru_cache(maxsize=64)
+def _classify_health(flags):
+    """
+    Classify overall health from the per-component ok flags.
+    
+    Args:
+        flags: Tuple of component ok booleans
+        
+    Returns:
+        'healthy' if every component is ok, otherwise 'unhealthy'
+    """
+    return 'healthy' if all(flags) else 'unhealthy'
+
+# Health responses are reused for this long so probe bursts share one check
+_HEALTH_TTL = 0.5
+_HEALTH_CACHE = {}
+
+def _health_cached(key):
+    """
+    Cache a health endpoint's serialized response for _HEALTH_TTL seconds.
+    
+    Entries are keyed on the endpoint key plus the URL arguments.
+    Concurrent requests that find an entry stale wait on its lock so only
+    one of them runs the underlying check. 5xx responses are never cached.
+    Routes should constrain their URL arguments so the set of keys stays
+    bounded.
+    
+    Args:
+        key: Cache key identifying the health endpoint
+        
+    Returns:
+        Decorator for a Flask view function
+    """
+    def decorator(view):
+        locks = defaultdict(threading.Lock)
+        
+        @wraps(view)
+        def wrapper(**view_args):
+            cache_key = (key, *view_args.values())
+            entry = _HEALTH_CACHE.get(cache_key)
+            if entry is None or time.monotonic() >= entry[0]:
+                with locks[cache_key]:
+                    entry = _HEALTH_CACHE.get(cache_key)
+                    if entry is None or time.monotonic() >= entry[0]:
+                        response = view(**view_args)
+                        if response.status_code >= 500:
+                            return response
+                        entry = (time.monotonic() + _HEALTH_TTL, response.get_data(), response.status_code)
+                        _HEALTH_CACHE[cache_key] = entry
+            
+            return current_app.response_class(entry[1], status=entry[2], mimetype='application/json')
+        
+        return wrapper
+    
+    return decorator
+
 def register_routes(app):
     """
     Register HTTP routes.
@@ -65,205 +238,200 @@ def register_routes(app):
         app: Flask application instance
     """
     
+    # Hot callables, bound below as default arguments so handlers reach
+    # them with a local lookup
+    _dumps = dumps_bytes
+    _Response = app.response_class
+    
+    def ojsonify(payload, status=200, _dumps=_dumps, _Response=_Response):
+        """Serialize payload with orjson into a JSON response"""
+        return _Response(_dumps(payload), status=status, mimetype='application/json')
+    
+    def _err(e, status=500, _dumps=_dumps, _Response=_Response):
+        """Build the standard error response from a pre-serialized shell"""
+        # orjson escapes the message; keep the surrounding quotes
+        return _Response(b'{"status":"error","error":' + _dumps(str(e)) + b'}', status=status, mimetype='application/json')
+    
+    # app_state is fixed for the process lifetime, so bind it and the
+    # hot callables once instead of looking them up on every request
+    app_state = get_app_state()
+    health_check_fn = app_state.health_check
+    get_stats_fn = app_state.get_stats
+    _TIMEZONE = app_state.config.get('timezone', 'UTC')
+    
+    # Static shell of the healthy /health body; only components vary
+    _OK_PREFIX = b'{"status":"healthy","timestamp":' + dumps_bytes(_TIMEZONE) + b',"components":'
+    
+    # Closing bytes of the streamed /stats body
+    _STATS_SUFFIX = b'},"timestamp":' + dumps_bytes(_TIMEZONE) + b'}'
+    
+    # The root payload never changes, so serialize it once
+    index_body = dumps_bytes({
+        'message': 'Flask app with WebSocket, MySQL, and Redis is running!',
+        'status': 'healthy',
+        'endpoints': {
+            'health': '/health',
+            'health_detailed': '/health/detailed',
+            'stats': '/stats',
+            'websocket': '/socket.io/'
+        }
+    })
+    
     @app.route('/')
-    def index():
+    def index(_Response=_Response):
         """Root endpoint"""
-        return jsonify({
-            'message': 'Flask app with WebSocket, MySQL, and Redis is running!',
-            'status': 'healthy',
-            'endpoints': {
-                'health': '/health',
-                'health_detailed': '/health/detailed',
-                'stats': '/stats',
-                'websocket': '/socket.io/'
-            }
-        })
+        return _Response(index_body, mimetype='application/json')
     
     @app.route('/health')
-    def health_check():
+    @_health_cached('health')
+    def health_check(_dumps=_dumps, _Response=_Response):
         """Basic health check endpoint"""
         try:
-            app_state = get_app_state()
-            health_status = app_state.health_check()
+            health_status = health_check_fn()
             
             # Determine overall health
-            overall_health = 'healthy'
-            for component, status in health_status.items():
-                if isinstance(status, str) and ('error' in status.lower() or 'unhealthy' in status.lower()):
-                    overall_health = 'unhealthy'
-                    break
+            overall_health = _classify_health(tuple(status['ok'] for status in health_status.values()))
+            
+            if overall_health == 'healthy':
+                return _Response(
+                    _OK_PREFIX + _dumps(health_status) + b'}',
+                    mimetype='application/json'
+                )
             
-            return jsonify({
+            return ojsonify({
                 'status': overall_health,
-                'timestamp': app_state.config.get('timezone', 'UTC'),
+                'timestamp': _TIMEZONE,
                 'components': health_status
-            }), 200 if overall_health == 'healthy' else 503
+            }, status=503)
             
         except Exception as e:
-            logger.error(f"Health check failed: {e}")
-            return jsonify({
-                'status': 'error',
-                'error': str(e)
-            }), 500
+            logger.error("Health check failed: %s", e)
+            return _err(e)
     
     @app.route('/health/detailed')
     def detailed_health_check():
         """Detailed health check with component information"""
         try:
-            app_state = get_app_state()
-            health_status = app_state.health_check()
-            stats = app_state.get_stats()
+            health_status = health_check_fn()
+            stats = get_stats_fn()
             
-            return jsonify({
+            return ojsonify({
                 'health': health_status,
                 'stats': stats,
                 'app_initialized': app_state.is_initialized()
             })
             
         except Exception as e:
-            logger.error(f"Detailed health check failed: {e}")
-            return jsonify({
-                'status': 'error',
-                'error': str(e)
-            }), 500
-    
-    @app.route('/health/mysql')
-    def mysql_health():
-        """MySQL-specific health check"""
-        try:
-            app_state = get_app_state()
-            mysql_pool = app_state.mysql_connection
-            
-            if not mysql_pool:
-                return jsonify({'status': 'not_initialized'}), 503
-            
-            status = mysql_pool.get_pool_status()
-            return jsonify(status)
-            
-        except Exception as e:
-            logger.error(f"MySQL health check failed: {e}")
-            return jsonify({
-                'status': 'error',
-                'error': str(e)
-            }), 500
-    
-    @app.route('/health/redis')
-    def redis_health():
-        """Redis-specific health check"""
-        try:
-            app_state = get_app_state()
-            redis_manager = app_state.redis_connection
-            
-            if not redis_manager:
-                return jsonify({'status': 'not_initialized'}), 503
-            
-            info = redis_manager.get_connection_info()
-            return jsonify(info)
-            
-        except Exception as e:
-            logger.error(f"Redis health check failed: {e}")
-            return jsonify({
-                'status': 'error',
-                'error': str(e)
-            }), 500
-    
-    @app.route('/health/websocket')
-    def websocket_health():
-        """WebSocket-specific health check"""
+            logger.error("Detailed health check failed: %s", e)
+            return _err(e)
+    
+    # Component checks served by /health/<component>; each returns None
+    # when the component was never initialized. Pools are read through
+    # app_state since workers may open them after routes are registered.
+    _CHECKS = {
+        'mysql': lambda: app_state.mysql_connection.get_pool_status() if app_state.mysql_connection else None,
+        'redis': lambda: app_state.redis_connection.get_connection_info() if app_state.redis_connection else None,
+        'websocket': lambda: app_state.websocket_config.get_websocket_stats() if app_state.websocket_config else None,
+    }
+    
+    @_health_cached('component')
+    def component_health(component):
+        """MySQL, Redis or WebSocket specific health check"""
+        check = _CHECKS.get(component)
+        if check is None:
+            abort(404)
+        
         try:
-            app_state = get_app_state()
-            websocket_manager = app_state.get_websocket_manager()
+            result = check()
+            if result is None:
+                return ojsonify({'status': 'not_initialized'}, status=503)
             
-            if not websocket_manager:
-                return jsonify({'status': 'not_initialized'}), 503
-            
-            stats = websocket_manager.get_websocket_stats()
-            return jsonify(stats)
+            return ojsonify(result)
             
         except Exception as e:
-            logger.error(f"WebSocket health check failed: {e}")
-            return jsonify({
-                'status': 'error',
-                'error': str(e)
-            }), 500
+            logger.error("%s health check failed: %s", component, e)
+            return _err(e)
+    
+    # One concrete rule per component keeps /health/<name> URLs (and the
+    # 404 endpoint list) unchanged while sharing a single view
+    for component in _CHECKS:
+        app.add_url_rule(
+            f'/health/{component}',
+            view_func=component_health,
+            defaults={'component': component}
+        )
     
     @app.route('/stats')
-    def get_stats():
+    def get_stats(_dumps=_dumps, _Response=_Response):
         """Get comprehensive application statistics"""
         try:
-            app_state = get_app_state()
-            stats = app_state.get_stats()
+            # Gather stats up front so failures still map to a 500
+            stats = get_stats_fn()
             
-            return jsonify({
-                'stats': stats,
-                'timestamp': app_state.config.get('timezone', 'UTC')
-            })
+            def generate():
+                # Stream one top-level component at a time
+                separator = b'{"stats":{'
+                for name, value in stats.items():
+                    yield separator + _dumps(str(name)) + b':' + _dumps(value)
+                    separator = b','
+                if separator != b',':
+                    yield separator
+                yield _STATS_SUFFIX
+            
+            return _Response(stream_with_context(generate()), mimetype='application/json')
             
         except Exception as e:
-            logger.error(f"Stats endpoint failed: {e}")
-            return jsonify({
-                'status': 'error',
-                'error': str(e)
-            }), 500
+            logger.error("Stats endpoint failed: %s", e)
+            return _err(e)
     
     @app.route('/config')
-    def get_config():
+    def get_config(_Response=_Response):
         """Get non-sensitive configuration information"""
         try:
-            app_state = get_app_state()
-            
-            # Return only non-sensitive config
-            safe_config = {
-                'mysql': {
-                    'host': app_state.config['mysql']['host'],
-                    'port': app_state.config['mysql']['port'],
-                    'database': app_state.config['mysql']['database'],
-                    'charset': app_state.config['mysql']['charset']
-                },
-                'redis': {
-                    'host': app_state.config['redis']['host'],
-                    'port': app_state.config['redis']['port'],
-                    'db': app_state.config['redis']['db']
-                },
-                'websocket': app_state.config['websocket'],
-                'timezone': app_state.config['timezone'],
-                'environment': app_state.config['environment']
-            }
-            
-            return jsonify(safe_config)
+            return _Response(current_app.extensions['config_bytes'], mimetype='application/json')
             
         except Exception as e:
-            logger.error(f"Config endpoint failed: {e}")
-            return jsonify({
-                'status': 'error',
-                'error': str(e)
-            }), 500
+            logger.error("Config endpoint failed: %s", e)
+            return _err(e)
     
     @app.errorhandler(404)
     def not_found(error):
         """Handle 404 errors"""
-        return jsonify({
-            'error': 'Endpoint not found',
-            'available_endpoints': [
-                '/',
-                '/health',
-                '/health/detailed',
-                '/health/mysql',
-                '/health/redis',
-                '/health/websocket',
-                '/stats',
-                '/config'
-            ]
-        }), 404
+        return current_app.response_class(current_app.extensions['404_body'], status=404, mimetype='application/json')
     
     @app.errorhandler(500)
     def internal_error(error):
         """Handle 500 errors"""
-        logger.error(f"Internal server error: {error}")
-        return jsonify({
-            'error': 'Internal server error',
-            'message': 'An unexpected error occurred'
-        }), 500
+        logger.error("Internal server error: %s", error)
+        return current_app.response_class(current_app.extensions['500_body'], status=500, mimetype='application/json')
+
+def run_uvicorn(app, host, port):
+    """
+    Serve the HTTP routes with uvicorn through an ASGI adapter.
+    
+    Socket.IO is not available in this mode since the WSGI app is wrapped
+    as plain ASGI; it is intended for benchmarking the HTTP endpoints.
+    The stdlib is left unpatched when APP_SERVER=uvicorn, so the fallback
+    to SocketIO should use WEBSOCKET_ASYNC_MODE=threading.
+    
+    Args:
+        app: Flask application instance
+        host: Interface to bind
+        port: Port to bind
+        
+    Returns:
+        False if uvicorn or asgiref is not installed, True once the server exits
+    """
+    try:
+        import uvicorn
+        from asgiref.wsgi import WsgiToAsgi
+    except ImportError:
+        logger.warning("APP_SERVER=uvicorn requested but uvicorn/asgiref are not installed")
+        return False
+    
+    # uvloop and httptools are optional extras of uvicorn
+    uvicorn.run(WsgiToAsgi(app), host=host, port=port, loop='auto', http='auto')
+    return True
 
 # Create application instance for production (Gunicorn)
 app = create_app()
@@ -278,20 +446,23 @@ if __name__ == '__main__':
         app_state = get_app_state()
         config = app_state.config
         
-        # Run the application with SocketIO for development
         logger.info("Application running on port 5000")
-        socketio.run(
-            app,
-            host='0.0.0.0',
-            port=5000,
-            debug=config.get('debug', False),
-            allow_unsafe_werkzeug=True  # For development only
-        )
+        
+        # Opt-in C-accelerated HTTP server, otherwise SocketIO for development
+        if not (_USE_UVICORN and run_uvicorn(app, '0.0.0.0', 5000)):
+            socketio.run(
+                app,
+                host='0.0.0.0',
+                port=5000,
+                debug=config.get('debug', False),
+                # Werkzeug is only used in threading mode; never allow it in production
+                allow_unsafe_werkzeug=config.get('environment') != 'production'
+            )
         
     except KeyboardInterrupt:
         pass
     except Exception as e:
-        logger.error(f"Failed to start application: {e}")
+        logger.error("Failed to start application: %s", e)
         sys.exit(1)
     finally:
         # Cleanup
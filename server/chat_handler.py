@@ -4,27 +4,81 @@ Integrates system_prompts, tool_prompts, and user_prompts to construct final pro
 Now includes LangChain Sequential Chain integration for analytics queries
 """
 
+import asyncio
+import hashlib
 import logging
+import threading
 import time
-from typing import Dict, Any, Optional, Tuple
-from datetime import datetime, timedelta
+import weakref
+from collections import Counter, OrderedDict
+from concurrent.futures import Future
+from functools import lru_cache
+from html import escape
+from typing import Dict, Any, List, Optional, Tuple
 
 # Import prompt modules
 from prompts.system_prompts import build_internal_user_context
 from prompts.tool_prompts import get_schema
 from prompts.user_prompts import (
     build_user_context, 
+    build_batch_user_context,
     is_analytics_related_query,
     handle_non_analytics_query_direct
 )
 
 # Import LangChain integration
 from langchain_integration.chains.sequential_chain import SequentialChain
-from langchain_integration.models.response_models import ChainConfig, LLMConfig
+from langchain_integration.models.response_models import ChainConfig, DataSummaryResult, ExecutionConfig, LLMConfig
 
 logger = logging.getLogger(__name__)
 
 
+class _NoLoop:
+    """Weak-referenceable key for chains used outside any event loop"""
+
+
+_NO_LOOP = _NoLoop()
+
+# Final prompt layout: [SYSTEM CONTEXT] / [TOOL CONTEXT] / [USER CONTEXT]
+_PROMPT_TEMPLATE = "[SYSTEM CONTEXT]\n%s\n\n[TOOL CONTEXT]\n%s\n\n[USER CONTEXT]\n%s\n"
+
+# Fixed parts of the DataSummaryResult built for non-analytics queries
+_WRAP_P = "<p>%s</p>"
+_NON_ANALYTICS_MARKDOWN = "No data table available for non-analytics queries"
+_NON_ANALYTICS_INSIGHTS = ("Non-analytics query handled directly",)
+
+# Fallback response templates, filled with the error message
+_FALLBACK_TEXT = """I apologize, but I encountered an error while processing your request. 
+
+Error: %s
+
+Please try rephrasing your question or contact support if the issue persists.
+
+I can help you with:
+• Payment analytics and reporting
+• Transaction summaries and trends
+• Revenue analysis
+• Success/failure rate analysis
+
+What payment data would you like to explore?"""
+_FALLBACK_HTML = (
+    "<p><strong>Error:</strong> %s</p>"
+    "<p>Please try rephrasing your question or contact support if the issue persists.</p>"
+)
+_FALLBACK_MARKDOWN = "No data available due to error"
+
+
+@lru_cache(maxsize=4096)
+def _classify_cached(normalized_query: str) -> Tuple[bool, str]:
+    """
+    Memoized is_analytics_related_query for normalized (stripped, lowercased) queries
+    
+    The classifier lowercases and strips the query itself, so classifying
+    the normalized form gives the same answer.
+    """
+    return is_analytics_related_query(normalized_query)
+
+
 class ChatHandlerError(Exception):
     """Base exception for chat handler errors"""
     pass
@@ -50,154 +104,377 @@ class ChatHandlerCache:
     Simple in-memory cache for frequently used data
     """
     
+    __slots__ = (
+        'schema_cache', 'system_context_cache', 'cache_timestamps',
+        'formatted_schema_cache', 'max_schema_entries', 'schema_ttl', 'system_context_ttl'
+    )
+    
     def __init__(self):
-        self.schema_cache = {}
+        # Entries are (value, expires_at) tuples on the time.monotonic() clock;
+        # schema caches are LRU-ordered and bounded by max_schema_entries
+        self.schema_cache: OrderedDict = OrderedDict()
         self.system_context_cache = None
-        self.cache_timestamps = {}
+        self.cache_timestamps = {}  # monotonic store times, for stats only
+        # id(schema) -> (schema, formatted prompt text); the schema is kept so
+        # a recycled id can never match a different dict
+        self.formatted_schema_cache: OrderedDict = OrderedDict()
+        self.max_schema_entries = 32
         self.schema_ttl = 300  # 5 minutes
         self.system_context_ttl = 600  # 10 minutes
     
-    def _is_cache_valid(self, cache_key: str, ttl: int) -> bool:
-        """Check if cache entry is still valid"""
-        if cache_key not in self.cache_timestamps:
-            return False
-        
-        timestamp = self.cache_timestamps[cache_key]
-        return datetime.now() - timestamp < timedelta(seconds=ttl)
-    
     def get_schema(self, cache_key: str = "default") -> Optional[Dict[str, Any]]:
         """Get cached schema if valid"""
-        if cache_key in self.schema_cache and self._is_cache_valid(cache_key, self.schema_ttl):
-            logger.debug(f"Schema cache hit for key: {cache_key}")
-            return self.schema_cache[cache_key]
+        entry = self.schema_cache.get(cache_key)
+        if entry is not None and time.monotonic() < entry[1]:
+            self.schema_cache.move_to_end(cache_key)
+            logger.debug("Schema cache hit for key: %s", cache_key)
+            return entry[0]
         
-        logger.debug(f"Schema cache miss for key: {cache_key}")
+        logger.debug("Schema cache miss for key: %s", cache_key)
         return None
     
-    def set_schema(self, schema: Dict[str, Any], cache_key: str = "default") -> None:
-        """Cache schema with timestamp"""
-        self.schema_cache[cache_key] = schema
-        self.cache_timestamps[cache_key] = datetime.now()
-        logger.debug(f"Schema cached for key: {cache_key}")
+    def set_schema(
+        self, schema: Dict[str, Any], cache_key: str = "default", ttl: Optional[float] = None
+    ) -> None:
+        """Cache schema with expiry; ttl overrides schema_ttl for this entry"""
+        now = time.monotonic()
+        previous = self.schema_cache.get(cache_key)
+        if previous is not None:
+            self.formatted_schema_cache.pop(id(previous[0]), None)
+        
+        self.schema_cache[cache_key] = (schema, now + (self.schema_ttl if ttl is None else ttl))
+        self.schema_cache.move_to_end(cache_key)
+        self.cache_timestamps[cache_key] = now
+        
+        while len(self.schema_cache) > self.max_schema_entries:
+            evicted_key, (evicted, _) = self.schema_cache.popitem(last=False)
+            self.formatted_schema_cache.pop(id(evicted), None)
+            self.cache_timestamps.pop(evicted_key, None)
+        logger.debug("Schema cached for key: %s", cache_key)
     
     def get_system_context(self) -> Optional[str]:
         """Get cached system context if valid"""
-        if (self.system_context_cache and 
-            self._is_cache_valid("system_context", self.system_context_ttl)):
+        entry = self.system_context_cache
+        if entry is not None and entry[0] and time.monotonic() < entry[1]:
             logger.debug("System context cache hit")
-            return self.system_context_cache
+            return entry[0]
         
         logger.debug("System context cache miss")
         return None
     
     def set_system_context(self, context: str) -> None:
-        """Cache system context with timestamp"""
-        self.system_context_cache = context
-        self.cache_timestamps["system_context"] = datetime.now()
+        """Cache system context with expiry"""
+        now = time.monotonic()
+        self.system_context_cache = (context, now + self.system_context_ttl)
+        self.cache_timestamps["system_context"] = now
         logger.debug("System context cached")
     
+    def get_formatted_schema(self, schema: Dict[str, Any]) -> Optional[str]:
+        """Get the cached prompt text for this exact schema object"""
+        entry = self.formatted_schema_cache.get(id(schema))
+        if entry is not None and entry[0] is schema:
+            self.formatted_schema_cache.move_to_end(id(schema))
+            return entry[1]
+        return None
+    
+    def set_formatted_schema(self, schema: Dict[str, Any], formatted: str) -> None:
+        """Cache the prompt text derived from a schema object"""
+        self.formatted_schema_cache[id(schema)] = (schema, formatted)
+        self.formatted_schema_cache.move_to_end(id(schema))
+        
+        while len(self.formatted_schema_cache) > self.max_schema_entries:
+            self.formatted_schema_cache.popitem(last=False)
+    
     def clear_cache(self) -> None:
         """Clear all cache entries"""
         self.schema_cache.clear()
+        self.formatted_schema_cache.clear()
         self.system_context_cache = None
         self.cache_timestamps.clear()
         logger.info("Cache cleared")
 
 
+def _render_table(table_name: str, table_info: Any) -> Optional[str]:
+    """
+    Render one table of the schema prompt
+    
+    Args:
+        table_name: Table name
+        table_info: Schema entry for the table
+        
+    Returns:
+        Optional[str]: Table block ending in a blank line, or None for
+        entries that are neither a table nor an error
+    """
+    if not isinstance(table_info, dict):
+        return None
+    
+    if 'columns' in table_info:
+        sections = [f"### {table_name.upper()} TABLE:\n"]
+        
+        if table_info['columns']:
+            columns = "\n".join(
+                f"- {col['name']}: {col['data_type']} "
+                f"{'NULL' if col.get('nullable') == 'YES' else 'NOT NULL'}"
+                f"{f' ({key})' if (key := col.get('key')) else ''}"
+                for col in table_info['columns']
+            )
+            sections.append(f"**Columns:**\n{columns}\n")
+        
+        if table_info.get('indexes'):
+            indexes = "\n".join(
+                f"- {'UNIQUE ' if idx.get('unique') else ''}INDEX {idx['name']} ({', '.join(idx.get('columns', []))})"
+                for idx in table_info['indexes']
+            )
+            sections.append(f"**Indexes:**\n{indexes}\n")
+        
+        if table_info.get('foreign_keys'):
+            foreign_keys = "\n".join(
+                f"- {fk['column']} → {fk['referenced_table']}.{fk['referenced_column']}"
+                for fk in table_info['foreign_keys']
+            )
+            sections.append(f"**Foreign Keys:**\n{foreign_keys}\n")
+        
+        return "\n".join(sections)
+    
+    if 'error' in table_info:
+        return f"### {table_name.upper()} TABLE: Error - {table_info['error']}\n"
+    
+    return None
+
+
 class ChatHandler:
     """
     Main chat handler that orchestrates prompt construction
     """
     
+    __slots__ = (
+        'cache', 'logger', 'processing_stats',
+        '_chains_by_loop', '_init_lock', '_inflight', '_inflight_lock'
+    )
+    
+    # Largest number of analytics queries sent to the LLM in one batched prompt
+    MAX_BATCH_SIZE = 8
+    
+    # Seconds a successful analytics result is shared with identical queries
+    SINGLE_FLIGHT_TTL = 30.0
+    
     def __init__(self):
         """Initialize chat handler with cache and configuration"""
         self.cache = ChatHandlerCache()
         self.logger = logger
-        self.processing_stats = {
-            'total_requests': 0,
-            'analytics_requests': 0,
-            'non_analytics_requests': 0,
-            'langchain_requests': 0,
-            'errors': 0,
-            'cache_hits': 0,
-            'cache_misses': 0
-        }
+        # Pre-seeded so get_stats reports every counter even before it moves
+        self.processing_stats = Counter(dict.fromkeys((
+            'total_requests',
+            'analytics_requests',
+            'non_analytics_requests',
+            'langchain_requests',
+            'errors',
+            'cache_hits',
+            'cache_misses'
+        ), 0))
+        
+        # LangChain Sequential Chains, created lazily per event loop since the
+        # underlying async HTTP clients are bound to the loop that created them.
+        # Entries disappear with their loop.
+        self._chains_by_loop = weakref.WeakKeyDictionary()
+        self._init_lock = threading.Lock()
         
-        # Initialize LangChain Sequential Chain (lazy initialization)
-        self.sequential_chain = None
-        self._langchain_initialized = False
-        self._initialization_lock = False
+        # Single-flight table: key -> (future, expires_at or None while running)
+        self._inflight: Dict[bytes, Tuple[Future, Optional[float]]] = {}
+        self._inflight_lock = threading.Lock()
+    
+    @staticmethod
+    def _current_loop_key():
+        """Return the running event loop, or a shared key when there is none"""
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return _NO_LOOP
+    
+    @property
+    def sequential_chain(self) -> Optional[SequentialChain]:
+        """SequentialChain for the current event loop, if initialized"""
+        return self._chains_by_loop.get(self._current_loop_key())
+    
+    @sequential_chain.setter
+    def sequential_chain(self, chain: Optional[SequentialChain]) -> None:
+        loop_key = self._current_loop_key()
+        if chain is None:
+            self._chains_by_loop.pop(loop_key, None)
+        else:
+            self._chains_by_loop[loop_key] = chain
     
     def _ensure_langchain_initialized(self, app_state, max_retries: int = 3) -> bool:
         """
         Ensure LangChain is initialized with proper configuration (lazy initialization with retry)
         
+        Configuration is validated once and chain construction is retried at
+        most once, immediately. Construction is CPU-only and deterministic,
+        and every other request waits on the lock held here, so sleeping
+        between attempts would only stall them.
+        
         Args:
             app_state: Application state with configuration
-            max_retries: Maximum number of retry attempts
+            max_retries: Maximum number of retry attempts (capped at 1)
             
         Returns:
             bool: True if initialization successful, False otherwise
         """
-        # Prevent concurrent initialization
-        if self._initialization_lock:
-            return self.sequential_chain is not None
+        loop_key = self._current_loop_key()
+        
+        # Fast path: no locking once initialized for this loop
+        if loop_key in self._chains_by_loop:
+            return True
+        
+        with self._init_lock:
+            # Another thread may have finished while we waited
+            if loop_key in self._chains_by_loop:
+                return True
+            
+            chain_config = self._build_chain_config(app_state)
+            if chain_config is None:
+                return False
+            
+            started = time.perf_counter()
+            attempts_info: List[Tuple[int, str]] = []
+            for attempt in range(min(max_retries, 1) + 1):
+                chain = self._try_create_chain(chain_config, attempt, attempts_info)
+                if chain is not None:
+                    # Publish only the fully built chain to the fast path
+                    self._chains_by_loop[loop_key] = chain
+                    self._log_init_outcome(attempts_info, started, succeeded=True)
+                    return True
             
-        if self._langchain_initialized and self.sequential_chain is not None:
+            self._log_init_outcome(attempts_info, started, succeeded=False)
+        return False
+    
+    async def _ensure_langchain_initialized_async(self, app_state, max_retries: int = 3) -> bool:
+        """
+        Async variant of _ensure_langchain_initialized for event-loop callers
+        
+        Backoff between construction attempts uses asyncio.sleep so the
+        event loop is never blocked.
+        
+        Args:
+            app_state: Application state with configuration
+            max_retries: Maximum number of retry attempts
+            
+        Returns:
+            bool: True if initialization successful, False otherwise
+        """
+        loop_key = self._current_loop_key()
+        if loop_key in self._chains_by_loop:
             return True
+        
+        chain_config = self._build_chain_config(app_state)
+        if chain_config is None:
+            return False
+        
+        started = time.perf_counter()
+        attempts_info: List[Tuple[int, str]] = []
+        for attempt in range(max_retries + 1):
+            if attempt > 0:
+                await asyncio.sleep(self._init_backoff(attempt))
+            
+            chain = self._try_create_chain(chain_config, attempt, attempts_info)
+            if chain is not None:
+                with self._init_lock:
+                    # Keep the first chain if a concurrent task won the race
+                    self._chains_by_loop.setdefault(loop_key, chain)
+                self._log_init_outcome(attempts_info, started, succeeded=True)
+                return True
+        
+        self._log_init_outcome(attempts_info, started, succeeded=False)
+        return False
+    
+    @staticmethod
+    def _init_backoff(attempt: int) -> float:
+        """Exponential backoff before a construction retry, max 5 seconds"""
+        return min(2 ** (attempt - 1), 5)
+    
+    def _build_chain_config(self, app_state) -> Optional[ChainConfig]:
+        """
+        Validate configuration and build the chain config
+        
+        Validation is purely local, so it is not retried: the same inputs
+        would fail again.
+        
+        Args:
+            app_state: Application state with configuration
             
+        Returns:
+            Optional[ChainConfig]: Chain config, or None if configuration is invalid
+        """
         try:
-            self._initialization_lock = True
-            
-            # Retry logic with exponential backoff
-            for attempt in range(max_retries + 1):
-                if attempt > 0:
-                    import time
-                    wait_time = min(2 ** (attempt - 1), 5)  # Exponential backoff, max 5 seconds
-                    time.sleep(wait_time)
-                
-                try:
-                    # Validate app_state and configuration
-                    if not self._validate_app_state_for_langchain(app_state):
-                        if attempt == max_retries:
-                            self.logger.error("[LANGCHAIN_INIT] App state validation failed after all retries")
-                            return False
-                        continue
-                        
-                    # Create LLM config from app_state
-                    llm_config = LLMConfig.from_app_state(app_state)
-                    
-                    # Validate LLM configuration before proceeding
-                    if not self._validate_llm_config(llm_config):
-                        if attempt == max_retries:
-                            self.logger.error("[LANGCHAIN_INIT] LLM config validation failed after all retries")
-                            return False
-                        continue
-                        
-                    chain_config = ChainConfig(llm_config=llm_config)
-                    self.sequential_chain = SequentialChain(chain_config)
-                    self._langchain_initialized = True
-                    
-                    return True
-                    
-                except Exception as e:
-                    if attempt == max_retries:
-                        self.logger.error(f"[LANGCHAIN_INIT] ❌ Failed to initialize LangChain after {max_retries} retries: {e}")
-                        self.sequential_chain = None
-                        self._langchain_initialized = False
-                        return False
-                    else:
-                        self.logger.warning(f"[LANGCHAIN_INIT] Attempt {attempt + 1} failed: {e}")
-                        
+            if not self._validate_app_state_for_langchain(app_state):
+                self.logger.error("[LANGCHAIN_INIT] App state validation failed")
+                return None
+            
+            # Create LLM config from app_state
+            llm_config = LLMConfig.from_app_state(app_state)
+            
+            if not self._validate_llm_config(llm_config):
+                self.logger.error("[LANGCHAIN_INIT] LLM config validation failed")
+                return None
+            
+            return ChainConfig(
+                llm_config=llm_config,
+                execution_config=ExecutionConfig.from_app_state(app_state),
+                enable_semantic_cache=app_state.config.get('ai', {}).get('semantic_cache', False)
+            )
+            
         except Exception as e:
-            self.logger.error(f"[LANGCHAIN_INIT] ❌ Critical error during initialization: {e}")
-            self.sequential_chain = None
-            self._langchain_initialized = False
-            return False
-        finally:
-            self._initialization_lock = False
+            self.logger.error("[LANGCHAIN_INIT] ❌ Critical error during initialization: %s", e)
+            return None
+    
+    @staticmethod
+    def _try_create_chain(
+        chain_config: ChainConfig, attempt: int, attempts_info: List[Tuple[int, str]]
+    ) -> Optional[SequentialChain]:
+        """
+        Make one attempt at constructing the SequentialChain
+        
+        Failures are recorded in attempts_info rather than logged, so an
+        initialization emits a single log record however many attempts it takes.
+        
+        Args:
+            chain_config: Validated chain configuration
+            attempt: Zero-based attempt number
+            attempts_info: (attempt number, error) pairs for failed attempts
             
-        return False
+        Returns:
+            Optional[SequentialChain]: The chain, or None if this attempt failed
+        """
+        try:
+            return SequentialChain(chain_config)
+        except Exception as e:
+            attempts_info.append((attempt + 1, str(e)))
+            return None
+    
+    def _log_init_outcome(
+        self, attempts_info: List[Tuple[int, str]], started: float, succeeded: bool
+    ) -> None:
+        """
+        Emit the single structured record summarizing chain construction
+        
+        Args:
+            attempts_info: (attempt number, error) pairs for failed attempts
+            started: time.perf_counter() value before the first attempt
+            succeeded: Whether a chain was eventually built
+        """
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        extra = {'attempts': attempts_info, 'elapsed_ms': elapsed_ms}
+        if succeeded:
+            self.logger.debug(
+                "[LANGCHAIN_INIT] Chain initialized after %d attempt(s) in %.1fms",
+                len(attempts_info) + 1, elapsed_ms, extra=extra
+            )
+        else:
+            self.logger.error(
+                "[LANGCHAIN_INIT] ❌ Failed to initialize LangChain after %d attempt(s) in %.1fms: %s",
+                len(attempts_info), elapsed_ms, attempts_info[-1][1], extra=extra
+            )
     
     def _validate_app_state_for_langchain(self, app_state) -> bool:
         """
@@ -269,53 +546,66 @@ class ChatHandler:
             ChatHandlerError: For critical processing errors
         """
         start_time = time.time()
-        self.processing_stats['total_requests'] += 1
         
+        # total_requests is counted together with the outcome counter of
+        # whichever branch the request takes
         try:
-            # Step 1: Validate inputs
-            self._validate_inputs(app_state, user_query)
-            
-            # Step 2: Build user context and check if analytics query
-            user_context_result = self._build_user_context(user_query)
+            final_prompt, user_context_result, _ = self._prepare_prompt(app_state, user_query)
             
-            # Step 3: Handle non-analytics queries directly
-            if not user_context_result['is_analytics']:
-                self.processing_stats['non_analytics_requests'] += 1
-                response = self._handle_non_analytics_query(
+            # Handle non-analytics queries directly
+            if final_prompt is None:
+                self.processing_stats.update(('total_requests', 'non_analytics_requests'))
+                return self._handle_non_analytics_query(
                     user_query, 
                     user_context_result['reason']
                 )
-                
-                processing_time = time.time() - start_time
-                return response
-            
-            # Step 4: Process analytics query - build all contexts
-            self.processing_stats['analytics_requests'] += 1
             
-            # Build system context
-            system_context = self._build_system_context()
-            
-            # Build tool context
-            tool_context = self._build_tool_context(app_state)
-            
-            # Step 5: Construct final prompt
-            final_prompt = self._construct_final_prompt(
-                system_context, 
-                tool_context, 
-                user_context_result
-            )
-            
-            processing_time = time.time() - start_time
+            self.processing_stats.update(('total_requests', 'analytics_requests'))
             return final_prompt
             
         except Exception as e:
-            self.processing_stats['errors'] += 1
+            self.processing_stats.update(('total_requests', 'errors'))
             processing_time = time.time() - start_time
-            self.logger.error(f"[CHAT_HANDLER_ERROR] Failed after {processing_time:.3f}s: {e}")
+            self.logger.error("[CHAT_HANDLER_ERROR] Failed after %.3fs: %s", processing_time, e)
             
             # Return fallback response for critical errors
             return self._get_fallback_response(str(e))
     
+    def _prepare_prompt(
+        self, app_state, user_query: str
+    ) -> Tuple[Optional[str], Dict[str, Any], Optional[str]]:
+        """
+        Validate the query, classify it and build the final prompt
+        
+        Shared by process_chat_request and process_with_langchain so both
+        paths build prompts (and hit the context caches) identically.
+        
+        Args:
+            app_state: Application state with database connections
+            user_query: Natural language query from user
+            
+        Returns:
+            Tuple of (final_prompt, user_context_result, tool_context);
+            final_prompt and tool_context are None for non-analytics queries
+            
+        Raises:
+            ChatHandlerError: If validation or context building fails
+        """
+        self._validate_inputs(app_state, user_query)
+        
+        user_context_result = self._build_user_context(user_query)
+        if not user_context_result['is_analytics']:
+            return None, user_context_result, None
+        
+        system_context = self._build_system_context()
+        tool_context = self._build_tool_context(app_state)
+        final_prompt = self._construct_final_prompt(
+            system_context, 
+            tool_context, 
+            user_context_result
+        )
+        return final_prompt, user_context_result, tool_context
+    
     def _validate_inputs(self, app_state, user_query: str) -> None:
         """
         Validate inputs before processing
@@ -330,7 +620,8 @@ class ChatHandler:
         if app_state is None:
             raise ValidationError("app_state cannot be None")
         
-        if not user_query or not user_query.strip():
+        stripped = user_query.strip() if user_query else ""
+        if not stripped:
             raise ValidationError("user_query cannot be empty")
         
         # Check if app_state has required methods
@@ -338,7 +629,7 @@ class ChatHandler:
             raise ValidationError("app_state missing get_mysql_connection method")
         
         # Validate query length (reasonable limits)
-        if len(user_query.strip()) < 2:
+        if len(stripped) < 2:
             raise ValidationError("user_query too short")
         
         if len(user_query) > 10000:
@@ -363,7 +654,7 @@ class ChatHandler:
             self.logger.debug("[USER_CONTEXT_START] Building user context")
             
             # Check if query is analytics-related
-            is_analytics, reason = is_analytics_related_query(user_query)
+            is_analytics, reason = _classify_cached(user_query.strip().lower())
             
             result = {
                 'is_analytics': is_analytics,
@@ -378,12 +669,12 @@ class ChatHandler:
                 result['context'] = context
                 self.logger.debug("[USER_CONTEXT_SUCCESS] Analytics context built")
             else:
-                self.logger.debug(f"[USER_CONTEXT_SUCCESS] Non-analytics query detected: {reason}")
+                self.logger.debug("[USER_CONTEXT_SUCCESS] Non-analytics query detected: %s", reason)
             
             return result
             
         except Exception as e:
-            self.logger.error(f"[USER_CONTEXT_ERROR] Failed to build user context: {e}")
+            self.logger.error("[USER_CONTEXT_ERROR] Failed to build user context: %s", e)
             raise ContextBuildError(f"User context building failed: {e}")
     
     def _build_system_context(self) -> str:
@@ -418,7 +709,7 @@ class ChatHandler:
             return system_context
             
         except Exception as e:
-            self.logger.error(f"[SYSTEM_CONTEXT_ERROR] Failed to build system context: {e}")
+            self.logger.error("[SYSTEM_CONTEXT_ERROR] Failed to build system context: %s", e)
             raise ContextBuildError(f"System context building failed: {e}")
     
     def _build_tool_context(self, app_state) -> str:
@@ -454,16 +745,20 @@ class ChatHandler:
                     raise SchemaFetchError("Failed to fetch schema from database: get_schema returned None")
                 
                 # Check if schema has errors - look for explicit error keys only
-                if any(isinstance(v, dict) and 'error' in v for v in schema_info.values()):
-                    error_details = [f"{k}: {v['error']}" for k, v in schema_info.items() if isinstance(v, dict) and 'error' in v]
+                error_details = [f"{k}: {v['error']}" for k, v in schema_info.items() if isinstance(v, dict) and 'error' in v]
+                if error_details:
                     raise SchemaFetchError(f"Schema fetch failed with errors: {'; '.join(error_details)}")
                 
                 # Cache the successful result
                 self.cache.set_schema(schema_info)
                 self.logger.debug("[TOOL_CONTEXT_SUCCESS] Schema fetched and cached")
             
-            # Format schema information for prompt
-            tool_context = self._format_schema_for_prompt(schema_info)
+            # Format schema information for prompt, reusing the text derived
+            # from this same schema object when available
+            tool_context = self.cache.get_formatted_schema(schema_info)
+            if tool_context is None:
+                tool_context = self._format_schema_for_prompt(schema_info)
+                self.cache.set_formatted_schema(schema_info, tool_context)
             
             return tool_context
             
@@ -471,7 +766,7 @@ class ChatHandler:
             # Re-raise SchemaFetchError as-is
             raise
         except Exception as e:
-            self.logger.error(f"[TOOL_CONTEXT_ERROR] Failed to build tool context: {e}")
+            self.logger.error("[TOOL_CONTEXT_ERROR] Failed to build tool context: %s", e)
             
             # Try to use cached schema as fallback
             cached_schema = self.cache.get_schema()
@@ -498,49 +793,8 @@ class ChatHandler:
         if not schema_info:
             raise SchemaFetchError("Cannot format schema for prompt: schema_info is empty")
         
-        context_parts = [
-            "## DATABASE SCHEMA INFORMATION",
-            ""
-        ]
-        
-        # Process each table
-        for table_name, table_info in schema_info.items():
-            if isinstance(table_info, dict) and 'columns' in table_info:
-                context_parts.append(f"### {table_name.upper()} TABLE:")
-                context_parts.append("")
-                
-                # Add columns
-                if table_info['columns']:
-                    context_parts.append("**Columns:**")
-                    for col in table_info['columns']:
-                        nullable = "NULL" if col.get('nullable') == 'YES' else "NOT NULL"
-                        key_info = f" ({col.get('key')})" if col.get('key') else ""
-                        context_parts.append(f"- {col['name']}: {col['data_type']} {nullable}{key_info}")
-                    context_parts.append("")
-                
-                # Add indexes
-                if table_info.get('indexes'):
-                    context_parts.append("**Indexes:**")
-                    for idx in table_info['indexes']:
-                        unique = "UNIQUE " if idx.get('unique') else ""
-                        columns = ", ".join(idx.get('columns', []))
-                        context_parts.append(f"- {unique}INDEX {idx['name']} ({columns})")
-                    context_parts.append("")
-                
-                # Add foreign keys
-                if table_info.get('foreign_keys'):
-                    context_parts.append("**Foreign Keys:**")
-                    for fk in table_info['foreign_keys']:
-                        context_parts.append(
-                            f"- {fk['column']} → {fk['referenced_table']}.{fk['referenced_column']}"
-                        )
-                    context_parts.append("")
-            
-            elif isinstance(table_info, dict) and 'error' in table_info:
-                context_parts.append(f"### {table_name.upper()} TABLE: Error - {table_info['error']}")
-                context_parts.append("")
-        
-        return "\n".join(context_parts)
+        blocks = (_render_table(name, info) for name, info in schema_info.items())
+        return "\n".join(["## DATABASE SCHEMA INFORMATION", "", *filter(None, blocks)])
     
     
     def _construct_final_prompt(self, system_ctx: str, tool_ctx: str, user_ctx: Dict[str, Any]) -> str:
@@ -558,25 +812,17 @@ class ChatHandler:
         try:
             self.logger.debug("[PROMPT_CONSTRUCTION_START] Assembling final prompt")
             
-            prompt_parts = [
-                "[SYSTEM CONTEXT]",
+            final_prompt = _PROMPT_TEMPLATE % (
                 system_ctx,
-                "",
-                "[TOOL CONTEXT]",
                 tool_ctx,
-                "",
-                "[USER CONTEXT]",
-                user_ctx['context'] if user_ctx['context'] else f"User Query: {user_ctx['query']}",
-                ""
-            ]
-            
-            final_prompt = "\n".join(prompt_parts)
+                user_ctx['context'] or f"User Query: {user_ctx['query']}"
+            )
             
-            self.logger.debug(f"[PROMPT_CONSTRUCTION_SUCCESS] Final prompt constructed ({len(final_prompt)} chars)")
+            self.logger.debug("[PROMPT_CONSTRUCTION_SUCCESS] Final prompt constructed (%d chars)", len(final_prompt))
             return final_prompt
             
         except Exception as e:
-            self.logger.error(f"[PROMPT_CONSTRUCTION_ERROR] Failed to construct prompt: {e}")
+            self.logger.error("[PROMPT_CONSTRUCTION_ERROR] Failed to construct prompt: %s", e)
             raise ContextBuildError(f"Prompt construction failed: {e}")
     
     def _handle_non_analytics_query(self, user_query: str, reason: str) -> str:
@@ -591,7 +837,7 @@ class ChatHandler:
             str: Direct response for non-analytics query
         """
         try:
-            self.logger.debug(f"[NON_ANALYTICS_HANDLER] Processing query with reason: {reason}")
+            self.logger.debug("[NON_ANALYTICS_HANDLER] Processing query with reason: %s", reason)
             
             # Use the existing direct handler from user_prompts
             result = handle_non_analytics_query_direct(user_query, reason, self.logger)
@@ -599,10 +845,10 @@ class ChatHandler:
             return result.get('response', 'I can help you with payment analytics. Please ask a question about your payment data.')
             
         except Exception as e:
-            self.logger.error(f"[NON_ANALYTICS_HANDLER_ERROR] Failed to handle non-analytics query: {e}")
+            self.logger.error("[NON_ANALYTICS_HANDLER_ERROR] Failed to handle non-analytics query: %s", e)
             return "I'm here to help with payment analytics. Please ask a question about your payment data."
     
-    def process_with_langchain(self, app_state, user_query: str, session_id: str = "") -> 'DataSummaryResult':
+    def process_with_langchain(self, app_state, user_query: str, session_id: str = "") -> DataSummaryResult:
         """
         Process analytics query using LangChain Sequential Chain
         
@@ -623,54 +869,29 @@ class ChatHandler:
                 self.logger.error("[LANGCHAIN_HANDLER] Failed to initialize LangChain Sequential Chain")
                 return self._get_fallback_response("LangChain integration not available - configuration error")
             
-            # Step 1: Validate inputs
-            self._validate_inputs(app_state, user_query)
-            
-            # Step 2: Build user context and check if analytics query
-            user_context_result = self._build_user_context(user_query)
+            final_prompt, user_context_result, tool_context = self._prepare_prompt(app_state, user_query)
             
-            # Step 3: Handle non-analytics queries directly
-            if not user_context_result['is_analytics']:
+            # Handle non-analytics queries directly
+            if final_prompt is None:
                 self.processing_stats['non_analytics_requests'] += 1
                 response_text = self._handle_non_analytics_query(
                     user_query, 
                     user_context_result['reason']
                 )
                 
-                # Create DataSummaryResult for non-analytics response
-                from langchain_integration.models.response_models import DataSummaryResult
-                non_analytics_result = DataSummaryResult(
-                    success=True,
-                    summary=response_text,
-                    html_summary=f"<p>{response_text}</p>",
-                    markdown_data="No data table available for non-analytics queries",
-                    key_insights=["Non-analytics query handled directly"],
-                    data_points_analyzed=0,
-                    summary_time_ms=(time.time() - start_time) * 1000,
-                    prompt_tokens=0,
-                    completion_tokens=0
+                return self._non_analytics_result(response_text, start_time)
+            
+            # Process through LangChain Sequential Chain; identical
+            # queries against the same schema share one in-flight run
+            key = self._single_flight_key(user_query, tool_context)
+            chain_result = self._run_single_flight(
+                key,
+                lambda: self.sequential_chain.process(
+                    final_prompt=final_prompt,
+                    app_state=app_state,
+                    user_query=user_query,
+                    session_id=session_id
                 )
-                
-                processing_time = time.time() - start_time
-                return non_analytics_result
-            
-            # Step 4: Build contexts for LangChain processing
-            system_context = self._build_system_context()
-            tool_context = self._build_tool_context(app_state)
-            
-            # Step 5: Construct final prompt
-            final_prompt = self._construct_final_prompt(
-                system_context, 
-                tool_context, 
-                user_context_result
-            )
-            
-            # Step 6: Process through LangChain Sequential Chain
-            chain_result = self.sequential_chain.process(
-                final_prompt=final_prompt,
-                app_state=app_state,
-                user_query=user_query,
-                session_id=session_id
             )
             
             processing_time = time.time() - start_time
@@ -679,20 +900,320 @@ class ChatHandler:
                 return chain_result.final_response
             else:
                 self.logger.error(
-                    f"[LANGCHAIN_HANDLER] Sequential chain failed in {processing_time:.3f}s - "
-                    f"Type: {chain_result.response_type}, Error: {chain_result.final_response}"
+                    "[LANGCHAIN_HANDLER] Sequential chain failed in %.3fs - Type: %s, Error: %s",
+                    processing_time, chain_result.response_type, chain_result.final_response
                 )
                 return chain_result.final_response
                 
         except Exception as e:
             self.processing_stats['errors'] += 1
             processing_time = time.time() - start_time
-            self.logger.error(f"[LANGCHAIN_HANDLER] Failed after {processing_time:.3f}s: {e}")
+            self.logger.error("[LANGCHAIN_HANDLER] Failed after %.3fs: %s", processing_time, e)
             
             # Return fallback response for critical errors
             return self._get_fallback_response(str(e))
     
-    def _get_fallback_response(self, error_msg: str) -> 'DataSummaryResult':
+    async def aprocess_with_langchain(self, app_state, user_query: str, session_id: str = "") -> DataSummaryResult:
+        """
+        Async variant of process_with_langchain for event-loop callers
+        
+        Args:
+            app_state: Application state with database connections
+            user_query: Natural language query from user
+            session_id: Session ID for tracking
+            
+        Returns:
+            DataSummaryResult: Final response object with html_summary, markdown_data, etc.
+        """
+        start_time = time.time()
+        self.processing_stats['langchain_requests'] += 1
+        
+        try:
+            if not await self._ensure_langchain_initialized_async(app_state):
+                self.logger.error("[LANGCHAIN_HANDLER] Failed to initialize LangChain Sequential Chain")
+                return self._get_fallback_response("LangChain integration not available - configuration error")
+            
+            final_prompt, user_context_result, tool_context = self._prepare_prompt(app_state, user_query)
+            
+            if final_prompt is None:
+                self.processing_stats['non_analytics_requests'] += 1
+                response_text = self._handle_non_analytics_query(
+                    user_query, 
+                    user_context_result['reason']
+                )
+                
+                return self._non_analytics_result(response_text, start_time)
+            
+            chain = self.sequential_chain
+            key = self._single_flight_key(user_query, tool_context)
+            chain_result = await self._arun_single_flight(
+                key,
+                lambda: chain.aprocess(
+                    final_prompt=final_prompt,
+                    app_state=app_state,
+                    user_query=user_query,
+                    session_id=session_id
+                )
+            )
+            
+            if not chain_result.success:
+                self.logger.error(
+                    "[LANGCHAIN_HANDLER] Sequential chain failed in %.3fs - Type: %s, Error: %s",
+                    time.time() - start_time, chain_result.response_type, chain_result.final_response
+                )
+            return chain_result.final_response
+                
+        except Exception as e:
+            self.processing_stats['errors'] += 1
+            self.logger.error("[LANGCHAIN_HANDLER] Failed after %.3fs: %s", time.time() - start_time, e)
+            
+            return self._get_fallback_response(str(e))
+    
+    @staticmethod
+    def _single_flight_key(user_query: str, tool_context: str) -> bytes:
+        """
+        Build the single-flight key for an analytics query
+        
+        Queries are normalized (lowercased, whitespace collapsed, trailing
+        punctuation stripped) and combined with the tool context so a schema
+        change never reuses an older result.
+        
+        Args:
+            user_query: Natural language query from user
+            tool_context: Formatted schema context the prompt was built with
+            
+        Returns:
+            bytes: Digest identifying the query/schema pair
+        """
+        normalized = " ".join(user_query.lower().split()).rstrip("?!. ")
+        digest = hashlib.blake2b(normalized.encode(), digest_size=16)
+        digest.update(b"\0")
+        digest.update(tool_context.encode())
+        return digest.digest()
+    
+    def _run_single_flight(self, key: bytes, compute):
+        """
+        Run compute() once for concurrent callers sharing the same key
+        
+        The first caller runs compute(); callers arriving while it runs, or
+        within SINGLE_FLIGHT_TTL seconds after a successful run, receive the
+        same result. Failed results and exceptions are never retained.
+        
+        Args:
+            key: Single-flight key from _single_flight_key
+            compute: Zero-argument callable returning a SequentialChainResult
+            
+        Returns:
+            The SequentialChainResult shared by all callers for this key
+        """
+        future, owner = self._claim_single_flight(key)
+        if not owner:
+            return future.result()
+        
+        try:
+            result = compute()
+        except BaseException as e:
+            self._abandon_single_flight(key, future, e)
+            raise
+        
+        self._settle_single_flight(key, future, result)
+        return result
+    
+    async def _arun_single_flight(self, key: bytes, acompute):
+        """
+        Async variant of _run_single_flight
+        
+        Shares the same table, so sync and async callers coalesce with each
+        other; waiters await the owner's future instead of blocking.
+        
+        Args:
+            key: Single-flight key from _single_flight_key
+            acompute: Zero-argument callable returning an awaitable SequentialChainResult
+            
+        Returns:
+            The SequentialChainResult shared by all callers for this key
+        """
+        future, owner = self._claim_single_flight(key)
+        if not owner:
+            return await asyncio.wrap_future(future)
+        
+        try:
+            result = await acompute()
+        except BaseException as e:
+            self._abandon_single_flight(key, future, e)
+            raise
+        
+        self._settle_single_flight(key, future, result)
+        return result
+    
+    def _claim_single_flight(self, key: bytes) -> Tuple[Future, bool]:
+        """
+        Join a live single-flight entry or register a new one
+        
+        Args:
+            key: Single-flight key from _single_flight_key
+            
+        Returns:
+            Tuple of (future, True if the caller must compute the result)
+        """
+        now = time.monotonic()
+        with self._inflight_lock:
+            entry = self._inflight.get(key)
+            if entry is not None and (entry[1] is None or now < entry[1]):
+                return entry[0], False
+            
+            # Drop finished entries that have outlived their TTL
+            expired = [k for k, (_, expires) in self._inflight.items() if expires is not None and expires <= now]
+            for expired_key in expired:
+                del self._inflight[expired_key]
+            future = Future()
+            self._inflight[key] = (future, None)
+        return future, True
+    
+    def _settle_single_flight(self, key: bytes, future: Future, result) -> None:
+        """Publish the owner's result, keeping it for SINGLE_FLIGHT_TTL only on success"""
+        with self._inflight_lock:
+            if getattr(result, 'success', False):
+                self._inflight[key] = (future, time.monotonic() + self.SINGLE_FLIGHT_TTL)
+            else:
+                self._inflight.pop(key, None)
+        future.set_result(result)
+    
+    def _abandon_single_flight(self, key: bytes, future: Future, error: BaseException) -> None:
+        """Propagate the owner's exception to waiters and forget the entry"""
+        with self._inflight_lock:
+            self._inflight.pop(key, None)
+        future.set_exception(error)
+    
+    def process_batch_with_langchain(
+        self, app_state, user_queries: List[str], session_ids: Optional[List[str]] = None
+    ) -> List[DataSummaryResult]:
+        """
+        Process several queries, sharing one LLM call per batch of analytics queries
+        
+        System and tool contexts are built once. Non-analytics queries are
+        answered directly; analytics queries are grouped into batches of at
+        most MAX_BATCH_SIZE whose SQL is generated by a single LLM call.
+        
+        Args:
+            app_state: Application state with database connections
+            user_queries: Natural language queries from users
+            session_ids: Session IDs matching user_queries
+            
+        Returns:
+            List[DataSummaryResult]: One response object per query, in input order
+        """
+        start_time = time.time()
+        session_ids = session_ids or [""] * len(user_queries)
+        results: List[Optional[DataSummaryResult]] = [None] * len(user_queries)
+        self.processing_stats['langchain_requests'] += len(user_queries)
+        
+        if not self._ensure_langchain_initialized(app_state):
+            self.logger.error("[LANGCHAIN_HANDLER] Failed to initialize LangChain Sequential Chain")
+            return [
+                self._get_fallback_response("LangChain integration not available - configuration error")
+                for _ in user_queries
+            ]
+        
+        # Classify locally; only analytics queries go to the LLM
+        analytics_indices = []
+        for index, user_query in enumerate(user_queries):
+            try:
+                self._validate_inputs(app_state, user_query)
+                user_context_result = self._build_user_context(user_query)
+            except Exception as e:
+                self.processing_stats['errors'] += 1
+                results[index] = self._get_fallback_response(str(e))
+                continue
+            
+            if user_context_result['is_analytics']:
+                analytics_indices.append(index)
+            else:
+                self.processing_stats['non_analytics_requests'] += 1
+                response_text = self._handle_non_analytics_query(
+                    user_query,
+                    user_context_result['reason']
+                )
+                results[index] = self._non_analytics_result(response_text, start_time)
+        
+        if analytics_indices:
+            try:
+                system_context = self._build_system_context()
+                tool_context = self._build_tool_context(app_state)
+                
+                for offset in range(0, len(analytics_indices), self.MAX_BATCH_SIZE):
+                    batch = analytics_indices[offset:offset + self.MAX_BATCH_SIZE]
+                    batch_queries = [user_queries[i] for i in batch]
+                    
+                    final_prompt = self._construct_batch_prompt(
+                        system_context, tool_context, batch_queries
+                    )
+                    chain_results = self.sequential_chain.process_batch(
+                        final_prompt=final_prompt,
+                        app_state=app_state,
+                        user_queries=batch_queries,
+                        session_ids=[session_ids[i] for i in batch]
+                    )
+                    
+                    for index, chain_result in zip(batch, chain_results):
+                        if not chain_result.success:
+                            self.logger.error(
+                                "[LANGCHAIN_HANDLER] Batched query %s failed - Type: %s, Error: %s",
+                                index, chain_result.response_type, chain_result.final_response
+                            )
+                        results[index] = chain_result.final_response
+                
+            except Exception as e:
+                self.processing_stats['errors'] += 1
+                self.logger.error("[LANGCHAIN_HANDLER] Batch failed after %.3fs: %s", time.time() - start_time, e)
+                for index in analytics_indices:
+                    if results[index] is None:
+                        results[index] = self._get_fallback_response(str(e))
+        
+        return results
+    
+    def _construct_batch_prompt(self, system_ctx: str, tool_ctx: str, user_queries: List[str]) -> str:
+        """
+        Construct a [system][Tool][User] prompt covering several queries
+        
+        Args:
+            system_ctx: System context string
+            tool_ctx: Tool context string
+            user_queries: Analytics queries, tagged Q[1]..Q[n] in the prompt
+            
+        Returns:
+            str: Complete formatted batch prompt string
+        """
+        return self._construct_final_prompt(
+            system_ctx,
+            tool_ctx,
+            {'context': build_batch_user_context(user_queries), 'query': None}
+        )
+    
+    def _non_analytics_result(self, response_text: str, start_time: float) -> DataSummaryResult:
+        """
+        Wrap a direct non-analytics response in a DataSummaryResult
+        
+        Args:
+            response_text: Direct response text
+            start_time: time.time() at which processing began
+            
+        Returns:
+            DataSummaryResult: Response object for the non-analytics query
+        """
+        return DataSummaryResult(
+            success=True,
+            summary=response_text,
+            html_summary=_WRAP_P % response_text,
+            markdown_data=_NON_ANALYTICS_MARKDOWN,
+            key_insights=list(_NON_ANALYTICS_INSIGHTS),
+            data_points_analyzed=0,
+            summary_time_ms=(time.time() - start_time) * 1000,
+            prompt_tokens=0,
+            completion_tokens=0
+        )
+    
+    def _get_fallback_response(self, error_msg: str) -> DataSummaryResult:
         """
         Get fallback response for critical errors
         
@@ -702,28 +1223,12 @@ class ChatHandler:
         Returns:
             DataSummaryResult: Fallback response object
         """
-        from langchain_integration.models.response_models import DataSummaryResult
-        
-        fallback_text = f"""I apologize, but I encountered an error while processing your request. 
-
-Error: {error_msg}
-
-Please try rephrasing your question or contact support if the issue persists.
-
-I can help you with:
-• Payment analytics and reporting
-• Transaction summaries and trends
-• Revenue analysis
-• Success/failure rate analysis
-
-What payment data would you like to explore?"""
-
         return DataSummaryResult(
             success=False,
             error=error_msg,
-            summary=fallback_text,
-            html_summary=f"<p><strong>Error:</strong> {error_msg}</p><p>Please try rephrasing your question or contact support if the issue persists.</p>",
-            markdown_data="No data available due to error",
+            summary=_FALLBACK_TEXT % error_msg,
+            html_summary=_FALLBACK_HTML % escape(error_msg, quote=False),
+            markdown_data=_FALLBACK_MARKDOWN,
             key_insights=[f"Error occurred: {error_msg}"],
             data_points_analyzed=0,
             summary_time_ms=0.0,
@@ -739,7 +1244,7 @@ What payment data would you like to explore?"""
             Dict containing processing statistics
         """
         return {
-            'processing_stats': self.processing_stats.copy(),
+            'processing_stats': dict(self.processing_stats),
             'cache_stats': {
                 'schema_cache_size': len(self.cache.schema_cache),
                 'system_context_cached': self.cache.system_context_cache is not None,
@@ -750,6 +1255,49 @@ What payment data would you like to explore?"""
     def clear_cache(self) -> None:
         """Clear all caches"""
         self.cache.clear_cache()
+        _classify_cached.cache_clear()
+
+
+# Shared handler so caches, stats and the lazily built chain survive
+# across requests; used when no app_state is given
+_HANDLER = ChatHandler()
+
+# id(app_state) -> (app_state, handler). The app_state is kept so a recycled
+# id can never hand out another state's handler (and its schema cache).
+_handler_cache: Dict[int, Tuple[Any, ChatHandler]] = {}
+_handler_cache_lock = threading.Lock()
+
+
+def get_chat_handler(app_state=None) -> ChatHandler:
+    """
+    Get the shared ChatHandler for an application state
+    
+    The handler for a given app_state is created once; later calls are a
+    dict lookup. LangChain is initialized lazily by the handler itself on
+    its first analytics request, so prompt-only callers never pay for it.
+    
+    Args:
+        app_state: Application state the handler serves, or None for the
+            process-wide default handler
+    
+    Returns:
+        ChatHandler: Handler reused across requests for this app_state
+    """
+    if app_state is None:
+        return _HANDLER
+    
+    entry = _handler_cache.get(id(app_state))
+    if entry is not None and entry[0] is app_state:
+        return entry[1]
+    
+    with _handler_cache_lock:
+        entry = _handler_cache.get(id(app_state))
+        if entry is not None and entry[0] is app_state:
+            return entry[1]
+        
+        handler = ChatHandler()
+        _handler_cache[id(app_state)] = (app_state, handler)
+        return handler
 
 
 # Convenience functions for easy integration
@@ -764,11 +1312,10 @@ def process_chat_request(app_state, user_query: str) -> str:
     Returns:
         str: Constructed prompt or direct response
     """
-    handler = ChatHandler()
-    return handler.process_chat_request(app_state, user_query)
+    return get_chat_handler(app_state).process_chat_request(app_state, user_query)
 
 
-def process_chat_request_with_langchain(app_state, user_query: str, session_id: str = "") -> 'DataSummaryResult':
+def process_chat_request_with_langchain(app_state, user_query: str, session_id: str = "") -> DataSummaryResult:
     """
     Convenience function to process chat request with LangChain Sequential Chain
     
@@ -780,7 +1327,4 @@ def process_chat_request_with_langchain(app_state, user_query: str, session_id:
     Returns:
         DataSummaryResult: Final response object with html_summary, markdown_data, etc.
     """
-    handler = ChatHandler()
-    # Re-initialize LangChain with app_state configuration
-    handler._initialize_langchain(app_state)
-    return handler.process_with_langchain(app_state, user_query, session_id)
+    return get_chat_handler(app_state).process_with_langchain(app_state, user_query, session_id)
@@ -1,68 +1,146 @@
+import logging
 import os
-from dotenv import load_dotenv
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
+
+logger = logging.getLogger(__name__)
+
+_dotenv_loaded = False
+
+# (section, field) pairs that must be present and non-empty
+_REQUIRED_FIELDS = (
+    ("mysql", "host"),
+    ("mysql", "user"),
+    ("mysql", "password"),
+    ("mysql", "database"),
+    ("redis", "host"),
+)
+
+# id(config) -> config for read-only configs that passed validate_config
+_validated: Dict[int, Mapping[str, Any]] = {}
+
+
+def _as_bool(value: str) -> bool:
+    """Interpret an environment flag; only "true" (any case) is truthy"""
+    return value.lower() == "true"
+
+
+# (section, field, environment variable, converter, default); section None
+# places the field at the top level. Converters only apply to values read
+# from the environment, defaults are already typed.
+_SCHEMA = (
+    # MySQL Configuration
+    ("mysql", "host", "MYSQL_HOST", str, "localhost"),
+    ("mysql", "port", "MYSQL_PORT", int, 3306),
+    ("mysql", "user", "MYSQL_USER", str, "payment_user"),
+    ("mysql", "password", "MYSQL_PASSWORD", str, ""),
+    ("mysql", "database", "MYSQL_DATABASE", str, "payment_system"),
+    ("mysql", "charset", "MYSQL_CHARSET", str, "utf8mb4"),
+    ("mysql", "max_connections", "MYSQL_MAX_CONNECTIONS", int, 100),
+    ("mysql", "pool_size", "MYSQL_POOL_SIZE", int, 32),
+    ("mysql", "pool_backend", "MYSQL_POOL_BACKEND", str, "connector"),
+    ("mysql", "max_overflow", "MYSQL_MAX_OVERFLOW", int, 0),
+    ("mysql", "result_cache_ttl", "MYSQL_RESULT_CACHE_TTL", int, 0),
+    # Redis Configuration
+    ("redis", "host", "REDIS_HOST", str, "localhost"),
+    ("redis", "port", "REDIS_PORT", int, 6379),
+    ("redis", "password", "REDIS_PASSWORD", str, None),
+    ("redis", "db", "REDIS_DB", int, 0),
+    ("redis", "max_connections", "REDIS_MAX_CONNECTIONS", int, 10),
+    # WebSocket Configuration
+    ("websocket", "cors_origins", "WEBSOCKET_CORS_ORIGINS", str, "*"),
+    ("websocket", "async_mode", "WEBSOCKET_ASYNC_MODE", str, "eventlet"),
+    ("websocket", "ping_timeout", "WEBSOCKET_PING_TIMEOUT", int, 60),
+    ("websocket", "ping_interval", "WEBSOCKET_PING_INTERVAL", int, 25),
+    ("websocket", "logger", "WEBSOCKET_LOGGER", _as_bool, False),
+    ("websocket", "engineio_logger", "WEBSOCKET_ENGINEIO_LOGGER", _as_bool, False),
+    # AI/LangChain Configuration
+    ("ai", "model_name", "AI_MODEL", str, ""),
+    ("ai", "api_key", "AI_API_KEY", str, ""),
+    ("ai", "api_base", "AI_BASE_URL", str, ""),
+    ("ai", "temperature", "AI_TEMPERATURE", float, 0.1),
+    ("ai", "timeout_seconds", "AI_TIMEOUT", int, 30),
+    ("ai", "sql_generation_temperature", "AI_SQL_TEMPERATURE", float, 0.1),
+    ("ai", "summary_temperature", "AI_SUMMARY_TEMPERATURE", float, 0.3),
+    ("ai", "semantic_cache", "AI_SEMANTIC_CACHE", _as_bool, False),
+    ("ai", "summary_cache_ttl", "AI_SUMMARY_CACHE_TTL", int, 0),
+    # General Configuration
+    (None, "timezone", "TZ", str, "Asia/Calcutta"),
+    (None, "debug", "FLASK_DEBUG", _as_bool, False),
+    (None, "environment", "FLASK_ENV", str, "development"),
+)
+
+
+def _build(env: Mapping[str, str]) -> Mapping[str, Any]:
+    """
+    Build the read-only nested config from an environment mapping.
+
+    Args:
+        env: Environment variables to read fields from
+
+    Returns:
+        Read-only mapping with one nested read-only mapping per section
+    """
+    config: Dict[str, Any] = {}
+    for section, field, env_key, convert, default in _SCHEMA:
+        raw = env.get(env_key)
+        value = default if raw is None else convert(raw)
+        if section is None:
+            config[field] = value
+        else:
+            config.setdefault(section, {})[field] = value
+
+    return MappingProxyType({
+        key: MappingProxyType(value) if isinstance(value, dict) else value
+        for key, value in config.items()
+    })
 
 
 def load_dot():
+    from dotenv import load_dotenv
+
     load_dotenv()
 
 
-def load_config() -> Dict[str, Any]:
+def _ensure_dotenv_loaded() -> None:
+    """Parse the .env file once per process"""
+    global _dotenv_loaded
+    if not _dotenv_loaded:
+        load_dot()
+        _dotenv_loaded = True
+
+
+@lru_cache(maxsize=1)
+def load_config() -> Mapping[str, Any]:
     """
     Load environment configuration from .env file and environment variables.
 
+    The result is built once per process and shared; it is read-only, so
+    use reload_config() to pick up environment changes.
+
     Returns:
-        Dict containing all configuration values
+        Read-only mapping containing all configuration values
     """
     # Load .env file
-    load_dot()
-
-    config = {
-        # MySQL Configuration
-        "mysql": {
-            "host": os.getenv("MYSQL_HOST", "localhost"),
-            "port": int(os.getenv("MYSQL_PORT", 3306)),
-            "user": os.getenv("MYSQL_USER", "payment_user"),
-            "password": os.getenv("MYSQL_PASSWORD", ""),
-            "database": os.getenv("MYSQL_DATABASE", "payment_system"),
-            "charset": os.getenv("MYSQL_CHARSET", "utf8mb4"),
-            "max_connections": int(os.getenv("MYSQL_MAX_CONNECTIONS", 100)),
-        },
-        # Redis Configuration
-        "redis": {
-            "host": os.getenv("REDIS_HOST", "localhost"),
-            "port": int(os.getenv("REDIS_PORT", 6379)),
-            "password": os.getenv("REDIS_PASSWORD", None),
-            "db": int(os.getenv("REDIS_DB", 0)),
-            "max_connections": int(os.getenv("REDIS_MAX_CONNECTIONS", 10)),
-        },
-        # WebSocket Configuration
-        "websocket": {
-            "cors_origins": os.getenv("WEBSOCKET_CORS_ORIGINS", "*"),
-            "async_mode": os.getenv("WEBSOCKET_ASYNC_MODE", "eventlet"),
-            "ping_timeout": int(os.getenv("WEBSOCKET_PING_TIMEOUT", 60)),
-            "ping_interval": int(os.getenv("WEBSOCKET_PING_INTERVAL", 25)),
-        },
-        # AI/LangChain Configuration
-        "ai": {
-            "model_name": os.getenv("AI_MODEL", ""),
-            "api_key": os.getenv("AI_API_KEY", ""),
-            "api_base": os.getenv("AI_BASE_URL", ""),
-            "temperature": float(os.getenv("AI_TEMPERATURE", "0.1")),
-            "timeout_seconds": int(os.getenv("AI_TIMEOUT", "30")),
-            "sql_generation_temperature": float(os.getenv("AI_SQL_TEMPERATURE", "0.1")),
-            "summary_temperature": float(os.getenv("AI_SUMMARY_TEMPERATURE", "0.3")),
-        },
-        # General Configuration
-        "timezone": os.getenv("TZ", "Asia/Calcutta"),
-        "debug": os.getenv("FLASK_DEBUG", "False").lower() == "true",
-        "environment": os.getenv("FLASK_ENV", "development"),
-    }
-
-    return config
-
-
-def validate_config(config: Dict[str, Any]) -> bool:
+    _ensure_dotenv_loaded()
+
+    # Snapshot the environment once instead of one os.getenv per field
+    return _build(dict(os.environ))
+
+
+def reload_config() -> Mapping[str, Any]:
+    """
+    Discard the cached configuration and load it again.
+
+    Returns:
+        Freshly loaded read-only configuration mapping
+    """
+    load_config.cache_clear()
+    return load_config()
+
+
+def validate_config(config: Mapping[str, Any]) -> bool:
     """
     Validate required configuration values.
 
@@ -72,21 +150,20 @@ def validate_config(config: Dict[str, Any]) -> bool:
     Returns:
         True if configuration is valid, False otherwise
     """
-    required_fields = [
-        ("mysql", "host"),
-        ("mysql", "user"),
-        ("mysql", "password"),
-        ("mysql", "database"),
-        ("redis", "host"),
-    ]
-
-    for section, field in required_fields:
+    # Read-only configs cannot change after validation; the config itself
+    # is kept alongside its id so a recycled id never matches
+    if _validated.get(id(config)) is config:
+        return True
+
+    for section, field in _REQUIRED_FIELDS:
         if section not in config or field not in config[section]:
-            print(f"Missing required configuration: {section}.{field}")
+            logger.error("Missing required configuration: %s.%s", section, field)
             return False
 
         if not config[section][field]:
-            print(f"Empty required configuration: {section}.{field}")
+            logger.error("Empty required configuration: %s.%s", section, field)
             return False
 
+    if isinstance(config, MappingProxyType):
+        _validated[id(config)] = config
     return True
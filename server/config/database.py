@@ -1,13 +1,32 @@
-import mysql.connector.pooling
-from mysql.connector import Error
-from typing import Dict, Any, Optional
+from contextlib import contextmanager
+from typing import Dict, Any
+import itertools
 import logging
 
 logger = logging.getLogger(__name__)
 
+# mysql.connector, imported on first use so modules that never touch MySQL
+# do not pay for loading the driver
+_mysql = None
+
+
+def _mysql_connector():
+    """Import mysql.connector (with its pooling module) once and return it"""
+    global _mysql
+    if _mysql is None:
+        import mysql.connector.pooling
+        _mysql = mysql.connector
+    return _mysql
+
+
 class MySQLConnectionPool:
     """MySQL connection pool manager"""
     
+    __slots__ = ('config', 'pool', 'pools', '_next_pool')
+    
+    # mysql-connector caps a single pool at this many connections
+    MAX_POOL_SIZE = 32
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize MySQL connection pool.
@@ -17,15 +36,33 @@ class MySQLConnectionPool:
         """
         self.config = config
         self.pool = None
+        self.pools = []
+        self._next_pool = itertools.count()
         self._create_pool()
     
     def _create_pool(self) -> None:
-        """Create MySQL connection pool"""
+        """
+        Create MySQL connection pool(s).
+        
+        pool_size above MAX_POOL_SIZE is split across several named pools
+        that are used round-robin. mysql-connector opens every pooled
+        connection when the pool is constructed, so the pools start warm;
+        pool_size is therefore the client's own budget, kept well below the
+        server's max_connections so other workers and tools can connect.
+        """
+        mysql = _mysql_connector()
         try:
-            pool_config = {
-                'pool_name': 'payment_pool',
-                'pool_size': min(self.config.get('max_connections', 10), 32),  # MySQL Connector limit
-                'pool_reset_session': True,
+            total = max(self.config.get('pool_size', self.MAX_POOL_SIZE), 1)
+            pool_count = -(-total // self.MAX_POOL_SIZE)
+            # Connections are returned without COM_RESET_CONNECTION: nothing
+            # here changes session state (autocommit is fixed pool-wide), so
+            # the reset would be a wasted round trip per checkout. Callers
+            # that set session variables must restore them before returning
+            # the connection. MySQL warnings are not raised as exceptions;
+            # code that cares can enable get_warnings and use
+            # cursor.fetchwarnings().
+            base_config = {
+                'pool_reset_session': False,
                 'host': self.config['host'],
                 'port': self.config['port'],
                 'user': self.config['user'],
@@ -33,46 +70,113 @@ class MySQLConnectionPool:
                 'database': self.config['database'],
                 'charset': self.config.get('charset', 'utf8mb4'),
                 'autocommit': True,
-                'raise_on_warnings': True,
             }
             
-            self.pool = mysql.connector.pooling.MySQLConnectionPool(**pool_config)
+            pools = []
+            try:
+                for index in range(pool_count):
+                    pool_size = min(total - index * self.MAX_POOL_SIZE, self.MAX_POOL_SIZE)
+                    pools.append(mysql.pooling.MySQLConnectionPool(
+                        pool_name='payment_pool' if index == 0 else f'payment_pool_{index}',
+                        pool_size=pool_size,
+                        **base_config
+                    ))
+            except Exception:
+                # Close the connections the pools built so far already opened
+                for pool in pools:
+                    self._disconnect_pool(pool)
+                raise
+            
+            self.pools = pools
+            self.pool = pools[0]
             
-        except Error as e:
-            logger.error(f"Error creating MySQL connection pool: {e}")
+        except mysql.Error as e:
+            logger.error("Error creating MySQL connection pool: %s", e)
             raise
     
+    @staticmethod
+    def _disconnect_pool(pool) -> None:
+        """
+        Close the server connections held by a mysql-connector pool.
+        
+        Each connection is checked out, disconnected and handed back, so the
+        pool would reconnect it on its next checkout.
+        
+        Args:
+            pool: mysql-connector MySQLConnectionPool
+        """
+        mysql = _mysql_connector()
+        connections = []
+        try:
+            for _ in range(pool.pool_size):
+                connections.append(pool.get_connection())
+        except mysql.errors.PoolError:
+            pass
+        
+        for connection in connections:
+            try:
+                connection.disconnect()
+            except mysql.Error as e:
+                logger.warning("Error disconnecting pooled MySQL connection: %s", e)
+            finally:
+                connection.close()
+    
     def get_connection(self):
         """
         Get a connection from the pool.
         
+        The pool itself reconnects stale connections on checkout, so no
+        extra liveness probe is made here.
+        
         Returns:
             MySQL connection object
         """
+        mysql = _mysql_connector()
         try:
             if self.pool is None:
                 raise Exception("Connection pool not initialized")
             
-            connection = self.pool.get_connection()
-            if connection.is_connected():
-                return connection
-            else:
-                raise Exception("Failed to get active connection from pool")
+            pools = self.pools
+            if len(pools) == 1:
+                return self.pool.get_connection()
+            
+            # Round-robin across pools, falling through exhausted ones
+            start = next(self._next_pool)
+            for offset in range(len(pools)):
+                try:
+                    return pools[(start + offset) % len(pools)].get_connection()
+                except mysql.errors.PoolError as e:
+                    last_error = e
+            raise last_error
                 
-        except Error as e:
-            logger.error(f"Error getting connection from pool: {e}")
+        except mysql.Error as e:
+            logger.error("Error getting connection from pool: %s", e)
             raise
     
     def return_connection(self, connection) -> None:
         """
-        Return connection to pool (handled automatically by context manager).
+        Return connection to pool (handled automatically by acquire()).
         
         Args:
             connection: MySQL connection object
         """
-        if connection and connection.is_connected():
+        if connection:
             connection.close()
     
+    @contextmanager
+    def acquire(self):
+        """
+        Borrow a pooled connection for the duration of a with block.
+        
+        Yields:
+            MySQL connection object, returned to the pool on exit
+        """
+        connection = self.get_connection()
+        try:
+            yield connection
+        finally:
+            self.return_connection(connection)
+    
     def close_pool(self) -> None:
         """Close all connections in the pool"""
         try:
@@ -81,9 +185,10 @@ class MySQLConnectionPool:
                 # Note: mysql-connector-python doesn't have a direct close_all method
                 # Connections will be closed when the pool object is destroyed
                 self.pool = None
+                self.pools = []
                 
         except Exception as e:
-            logger.error(f"Error closing MySQL connection pool: {e}")
+            logger.error("Error closing MySQL connection pool: %s", e)
     
     def get_pool_status(self) -> Dict[str, Any]:
         """
@@ -96,14 +201,146 @@ class MySQLConnectionPool:
             return {'status': 'not_initialized'}
         
         try:
-            # Get a test connection to verify pool health
-            test_conn = self.pool.get_connection()
-            test_conn.close()
+            # Ping over a borrowed connection to verify pool health
+            with self.acquire() as conn:
+                conn.cmd_ping()
             
             return {
                 'status': 'healthy',
                 'pool_name': self.pool.pool_name,
-                'pool_size': self.pool.pool_size,
+                'pool_size': sum(pool.pool_size for pool in self.pools),
+            }
+        except Exception as e:
+            return {
+                'status': 'error',
+                'error': str(e)
+            }
+
+class SQLAlchemyConnectionPool:
+    """
+    MySQL connection pool backed by SQLAlchemy's QueuePool.
+    
+    Same interface as MySQLConnectionPool, without mysql-connector's
+    32-connections-per-pool ceiling. Connections are pre-pinged on
+    checkout instead of being probed by callers. The mysql-connector driver
+    is kept so callers' dictionary cursors keep working.
+    """
+    
+    __slots__ = ('config', 'engine', 'pool')
+    
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize SQLAlchemy-backed connection pool.
+        
+        Args:
+            config: MySQL configuration dictionary
+        """
+        self.config = config
+        self.engine = None
+        self.pool = None
+        self._create_pool()
+    
+    def _create_pool(self) -> None:
+        """Create the SQLAlchemy engine and its connection pool"""
+        from sqlalchemy import create_engine
+        from sqlalchemy.engine import URL
+        
+        try:
+            url = URL.create(
+                'mysql+mysqlconnector',
+                username=self.config['user'],
+                password=self.config['password'],
+                host=self.config['host'],
+                port=self.config['port'],
+                database=self.config['database'],
+                query={'charset': self.config.get('charset', 'utf8mb4')},
+            )
+            self.engine = create_engine(
+                url,
+                pool_size=max(self.config.get('pool_size', 32), 1),
+                max_overflow=self.config.get('max_overflow', 0),
+                pool_pre_ping=True,
+                # Autocommit connections have nothing to roll back on return
+                isolation_level='AUTOCOMMIT',
+                pool_reset_on_return=None,
+            )
+            self.pool = self.engine.pool
+            
+        except Exception as e:
+            logger.error("Error creating SQLAlchemy MySQL connection pool: %s", e)
+            raise
+    
+    def get_connection(self):
+        """
+        Get a connection from the pool.
+        
+        Returns:
+            DBAPI connection proxy; close() returns it to the pool
+        """
+        if self.engine is None:
+            raise Exception("Connection pool not initialized")
+        
+        try:
+            return self.engine.raw_connection()
+        except Exception as e:
+            logger.error("Error getting connection from pool: %s", e)
+            raise
+    
+    def return_connection(self, connection) -> None:
+        """
+        Return connection to pool (handled automatically by acquire()).
+        
+        Args:
+            connection: DBAPI connection proxy
+        """
+        if connection:
+            connection.close()
+    
+    @contextmanager
+    def acquire(self):
+        """
+        Borrow a pooled connection for the duration of a with block.
+        
+        Yields:
+            DBAPI connection proxy, returned to the pool on exit
+        """
+        connection = self.get_connection()
+        try:
+            yield connection
+        finally:
+            self.return_connection(connection)
+    
+    def close_pool(self) -> None:
+        """Close all connections in the pool"""
+        try:
+            if self.engine is not None:
+                self.engine.dispose()
+                self.engine = None
+                self.pool = None
+                
+        except Exception as e:
+            logger.error("Error closing SQLAlchemy MySQL connection pool: %s", e)
+    
+    def get_pool_status(self) -> Dict[str, Any]:
+        """
+        Get connection pool status.
+        
+        Returns:
+            Dictionary with pool status information
+        """
+        if self.engine is None:
+            return {'status': 'not_initialized'}
+        
+        try:
+            # Checkout pre-pings the connection, verifying pool health
+            with self.acquire():
+                pass
+            
+            return {
+                'status': 'healthy',
+                'pool_name': 'sqlalchemy',
+                'pool_size': self.pool.size(),
+                'checked_out': self.pool.checkedout(),
             }
         except Exception as e:
             return {
@@ -111,16 +348,24 @@ class MySQLConnectionPool:
                 'error': str(e)
             }
 
-def create_mysql_pool(config: Dict[str, Any]) -> MySQLConnectionPool:
+def create_mysql_pool(config: Dict[str, Any]):
     """
     Create and return MySQL connection pool.
     
+    The backend follows config['pool_backend']: 'connector' (default) uses
+    mysql-connector's own pooling, 'sqlalchemy' uses SQLAlchemy's QueuePool.
+    
     Args:
         config: MySQL configuration dictionary
         
     Returns:
-        MySQLConnectionPool instance
+        MySQLConnectionPool or SQLAlchemyConnectionPool instance
     """
+    backend = config.get('pool_backend', 'connector')
+    if backend == 'sqlalchemy':
+        return SQLAlchemyConnectionPool(config)
+    if backend != 'connector':
+        raise ValueError(f"Unknown MYSQL_POOL_BACKEND {backend!r}; expected 'connector' or 'sqlalchemy'")
     return MySQLConnectionPool(config)
 
 def test_mysql_connection(config: Dict[str, Any]) -> bool:
@@ -133,8 +378,9 @@ def test_mysql_connection(config: Dict[str, Any]) -> bool:
     Returns:
         True if connection successful, False otherwise
     """
+    mysql = _mysql_connector()
     try:
-        connection = mysql.connector.connect(
+        connection = mysql.connect(
             host=config['host'],
             port=config['port'],
             user=config['user'],
@@ -151,8 +397,8 @@ def test_mysql_connection(config: Dict[str, Any]) -> bool:
             connection.close()
             return result[0] == 1
             
-    except Error as e:
-        logger.error(f"MySQL connection test failed: {e}")
+    except mysql.Error as e:
+        logger.error("MySQL connection test failed: %s", e)
         return False
     
     return False
@@ -1,13 +1,40 @@
-import redis
-from redis.connection import ConnectionPool
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional
 import logging
+import time
+
+if TYPE_CHECKING:
+    import redis
 
 logger = logging.getLogger(__name__)
 
+# redis-py, imported on first use so modules that never touch Redis do not
+# pay for loading the client library
+_redis = None
+
+
+def _redis_module():
+    """Import redis once and return it"""
+    global _redis
+    if _redis is None:
+        import redis
+        _redis = redis
+    return _redis
+
+
 class RedisConnectionManager:
     """Redis connection manager with connection pooling"""
     
+    __slots__ = (
+        'config', 'pool', 'client', 'raw_pool', 'raw_client',
+        '_info_cache', '_info_cache_expires', '_set', '_get', '_del'
+    )
+    
+    # INFO sections holding the fields reported by get_connection_info
+    INFO_SECTIONS = ('server', 'clients', 'memory', 'stats')
+    
+    # Seconds a get_connection_info result is reused
+    INFO_CACHE_TTL = 1.0
+    
     def __init__(self, config: Dict[str, Any]):
         """
         Initialize Redis connection manager.
@@ -18,10 +45,18 @@ class RedisConnectionManager:
         self.config = config
         self.pool = None
         self.client = None
+        # Bytes-returning client for JSON blobs, which orjson parses without
+        # a UTF-8 decode into an intermediate str
+        self.raw_pool = None
+        self.raw_client = None
+        # Last get_connection_info result and its time.monotonic() expiry
+        self._info_cache: Optional[Dict[str, Any]] = None
+        self._info_cache_expires = 0.0
         self._create_connection()
     
     def _create_connection(self) -> None:
         """Create Redis connection pool and client"""
+        redis = _redis_module()
         try:
             # Create connection pool
             pool_config = {
@@ -40,20 +75,28 @@ class RedisConnectionManager:
             if self.config.get('password'):
                 pool_config['password'] = self.config['password']
             
-            self.pool = ConnectionPool(**pool_config)
+            self.pool = redis.ConnectionPool(**pool_config)
             self.client = redis.Redis(connection_pool=self.pool)
+            # Bound methods for the key helpers, resolved once
+            self._set = self.client.set
+            self._get = self.client.get
+            self._del = self.client.delete
+            
+            pool_config['decode_responses'] = False
+            self.raw_pool = redis.ConnectionPool(**pool_config)
+            self.raw_client = redis.Redis(connection_pool=self.raw_pool)
             
             # Test connection
             self.client.ping()
             
         except redis.RedisError as e:
-            logger.error(f"Error creating Redis connection: {e}")
+            logger.error("Error creating Redis connection: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Unexpected error creating Redis connection: {e}")
+            logger.error("Unexpected error creating Redis connection: %s", e)
             raise
     
-    def get_client(self) -> redis.Redis:
+    def get_client(self) -> 'redis.Redis':
         """
         Get Redis client.
         
@@ -65,6 +108,18 @@ class RedisConnectionManager:
         
         return self.client
     
+    def get_raw_client(self) -> 'redis.Redis':
+        """
+        Get the Redis client that returns undecoded bytes.
+        
+        Returns:
+            Redis client instance with decode_responses disabled
+        """
+        if self.raw_client is None:
+            raise Exception("Redis client not initialized")
+        
+        return self.raw_client
+    
     def ping(self) -> bool:
         """
         Test Redis connection.
@@ -77,7 +132,7 @@ class RedisConnectionManager:
                 return self.client.ping()
             return False
         except Exception as e:
-            logger.error(f"Redis ping failed: {e}")
+            logger.error("Redis ping failed: %s", e)
             return False
     
     def close_connection(self) -> None:
@@ -86,16 +141,25 @@ class RedisConnectionManager:
             if self.client:
                 self.client.close()
             
+            if self.raw_client:
+                self.raw_client.close()
+            
             if self.pool:
                 self.pool.disconnect()
+            
+            if self.raw_pool:
+                self.raw_pool.disconnect()
                 
         except Exception as e:
-            logger.error(f"Error closing Redis connection: {e}")
+            logger.error("Error closing Redis connection: %s", e)
     
     def get_connection_info(self) -> Dict[str, Any]:
         """
         Get Redis connection information.
         
+        Successful results are cached for INFO_CACHE_TTL seconds so frequent
+        health polls do not each issue INFO commands.
+        
         Returns:
             Dictionary with connection information
         """
@@ -103,8 +167,19 @@ class RedisConnectionManager:
             if not self.client:
                 return {'status': 'not_connected'}
             
-            info = self.client.info()
-            return {
+            now = time.monotonic()
+            if self._info_cache is not None and now < self._info_cache_expires:
+                return self._info_cache
+            
+            # Fetch only the sections the summary needs, in one round trip
+            pipe = self.client.pipeline(transaction=False)
+            for section in self.INFO_SECTIONS:
+                pipe.info(section)
+            info = {}
+            for section_info in pipe.execute():
+                info.update(section_info)
+            
+            self._info_cache = {
                 'status': 'connected',
                 'redis_version': info.get('redis_version'),
                 'connected_clients': info.get('connected_clients'),
@@ -113,6 +188,8 @@ class RedisConnectionManager:
                 'keyspace_hits': info.get('keyspace_hits'),
                 'keyspace_misses': info.get('keyspace_misses'),
             }
+            self._info_cache_expires = now + self.INFO_CACHE_TTL
+            return self._info_cache
         except Exception as e:
             return {
                 'status': 'error',
@@ -132,9 +209,9 @@ class RedisConnectionManager:
             True if successful, False otherwise
         """
         try:
-            return self.client.set(key, value, ex=ex)
+            return self._set(key, value, ex=ex)
         except Exception as e:
-            logger.error(f"Error setting Redis key {key}: {e}")
+            logger.error("Error setting Redis key %s: %s", key, e)
             return False
     
     def get_key(self, key: str) -> Optional[str]:
@@ -148,9 +225,9 @@ class RedisConnectionManager:
             Value if key exists, None otherwise
         """
         try:
-            return self.client.get(key)
+            return self._get(key)
         except Exception as e:
-            logger.error(f"Error getting Redis key {key}: {e}")
+            logger.error("Error getting Redis key %s: %s", key, e)
             return None
     
     def delete_key(self, key: str) -> bool:
@@ -164,10 +241,11 @@ class RedisConnectionManager:
             True if key was deleted, False otherwise
         """
         try:
-            return bool(self.client.delete(key))
+            return bool(self._del(key))
         except Exception as e:
-            logger.error(f"Error deleting Redis key {key}: {e}")
+            logger.error("Error deleting Redis key %s: %s", key, e)
             return False
+    
 
 def create_redis_connection(config: Dict[str, Any]) -> RedisConnectionManager:
     """
@@ -191,6 +269,7 @@ def test_redis_connection(config: Dict[str, Any]) -> bool:
     Returns:
         True if connection successful, False otherwise
     """
+    redis = _redis_module()
     try:
         client_config = {
             'host': config['host'],
@@ -209,5 +288,5 @@ def test_redis_connection(config: Dict[str, Any]) -> bool:
         return result
         
     except Exception as e:
-        logger.error(f"Redis connection test failed: {e}")
+        logger.error("Redis connection test failed: %s", e)
         return False
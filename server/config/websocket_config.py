@@ -1,12 +1,51 @@
-from flask_socketio import SocketIO
-from typing import Dict, Any
+from datetime import datetime
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, Mapping
 import logging
+import time
+
+from utils import json_utils
+
+if TYPE_CHECKING:
+    from flask_socketio import SocketIO
 
 logger = logging.getLogger(__name__)
 
+# Flask-SocketIO runs on WSGI servers only; an ASGI deployment would need
+# python-socketio's AsyncServer rather than this manager
+SUPPORTED_ASYNC_MODES = ('eventlet', 'gevent', 'threading')
+
+_now = time.time
+_fromtimestamp = datetime.fromtimestamp
+
+
+class ConnInfo:
+    """Tracking record for one active connection"""
+    
+    __slots__ = ('connected_at', 'user_data')
+    
+    def __init__(self, connected_at: float, user_data: Dict[str, Any]):
+        # time.time() value; formatted as ISO 8601 only when rendered
+        self.connected_at = connected_at
+        self.user_data = user_data
+    
+    def to_dict(self, message_count: int) -> Dict[str, Any]:
+        """Render the record in the dictionary shape exposed to clients"""
+        return {
+            'connected_at': _fromtimestamp(self.connected_at).isoformat(),
+            'user_data': self.user_data,
+            'message_count': message_count
+        }
+
+
 class WebSocketManager:
     """WebSocket manager for Flask-SocketIO"""
     
+    __slots__ = (
+        'config', 'socketio', 'active_connections', '_connections_view',
+        '_message_counts', '_total_messages'
+    )
+    
     def __init__(self, app, config: Dict[str, Any]):
         """
         Initialize WebSocket manager.
@@ -17,28 +56,46 @@ class WebSocketManager:
         """
         self.config = config
         self.socketio = None
-        self.active_connections = {}
+        self.active_connections: Dict[str, ConnInfo] = {}
+        self._connections_view = MappingProxyType(self.active_connections)
+        # Per-connection message counters, kept apart from ConnInfo so the
+        # per-message update and the stats sum touch only this dict
+        self._message_counts: Dict[str, int] = {}
+        # Running sum of _message_counts, so stats never re-sum it
+        self._total_messages = 0
         self._initialize_socketio(app)
     
     def _initialize_socketio(self, app) -> None:
         """Initialize Flask-SocketIO"""
+        from flask_socketio import SocketIO
+        
         try:
+            async_mode = self.config.get('async_mode', 'eventlet')
+            if async_mode not in SUPPORTED_ASYNC_MODES:
+                raise ValueError(
+                    f"Unsupported WEBSOCKET_ASYNC_MODE {async_mode!r}; "
+                    f"expected one of {', '.join(SUPPORTED_ASYNC_MODES)}"
+                )
+            
             socketio_config = {
                 'cors_allowed_origins': self.config.get('cors_origins', '*'),
-                'async_mode': self.config.get('async_mode', 'eventlet'),
+                'async_mode': async_mode,
                 'ping_timeout': self.config.get('ping_timeout', 60),
                 'ping_interval': self.config.get('ping_interval', 25),
-                'logger': True,
-                'engineio_logger': False,
+                # Per-packet logging is costly; enable only for debugging
+                'logger': self.config.get('logger', False),
+                'engineio_logger': self.config.get('engineio_logger', False),
+                # Encode/decode Socket.IO packets with orjson
+                'json': json_utils,
             }
             
             self.socketio = SocketIO(app, **socketio_config)
             
         except Exception as e:
-            logger.error(f"Error initializing WebSocket: {e}")
+            logger.error("Error initializing WebSocket: %s", e)
             raise
     
-    def get_socketio(self) -> SocketIO:
+    def get_socketio(self) -> 'SocketIO':
         """
         Get SocketIO instance.
         
@@ -58,11 +115,10 @@ class WebSocketManager:
             session_id: Socket session ID
             user_data: Optional user data to store
         """
-        self.active_connections[session_id] = {
-            'connected_at': self._get_current_timestamp(),
-            'user_data': user_data or {},
-            'message_count': 0
-        }
+        self.active_connections[session_id] = ConnInfo(_now(), user_data or {})
+        # A reconnect under the same session ID starts its count afresh
+        self._total_messages -= self._message_counts.get(session_id, 0)
+        self._message_counts[session_id] = 0
     
     def remove_connection(self, session_id: str) -> None:
         """
@@ -71,8 +127,8 @@ class WebSocketManager:
         Args:
             session_id: Socket session ID
         """
-        if session_id in self.active_connections:
-            del self.active_connections[session_id]
+        self.active_connections.pop(session_id, None)
+        self._total_messages -= self._message_counts.pop(session_id, 0)
     
     def increment_message_count(self, session_id: str) -> None:
         """
@@ -81,8 +137,10 @@ class WebSocketManager:
         Args:
             session_id: Socket session ID
         """
-        if session_id in self.active_connections:
-            self.active_connections[session_id]['message_count'] += 1
+        counts = self._message_counts
+        if session_id in counts:
+            counts[session_id] += 1
+            self._total_messages += 1
     
     def get_connection_count(self) -> int:
         """
@@ -103,16 +161,20 @@ class WebSocketManager:
         Returns:
             Connection information dictionary
         """
-        return self.active_connections.get(session_id, {})
+        conn = self.active_connections.get(session_id)
+        if conn is None:
+            return {}
+        return conn.to_dict(self._message_counts.get(session_id, 0))
     
-    def get_all_connections(self) -> Dict[str, Dict[str, Any]]:
+    def get_all_connections(self) -> Mapping[str, ConnInfo]:
         """
-        Get information about all active connections.
+        Get a live, read-only view of all active connections.
         
         Returns:
-            Dictionary of all active connections
+            Mapping of session ID to connection record; reflects later
+            connects and disconnects without copying
         """
-        return self.active_connections.copy()
+        return self._connections_view
     
     def broadcast_message(self, event: str, data: Dict[str, Any], room: str = None) -> None:
         """
@@ -127,9 +189,10 @@ class WebSocketManager:
             if room:
                 self.socketio.emit(event, data, room=room)
             else:
-                self.socketio.emit(event, data, broadcast=True)
+                # Emitting without a room already reaches every client
+                self.socketio.emit(event, data)
         except Exception as e:
-            logger.error(f"Error broadcasting message: {e}")
+            logger.error("Error broadcasting message: %s", e)
     
     def send_to_client(self, session_id: str, event: str, data: Dict[str, Any]) -> None:
         """
@@ -143,7 +206,7 @@ class WebSocketManager:
         try:
             self.socketio.emit(event, data, room=session_id)
         except Exception as e:
-            logger.error(f"Error sending message to client {session_id}: {e}")
+            logger.error("Error sending message to client %s: %s", session_id, e)
     
     def get_websocket_stats(self) -> Dict[str, Any]:
         """
@@ -152,22 +215,12 @@ class WebSocketManager:
         Returns:
             Dictionary with WebSocket statistics
         """
-        total_messages = sum(
-            conn.get('message_count', 0) 
-            for conn in self.active_connections.values()
-        )
-        
         return {
             'active_connections': self.get_connection_count(),
-            'total_messages_processed': total_messages,
+            'total_messages_processed': self._total_messages,
             'async_mode': self.config.get('async_mode'),
             'cors_origins': self.config.get('cors_origins'),
         }
-    
-    def _get_current_timestamp(self) -> str:
-        """Get current timestamp as string"""
-        from datetime import datetime
-        return datetime.now().isoformat()
 
 def create_websocket_manager(app, config: Dict[str, Any]) -> WebSocketManager:
     """
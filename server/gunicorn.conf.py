@@ -0,0 +1,22 @@
+"""
+Gunicorn configuration.
+
+The app is imported with APP_DEFER_POOLS enabled so that only fork-safe
+state (configuration, URL map, pre-serialized bodies) is built at import.
+Each worker then opens its own MySQL and Redis pools once it has started,
+which keeps sockets out of the master and lets ``--preload`` share the
+read-only pages across workers.
+"""
+import os
+import sys
+
+os.environ.setdefault('APP_DEFER_POOLS', 'true')
+
+
+def post_worker_init(worker):
+    """Open the per-worker connection pools"""
+    from utils.app_state import open_app_pools
+
+    if not open_app_pools():
+        worker.log.error("Failed to open connection pools")
+        sys.exit(1)
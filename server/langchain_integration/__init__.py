@@ -17,12 +17,24 @@ Components:
 __version__ = "1.0.0"
 __author__ = "Payment Analytics Team"
 
-# Import main components for easy access
-from .chains.sequential_chain import SequentialChain
-from .models.response_models import SequentialChainResult, SQLValidationResult
-
 __all__ = [
     'SequentialChain',
     'SequentialChainResult', 
     'SQLValidationResult'
 ]
+
+
+def __getattr__(name):
+    """
+    Resolve the re-exported components on first access (PEP 562).
+
+    Importing any submodule runs this package __init__, so the LangChain
+    import tree is only loaded once a chain is actually needed.
+    """
+    if name == 'SequentialChain':
+        from .chains.sequential_chain import SequentialChain
+        return SequentialChain
+    if name in ('SequentialChainResult', 'SQLValidationResult'):
+        from .models import response_models
+        return getattr(response_models, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
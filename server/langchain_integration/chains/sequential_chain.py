@@ -10,24 +10,59 @@ Coordinates the execution of all services in the proper sequence:
 Implements the error handling strategy specified by the user.
 """
 
+import asyncio
 import logging
+import random
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, AsyncIterator, Dict, List, Optional, Tuple, Union
 
 from ..models.response_models import (
     SequentialChainResult,
+    SQLValidationResult,
     ChainConfig,
     create_error_result,
     create_success_result,
 )
-from ..services.sql_generator import SQLGeneratorService
-from ..services.sql_validator import SQLValidatorService
-from ..services.sql_executor import SQLExecutorService
-from ..services.data_summarizer import DataSummarizerService
+
+if TYPE_CHECKING:
+    import numpy as np
+
+    from ..services.semantic_cache import SemanticCache
 
 logger = logging.getLogger(__name__)
 
 
+# Failures that a second attempt with the same prompt cannot fix
+_NON_RETRYABLE = frozenset({"sql_validation_error", "sql_execution_error"})
+
+# html_summary when the data was fetched but summarization failed
+_FALLBACK_SUMMARY_HTML = "<p><strong>Fallback Summary:</strong> %s</p>"
+
+# Full-jitter exponential backoff between retries, in seconds
+_RETRY_BACKOFF_BASE = 0.2
+_RETRY_BACKOFF_CAP = 5.0
+
+
+# Request replayed by test_end_to_end
+_TEST_QUERY = "Show me the total number of successful payments"
+_TEST_PROMPT = f"""
+[SYSTEM CONTEXT]
+You are a payment analytics assistant.
+
+[TOOL CONTEXT]
+Available tables: payment_intent (id, amount, status, created_at)
+
+[USER CONTEXT]
+User Query: {_TEST_QUERY}
+"""
+
+
+def _elapsed_ms(start_ns: int) -> float:
+    """Milliseconds since a time.perf_counter_ns() reading"""
+    return (time.perf_counter_ns() - start_ns) / 1e6
+
+
 class SequentialChain:
     """
     Sequential Chain Orchestrator
@@ -43,6 +78,13 @@ class SequentialChain:
         Args:
             config: Chain configuration, uses defaults if None
         """
+        # The services pull in the LangChain/OpenAI client graph; importing
+        # them here keeps it off the import path of this module
+        from ..services.sql_generator import SQLGeneratorService
+        from ..services.sql_validator import SQLValidatorService
+        from ..services.sql_executor import SQLExecutorService
+        from ..services.data_summarizer import DataSummarizerService
+
         self.config = config or ChainConfig()
 
         # Initialize all services
@@ -51,6 +93,27 @@ class SequentialChain:
         self.sql_executor = SQLExecutorService(self.config.execution_config)
         self.data_summarizer = DataSummarizerService(self.config.llm_config)
 
+        self.semantic_cache: Optional["SemanticCache"] = None
+        self._configure_semantic_cache()
+
+    def _configure_semantic_cache(self) -> None:
+        """Create, drop or reset the semantic cache to match self.config"""
+        if not self.config.enable_semantic_cache:
+            self.semantic_cache = None
+        elif self.semantic_cache is None:
+            # Imported only when enabled; the cache needs numpy
+            from ..services.semantic_cache import SemanticCache
+
+            self.semantic_cache = SemanticCache(
+                threshold=self.config.semantic_cache_threshold,
+                ttl=self.config.semantic_cache_ttl_seconds,
+            )
+        else:
+            # Cached answers were produced under the previous configuration
+            self.semantic_cache.clear()
+            self.semantic_cache.threshold = self.config.semantic_cache_threshold
+            self.semantic_cache.ttl = self.config.semantic_cache_ttl_seconds
+
     def process(
         self, final_prompt: str, app_state, user_query: str = "", session_id: str = ""
     ) -> SequentialChainResult:
@@ -66,146 +129,540 @@ class SequentialChain:
         Returns:
             SequentialChainResult with final response or error
         """
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
 
         try:
-            logger.debug(
-                f"[CHAIN_DEBUG]   - Full prompt preview: {final_prompt[:500]}..."
-            )
+            # Guarded: the preview slice would otherwise be built per request
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("[CHAIN_DEBUG]   - Full prompt preview: %s...", final_prompt[:500])
+
+            embedding, scope, cached = self._semantic_probe(final_prompt, user_query)
+            if cached:
+                return self.semantic_cache.reuse(cached, user_query, session_id, start_ns)
 
             # Step 1: SQL Generation
             sql_result = self.sql_generator.generate_sql(final_prompt)
 
             if not sql_result.success:
-                # SQL generation failed - return error
-                error_msg = f"SQL generation failed: {sql_result.error}"
-                logger.error(f"[SEQUENTIAL_CHAIN] {error_msg}")
+                return self._generation_failed(
+                    sql_result, user_query, session_id, start_ns
+                )
 
-                result = create_error_result(
-                    error_msg, "sql_generation_error", user_query, session_id
+            result = self._process_generated_sql(
+                sql_result, app_state, user_query, session_id, start_ns
+            )
+            if embedding is not None:
+                self.semantic_cache.insert(embedding, result, scope, user_query)
+            return result
+
+        except Exception as e:
+            return self._chain_failed(e, user_query, session_id, start_ns)
+
+    async def aprocess(
+        self, final_prompt: str, app_state, user_query: str = "", session_id: str = ""
+    ) -> SequentialChainResult:
+        """
+        Process the complete sequential chain on the running event loop
+
+        Both LLM calls and the MySQL query are awaited (the query falls back
+        to a worker thread without aiomysql), so many chains can be in
+        flight on one loop.
+
+        Args:
+            final_prompt: Complete prompt from chat_handler
+            app_state: Application state with database connections
+            user_query: Original user query for context
+            session_id: Session ID for tracking
+
+        Returns:
+            SequentialChainResult with final response or error
+        """
+        start_ns = time.perf_counter_ns()
+
+        try:
+            embedding, scope, cached = await self._asemantic_probe(final_prompt, user_query)
+            if cached:
+                return self.semantic_cache.reuse(cached, user_query, session_id, start_ns)
+
+            # Step 1: SQL Generation
+            sql_result = await self.sql_generator.agenerate_sql(final_prompt)
+
+            if not sql_result.success:
+                return self._generation_failed(
+                    sql_result, user_query, session_id, start_ns
                 )
-                result.sql_generation = sql_result
-                result.total_processing_time_ms = (time.time() - start_time) * 1000
-                return result
 
-            # Step 2: SQL Validation
-            validation_context = {"session_id": session_id, "user_query": user_query}
-            validation_result = self.sql_validator.validate_sql_with_context(
-                sql_result.sql_query, validation_context
+            result = await self._aprocess_generated_sql(
+                sql_result, app_state, user_query, session_id, start_ns
             )
+            if embedding is not None:
+                self.semantic_cache.insert(embedding, result, scope, user_query)
+            return result
 
-            if not validation_result.isValid:
-                # SQL validation failed - return error
-                error_msg = f"SQL validation failed: {validation_result.error}"
-                logger.error(f"[SEQUENTIAL_CHAIN] {error_msg}")
+        except Exception as e:
+            return self._chain_failed(e, user_query, session_id, start_ns)
 
-                result = create_error_result(
-                    error_msg, "sql_validation_error", user_query, session_id
+    async def aprocess_stream(
+        self, final_prompt: str, app_state, user_query: str = "", session_id: str = ""
+    ) -> AsyncIterator[Union[str, SequentialChainResult]]:
+        """
+        Process the chain, streaming the summary text as it is generated
+
+        Generation, validation and execution complete first; then each
+        summary chunk is yielded as the LLM produces it. The last item is
+        always the complete SequentialChainResult, and a request that fails
+        or hits the semantic cache yields only that result.
+
+        Args:
+            final_prompt: Complete prompt from chat_handler
+            app_state: Application state with database connections
+            user_query: Original user query for context
+            session_id: Session ID for tracking
+
+        Yields:
+            str summary chunks, followed by the final SequentialChainResult
+        """
+        start_ns = time.perf_counter_ns()
+
+        try:
+            embedding, scope, cached = await self._asemantic_probe(final_prompt, user_query)
+            if cached:
+                yield self.semantic_cache.reuse(cached, user_query, session_id, start_ns)
+                return
+
+            sql_result = await self.sql_generator.agenerate_sql(final_prompt)
+            if not sql_result.success:
+                yield self._generation_failed(
+                    sql_result, user_query, session_id, start_ns
                 )
-                result.sql_generation = sql_result
-                result.sql_validation = validation_result
-                result.total_processing_time_ms = (time.time() - start_time) * 1000
-                return result
+                return
 
-            # Step 3: SQL Execution
-            execution_context = {"session_id": session_id, "user_query": user_query}
-            execution_result = self.sql_executor.execute_sql_with_context(
-                sql_result.sql_query, app_state, execution_context
+            context = {"session_id": session_id, "user_query": user_query}
+            validation_result, failed = self._validate_generated_sql(
+                sql_result, context, start_ns
             )
+            if failed:
+                yield failed
+                return
 
+            execution_result = await self.sql_executor.aexecute_sql_with_context(
+                sql_result.sql_query, app_state, context
+            )
             if not execution_result.success:
-                # SQL execution failed - return error
-                error_msg = f"SQL execution failed: {execution_result.error}"
-                logger.error(f"[SEQUENTIAL_CHAIN] {error_msg}")
+                yield self._execution_failed(
+                    sql_result, validation_result, execution_result,
+                    user_query, session_id, start_ns
+                )
+                return
+
+            summary_result = None
+            async for item in self.data_summarizer.astream_summarize(
+                execution_result, user_query, sql_result.sql_query
+            ):
+                if isinstance(item, str):
+                    yield item
+                else:
+                    summary_result = item
+
+            result = self._build_final_result(
+                sql_result, validation_result, execution_result, summary_result,
+                user_query, session_id, start_ns
+            )
+            if embedding is not None:
+                self.semantic_cache.insert(embedding, result, scope, user_query)
+
+        except Exception as e:
+            result = self._chain_failed(e, user_query, session_id, start_ns)
+
+        yield result
+
+    async def _asemantic_probe(
+        self, final_prompt: str, user_query: str
+    ) -> Tuple[Optional["np.ndarray"], Optional[bytes], Optional[SequentialChainResult]]:
+        """Run _semantic_probe off the event loop; embedding is CPU-bound inference"""
+        if not self.semantic_cache:
+            return None, None, None
+        return await asyncio.to_thread(self._semantic_probe, final_prompt, user_query)
+
+    def _semantic_probe(
+        self, final_prompt: str, user_query: str
+    ) -> Tuple[Optional["np.ndarray"], Optional[bytes], Optional[SequentialChainResult]]:
+        """
+        Look a query up in the semantic cache
+
+        Cache problems never fail the request; they only skip the cache.
+
+        Args:
+            final_prompt: Complete prompt from chat_handler
+            user_query: Original user query
+
+        Returns:
+            Tuple of (query embedding, prompt scope, cached result); the
+            embedding is None when the cache is disabled or unusable
+        """
+        if not self.semantic_cache or not user_query:
+            return None, None, None
+
+        # Already loaded by __init__
+        from ..services.sql_generator import prompt_prefix_digest
+
+        try:
+            embedding = self.semantic_cache.embed(user_query)
+            if embedding is None:
+                return None, None, None
+            scope = prompt_prefix_digest(final_prompt)
+            return embedding, scope, self.semantic_cache.lookup(embedding, scope, user_query)
+        except Exception as e:
+            logger.warning("[SEQUENTIAL_CHAIN] Semantic cache lookup failed: %s", e)
+            return None, None, None
+
+    def _process_generated_sql(
+        self, sql_result, app_state, user_query: str, session_id: str, start_ns: int
+    ) -> SequentialChainResult:
+        """
+        Run validation, execution and summarization for a generated query
+
+        Args:
+            sql_result: Successful SQLGenerationResult
+            app_state: Application state with database connections
+            user_query: Original user query for context
+            session_id: Session ID for tracking
+            start_ns: time.perf_counter_ns() at which processing of this query began
+
+        Returns:
+            SequentialChainResult with final response or error
+        """
+        # Neither stage modifies the context, so one dict serves both
+        context = {"session_id": session_id, "user_query": user_query}
+
+        # Step 2: SQL Validation
+        validation_result, failed = self._validate_generated_sql(
+            sql_result, context, start_ns
+        )
+        if failed:
+            return failed
+
+        # Step 3: SQL Execution
+        execution_result = self.sql_executor.execute_sql_with_context(
+            sql_result.sql_query, app_state, context
+        )
+
+        if not execution_result.success:
+            return self._execution_failed(
+                sql_result, validation_result, execution_result,
+                user_query, session_id, start_ns
+            )
+
+        # Step 4: Data Summarization
+        summary_result = self.data_summarizer.summarize_data(
+            execution_result, user_query, sql_result.sql_query
+        )
+
+        return self._build_final_result(
+            sql_result, validation_result, execution_result, summary_result,
+            user_query, session_id, start_ns
+        )
+
+    async def _aprocess_generated_sql(
+        self, sql_result, app_state, user_query: str, session_id: str, start_ns: int
+    ) -> SequentialChainResult:
+        """
+        Async counterpart of _process_generated_sql
+
+        Args:
+            sql_result: Successful SQLGenerationResult
+            app_state: Application state with database connections
+            user_query: Original user query for context
+            session_id: Session ID for tracking
+            start_ns: time.perf_counter_ns() at which processing of this query began
+
+        Returns:
+            SequentialChainResult with final response or error
+        """
+        context = {"session_id": session_id, "user_query": user_query}
+
+        # Validation is pure CPU work, not worth a thread hop
+        validation_result, failed = self._validate_generated_sql(
+            sql_result, context, start_ns
+        )
+        if failed:
+            return failed
+
+        execution_result = await self.sql_executor.aexecute_sql_with_context(
+            sql_result.sql_query, app_state, context
+        )
+
+        if not execution_result.success:
+            return self._execution_failed(
+                sql_result, validation_result, execution_result,
+                user_query, session_id, start_ns
+            )
+
+        summary_result = await self.data_summarizer.asummarize_data(
+            execution_result, user_query, sql_result.sql_query
+        )
+
+        return self._build_final_result(
+            sql_result, validation_result, execution_result, summary_result,
+            user_query, session_id, start_ns
+        )
+
+    def _validate_generated_sql(
+        self, sql_result, context: Dict[str, str], start_ns: int
+    ) -> Tuple[SQLValidationResult, Optional[SequentialChainResult]]:
+        """
+        Validate a generated query
+
+        Args:
+            sql_result: Successful SQLGenerationResult
+            context: Request context (session_id, user_query), shared with execution
+            start_ns: time.perf_counter_ns() at which processing of this query began
 
+        Returns:
+            Tuple of (validation result, error result or None if valid)
+        """
+        validation_result = self.sql_validator.validate_sql_with_context(
+            sql_result.sql_query, context
+        )
+
+        if validation_result.isValid:
+            return validation_result, None
+
+        # SQL validation failed - return error
+        error_msg = f"SQL validation failed: {validation_result.error}"
+        logger.error("[SEQUENTIAL_CHAIN] %s", error_msg)
+
+        result = create_error_result(
+            error_msg, "sql_validation_error", context["user_query"], context["session_id"]
+        )
+        result.sql_generation = sql_result
+        result.sql_validation = validation_result
+        result.total_processing_time_ms = _elapsed_ms(start_ns)
+        return validation_result, result
+
+    @staticmethod
+    def _generation_failed(
+        sql_result, user_query: str, session_id: str, start_ns: int
+    ) -> SequentialChainResult:
+        """
+        Build the error result for a failed SQL generation
+
+        Args:
+            sql_result: Failed SQLGenerationResult
+            user_query: Original user query for context
+            session_id: Session ID for tracking
+            start_ns: time.perf_counter_ns() at which processing began
+
+        Returns:
+            SequentialChainResult describing the failure
+        """
+        error_msg = f"SQL generation failed: {sql_result.error}"
+        logger.error("[SEQUENTIAL_CHAIN] %s", error_msg)
+
+        result = create_error_result(
+            error_msg, "sql_generation_error", user_query, session_id
+        )
+        result.sql_generation = sql_result
+        result.total_processing_time_ms = _elapsed_ms(start_ns)
+        return result
+
+    @staticmethod
+    def _execution_failed(
+        sql_result, validation_result, execution_result,
+        user_query: str, session_id: str, start_ns: int
+    ) -> SequentialChainResult:
+        """
+        Build the error result for a failed SQL execution
+
+        Args:
+            sql_result: Successful SQLGenerationResult
+            validation_result: Successful SQLValidationResult
+            execution_result: Failed SQLExecutionResult
+            user_query: Original user query for context
+            session_id: Session ID for tracking
+            start_ns: time.perf_counter_ns() at which processing began
+
+        Returns:
+            SequentialChainResult describing the failure
+        """
+        error_msg = f"SQL execution failed: {execution_result.error}"
+        logger.error("[SEQUENTIAL_CHAIN] %s", error_msg)
+
+        result = create_error_result(
+            error_msg, "sql_execution_error", user_query, session_id
+        )
+        result.sql_generation = sql_result
+        result.sql_validation = validation_result
+        result.sql_execution = execution_result
+        result.total_processing_time_ms = _elapsed_ms(start_ns)
+        return result
+
+    @staticmethod
+    def _chain_failed(
+        e: Exception, user_query: str, session_id: str, start_ns: int
+    ) -> SequentialChainResult:
+        """
+        Build the error result for an unexpected error in chain processing
+
+        Args:
+            e: Exception that ended processing
+            user_query: Original user query for context
+            session_id: Session ID for tracking
+            start_ns: time.perf_counter_ns() at which processing began
+
+        Returns:
+            SequentialChainResult describing the failure
+        """
+        total_time_ms = _elapsed_ms(start_ns)
+        error_msg = f"Sequential chain processing failed: {str(e)}"
+
+        logger.error("[SEQUENTIAL_CHAIN] %s (after %.2fms)", error_msg, total_time_ms)
+
+        result = create_error_result(
+            error_msg, "chain_error", user_query, session_id
+        )
+        result.total_processing_time_ms = total_time_ms
+        return result
+
+    def _build_final_result(
+        self, sql_result, validation_result, execution_result, summary_result,
+        user_query: str, session_id: str, start_ns: int
+    ) -> SequentialChainResult:
+        """
+        Build the chain result once summarization has run
+
+        Args:
+            sql_result: Successful SQLGenerationResult
+            validation_result: Successful SQLValidationResult
+            execution_result: Successful SQLExecutionResult
+            summary_result: DataSummaryResult, successful or not
+            user_query: Original user query for context
+            session_id: Session ID for tracking
+            start_ns: time.perf_counter_ns() at which processing began
+
+        Returns:
+            SequentialChainResult with final response or error
+        """
+        if not summary_result.success:
+            # Data summarization failed - return raw data as fallback
+            logger.warning(
+                "[SEQUENTIAL_CHAIN] Data summarization failed: %s", summary_result.error
+            )
+
+            if self.config.enable_fallback_to_data:
+                # Create complete DataSummaryResult for fallback
+                from ..models.response_models import DataSummaryResult
+
+                fallback_text = self.data_summarizer.create_fallback_summary(
+                    execution_result, user_query
+                )
+
+                fallback_result = DataSummaryResult(
+                    success=True,
+                    summary=fallback_text,
+                    html_summary=_FALLBACK_SUMMARY_HTML % self.data_summarizer.fallback_summary_html(fallback_text),
+                    markdown_data=self.data_summarizer.convert_data_to_markdown_table(execution_result.data),
+                    key_insights=["LLM summarization failed", f"Retrieved {execution_result.row_count} records"],
+                    data_points_analyzed=execution_result.row_count,
+                    summary_time_ms=0.0,
+                    prompt_tokens=0,
+                    completion_tokens=0
+                )
+
+                result = create_success_result(
+                    fallback_result, "data", user_query, session_id
+                )
+                result.sql_generation = sql_result
+                result.sql_validation = validation_result
+                result.sql_execution = execution_result
+                result.data_summary = fallback_result
+                result.total_processing_time_ms = _elapsed_ms(start_ns)
+                return result
+            else:
+                # Return error if fallback is disabled
+                error_msg = f"Data summarization failed: {summary_result.error}"
                 result = create_error_result(
-                    error_msg, "sql_execution_error", user_query, session_id
+                    error_msg, "data_summarization_error", user_query, session_id
                 )
                 result.sql_generation = sql_result
                 result.sql_validation = validation_result
                 result.sql_execution = execution_result
-                result.total_processing_time_ms = (time.time() - start_time) * 1000
+                result.data_summary = summary_result
+                result.total_processing_time_ms = _elapsed_ms(start_ns)
                 return result
 
-            # Step 4: Data Summarization
-            summary_result = self.data_summarizer.summarize_data(
-                execution_result, user_query, sql_result.sql_query
-            )
+        # All steps successful - return DataSummaryResult object
+        result = create_success_result(
+            summary_result, "summary", user_query, session_id
+        )
+        result.sql_generation = sql_result
+        result.sql_validation = validation_result
+        result.sql_execution = execution_result
+        result.data_summary = summary_result
+        result.total_processing_time_ms = _elapsed_ms(start_ns)
+
+        return result
+
+    def process_batch(
+        self,
+        final_prompt: str,
+        app_state,
+        user_queries: List[str],
+        session_ids: Optional[List[str]] = None,
+    ) -> List[SequentialChainResult]:
+        """
+        Process several analytics queries that share one prompt
 
-            if not summary_result.success:
-                # Data summarization failed - return raw data as fallback
-                logger.warning(
-                    f"[SEQUENTIAL_CHAIN] Data summarization failed: {summary_result.error}"
-                )
+        SQL for all queries is generated with a single LLM call; validation,
+        execution and summarization then run per query.
 
-                if self.config.enable_fallback_to_data:
-                    # Create complete DataSummaryResult for fallback
-                    from ..models.response_models import DataSummaryResult
-                    
-                    fallback_text = self.data_summarizer.create_fallback_summary(
-                        execution_result, user_query
-                    )
-                    
-                    fallback_result = DataSummaryResult(
-                        success=True,
-                        summary=fallback_text,
-                        html_summary=f"<p><strong>Fallback Summary:</strong> {fallback_text.replace('•', '<strong>•</strong>')}</p>",
-                        markdown_data=self.data_summarizer.convert_data_to_markdown_table(execution_result.data),
-                        key_insights=["LLM summarization failed", f"Retrieved {execution_result.row_count} records"],
-                        data_points_analyzed=execution_result.row_count,
-                        summary_time_ms=0.0,
-                        prompt_tokens=0,
-                        completion_tokens=0
-                    )
+        Args:
+            final_prompt: Batched prompt listing the queries as Q[1]..Q[n]
+            app_state: Application state with database connections
+            user_queries: Original user queries, in Q[i] order
+            session_ids: Session IDs matching user_queries
 
-                    result = create_success_result(
-                        fallback_result, "data", user_query, session_id
+        Returns:
+            One SequentialChainResult per query, in the same order
+        """
+        start_ns = time.perf_counter_ns()
+        session_ids = session_ids or [""] * len(user_queries)
+
+        sql_results = self.sql_generator.generate_sql_batch(
+            final_prompt, len(user_queries)
+        )
+
+        results = []
+        for sql_result, user_query, session_id in zip(
+            sql_results, user_queries, session_ids
+        ):
+            try:
+                if not sql_result.success:
+                    error_msg = f"SQL generation failed: {sql_result.error}"
+                    logger.error("[SEQUENTIAL_CHAIN] %s", error_msg)
+
+                    result = create_error_result(
+                        error_msg, "sql_generation_error", user_query, session_id
                     )
                     result.sql_generation = sql_result
-                    result.sql_validation = validation_result
-                    result.sql_execution = execution_result
-                    result.data_summary = fallback_result
-                    result.total_processing_time_ms = (time.time() - start_time) * 1000
-                    return result
+                    result.total_processing_time_ms = _elapsed_ms(start_ns)
                 else:
-                    # Return error if fallback is disabled
-                    error_msg = f"Data summarization failed: {summary_result.error}"
-                    result = create_error_result(
-                        error_msg, "data_summarization_error", user_query, session_id
+                    result = self._process_generated_sql(
+                        sql_result, app_state, user_query, session_id, start_ns
                     )
-                    result.sql_generation = sql_result
-                    result.sql_validation = validation_result
-                    result.sql_execution = execution_result
-                    result.data_summary = summary_result
-                    result.total_processing_time_ms = (time.time() - start_time) * 1000
-                    return result
 
-            # All steps successful - return DataSummaryResult object
-            result = create_success_result(
-                summary_result, "summary", user_query, session_id
-            )
-            result.sql_generation = sql_result
-            result.sql_validation = validation_result
-            result.sql_execution = execution_result
-            result.data_summary = summary_result
-            result.total_processing_time_ms = (time.time() - start_time) * 1000
+            except Exception as e:
+                error_msg = f"Sequential chain processing failed: {str(e)}"
+                logger.error("[SEQUENTIAL_CHAIN] %s", error_msg)
 
-            return result
+                result = create_error_result(
+                    error_msg, "chain_error", user_query, session_id
+                )
+                result.total_processing_time_ms = _elapsed_ms(start_ns)
 
-        except Exception as e:
-            # Unexpected error in chain processing
-            total_time_ms = (time.time() - start_time) * 1000
-            error_msg = f"Sequential chain processing failed: {str(e)}"
+            results.append(result)
 
-            logger.error(
-                f"[SEQUENTIAL_CHAIN] {error_msg} (after {total_time_ms:.2f}ms)"
-            )
-
-            result = create_error_result(
-                error_msg, "chain_error", user_query, session_id
-            )
-            result.total_processing_time_ms = total_time_ms
-            return result
+        return results
 
     def process_with_retry(
         self, final_prompt: str, app_state, user_query: str = "", session_id: str = ""
@@ -228,6 +685,12 @@ class SequentialChain:
         last_result = None
 
         for attempt in range(self.config.max_retries + 1):
+            if attempt:
+                delay = self._retry_delay(attempt, last_result)
+                if delay is None:
+                    break
+                time.sleep(delay)
+
             try:
                 result = self.process(final_prompt, app_state, user_query, session_id)
 
@@ -237,14 +700,11 @@ class SequentialChain:
                 last_result = result
 
                 # Don't retry certain types of errors
-                if result.response_type in [
-                    "sql_validation_error",
-                    "sql_execution_error",
-                ]:
+                if result.response_type in _NON_RETRYABLE:
                     break
 
             except Exception as e:
-                logger.error(f"[SEQUENTIAL_CHAIN] Retry attempt {attempt} failed: {e}")
+                logger.error("[SEQUENTIAL_CHAIN] Retry attempt %s failed: %s", attempt, e)
                 if attempt == self.config.max_retries:
                     return create_error_result(
                         f"All retry attempts failed: {str(e)}",
@@ -257,10 +717,45 @@ class SequentialChain:
             "Processing failed with no result", "unknown_error", user_query, session_id
         )
 
+    @staticmethod
+    def _retry_delay(
+        attempt: int, last_result: Optional[SequentialChainResult]
+    ) -> Optional[float]:
+        """
+        Seconds to wait before a retry
+
+        A provider Retry-After is honoured as is; otherwise the delay is
+        drawn uniformly from [0, min(cap, base * 2**attempt)] so concurrent
+        clients do not retry in lockstep.
+
+        Args:
+            attempt: Number of the attempt about to start (1 for the first retry)
+            last_result: Result of the previous attempt, if it returned one
+
+        Returns:
+            Delay in seconds, or None if the provider asked for a wait longer
+            than the backoff cap and retrying is pointless
+        """
+        generation = last_result.sql_generation if last_result else None
+        retry_after = generation.retry_after_seconds if generation else None
+        if retry_after is not None:
+            if retry_after > _RETRY_BACKOFF_CAP:
+                logger.warning(
+                    "[SEQUENTIAL_CHAIN] Provider asked to retry after %.1fs, giving up", retry_after
+                )
+                return None
+            return retry_after
+
+        return random.uniform(0, min(_RETRY_BACKOFF_CAP, _RETRY_BACKOFF_BASE * 2 ** attempt))
+
     def health_check(self, app_state) -> dict:
         """
         Perform comprehensive health check on all services
 
+        The generator, executor and summarizer probes each wait on the
+        network, so they run side by side; total latency is the slowest
+        probe rather than the sum.
+
         Args:
             app_state: Application state for database testing
 
@@ -268,47 +763,97 @@ class SequentialChain:
             Health status dictionary
         """
         try:
-            health_status = {
-                "status": "healthy",
-                "services": {},
-                "overall_status": "healthy",
-            }
+            with ThreadPoolExecutor(max_workers=3) as pool:
+                generator = pool.submit(self.sql_generator.health_check)
+                executor = pool.submit(self.sql_executor.health_check, app_state)
+                summarizer = pool.submit(self.data_summarizer.health_check)
+
+                # Validation is local CPU work
+                validator_health = self.sql_validator.health_check()
+
+                return self._combine_health(
+                    generator.result(),
+                    validator_health,
+                    executor.result(),
+                    summarizer.result(),
+                )
 
-            # Check SQL Generator
-            generator_health = self.sql_generator.health_check()
-            health_status["services"]["sql_generator"] = generator_health
+        except Exception as e:
+            return {
+                "status": "unhealthy",
+                "error": str(e),
+                "overall_status": "unhealthy",
+            }
 
-            # Check SQL Validator
-            validator_health = self.sql_validator.health_check()
-            health_status["services"]["sql_validator"] = validator_health
+    async def ahealth_check(self, app_state) -> dict:
+        """
+        Async counterpart of health_check
 
-            # Check SQL Executor
-            executor_health = self.sql_executor.health_check(app_state)
-            health_status["services"]["sql_executor"] = executor_health
+        Args:
+            app_state: Application state for database testing
 
-            # Check Data Summarizer
-            summarizer_health = self.data_summarizer.health_check()
-            health_status["services"]["data_summarizer"] = summarizer_health
+        Returns:
+            Health status dictionary
+        """
+        results = await asyncio.gather(
+            self.sql_generator.ahealth_check(),
+            self.sql_executor.ahealth_check(app_state),
+            self.data_summarizer.ahealth_check(),
+            return_exceptions=True,
+        )
+        generator_health, executor_health, summarizer_health = (
+            {"status": "unhealthy", "error": str(result)}
+            if isinstance(result, BaseException) else result
+            for result in results
+        )
 
-            # Determine overall health
-            unhealthy_services = [
-                name
-                for name, status in health_status["services"].items()
-                if status.get("status") != "healthy"
-            ]
+        return self._combine_health(
+            generator_health,
+            self.sql_validator.health_check(),
+            executor_health,
+            summarizer_health,
+        )
 
-            if unhealthy_services:
-                health_status["overall_status"] = "degraded"
-                health_status["unhealthy_services"] = unhealthy_services
+    @staticmethod
+    def _combine_health(
+        generator_health: dict, validator_health: dict,
+        executor_health: dict, summarizer_health: dict,
+    ) -> dict:
+        """
+        Combine per-service health into the overall status
 
-            return health_status
+        Args:
+            generator_health: SQL generator health
+            validator_health: SQL validator health
+            executor_health: SQL executor health
+            summarizer_health: Data summarizer health
 
-        except Exception as e:
-            return {
-                "status": "unhealthy",
-                "error": str(e),
-                "overall_status": "unhealthy",
-            }
+        Returns:
+            Health status dictionary
+        """
+        health_status = {
+            "status": "healthy",
+            "services": {
+                "sql_generator": generator_health,
+                "sql_validator": validator_health,
+                "sql_executor": executor_health,
+                "data_summarizer": summarizer_health,
+            },
+            "overall_status": "healthy",
+        }
+
+        # Determine overall health
+        unhealthy_services = [
+            name
+            for name, status in health_status["services"].items()
+            if status.get("status") != "healthy"
+        ]
+
+        if unhealthy_services:
+            health_status["overall_status"] = "degraded"
+            health_status["unhealthy_services"] = unhealthy_services
+
+        return health_status
 
     def get_stats(self) -> dict:
         """
@@ -327,7 +872,11 @@ class SequentialChain:
                 "services": {
                     "sql_validator": self.sql_validator.get_validation_stats(),
                     "sql_executor": self.sql_executor.get_execution_stats(),
+                    "data_summarizer": self.data_summarizer.get_summary_stats(),
                 },
+                "semantic_cache": (
+                    self.semantic_cache.get_stats() if self.semantic_cache else None
+                ),
             }
         except Exception as e:
             return {"error": str(e), "status": "error"}
@@ -346,6 +895,7 @@ class SequentialChain:
         self.sql_validator.update_config(new_config.validation_config)
         self.sql_executor.update_config(new_config.execution_config)
         self.data_summarizer.update_config(new_config.llm_config)
+        self._configure_semantic_cache()
 
     def test_end_to_end(self, app_state) -> dict:
         """
@@ -358,21 +908,10 @@ class SequentialChain:
             Test result dictionary
         """
         try:
-            test_prompt = """
-[SYSTEM CONTEXT]
-You are a payment analytics assistant.
-
-[TOOL CONTEXT]
-Available tables: payment_intent (id, amount, status, created_at)
-
-[USER CONTEXT]
-User Query: Show me the total number of successful payments
-"""
-
             result = self.process(
-                final_prompt=test_prompt,
+                final_prompt=_TEST_PROMPT,
                 app_state=app_state,
-                user_query="Show me the total number of successful payments",
+                user_query=_TEST_QUERY,
                 session_id="test_session",
             )
 
@@ -10,6 +10,7 @@ from typing import Optional, List, Dict, Any
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from html import escape
 
 
 class QueryType(Enum):
@@ -21,7 +22,7 @@ class QueryType(Enum):
 
 
 # SQL Validation Result (referenced in your validation code)
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class SQLValidationResult:
     """Result of SQL validation process"""
     isValid: bool
@@ -31,7 +32,7 @@ class SQLValidationResult:
 
 
 # SQL Generation Result
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class SQLGenerationResult:
     """Result from LLM SQL generation"""
     success: bool
@@ -42,14 +43,19 @@ class SQLGenerationResult:
     generation_time_ms: Optional[float] = None
     prompt_tokens: Optional[int] = None
     completion_tokens: Optional[int] = None
+    # Prompt tokens the provider served from its prefix cache, if reported
+    cached_prompt_tokens: Optional[int] = None
+    # Retry-After the provider sent with a failed call (e.g. HTTP 429), in seconds
+    retry_after_seconds: Optional[float] = None
 
 
 # SQL Execution Result  
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class SQLExecutionResult:
     """Result from SQL execution against database"""
     success: bool
-    data: Optional[List[Dict[str, Any]]] = None
+    # Excluded from repr so logging a result never stringifies every row
+    data: Optional[List[Dict[str, Any]]] = field(default=None, repr=False)
     row_count: int = 0
     execution_time_ms: Optional[float] = None
     error: Optional[str] = None
@@ -59,7 +65,7 @@ class SQLExecutionResult:
 
 
 # Data Summary Result
-@dataclass  
+@dataclass(slots=True, kw_only=True)
 class DataSummaryResult:
     """Result from LLM data summarization"""
     success: bool
@@ -77,7 +83,7 @@ class DataSummaryResult:
 
 
 # Final Pipeline Result
-@dataclass
+@dataclass(slots=True, kw_only=True)
 class SequentialChainResult:
     """Complete result from the sequential chain pipeline"""
     success: bool
@@ -96,21 +102,23 @@ class SequentialChainResult:
     user_query: Optional[str] = None
     session_id: Optional[str] = None
     
-    # Token usage tracking
-    total_prompt_tokens: int = 0
-    total_completion_tokens: int = 0
+    # Token usage tracking; computed on access because the stage results
+    # are usually attached after construction
+    @property
+    def total_prompt_tokens(self) -> int:
+        """Prompt tokens used by SQL generation and summarization"""
+        return (
+            (self.sql_generation and self.sql_generation.prompt_tokens or 0)
+            + (self.data_summary and self.data_summary.prompt_tokens or 0)
+        )
     
-    def __post_init__(self):
-        """Calculate total token usage from individual stages"""
-        if self.sql_generation and self.sql_generation.prompt_tokens:
-            self.total_prompt_tokens += self.sql_generation.prompt_tokens
-        if self.sql_generation and self.sql_generation.completion_tokens:
-            self.total_completion_tokens += self.sql_generation.completion_tokens
-            
-        if self.data_summary and self.data_summary.prompt_tokens:
-            self.total_prompt_tokens += self.data_summary.prompt_tokens
-        if self.data_summary and self.data_summary.completion_tokens:
-            self.total_completion_tokens += self.data_summary.completion_tokens
+    @property
+    def total_completion_tokens(self) -> int:
+        """Completion tokens used by SQL generation and summarization"""
+        return (
+            (self.sql_generation and self.sql_generation.completion_tokens or 0)
+            + (self.data_summary and self.data_summary.completion_tokens or 0)
+        )
 
 
 # Configuration Models
@@ -129,6 +137,16 @@ class LLMConfig:
     # Summary-specific settings  
     summary_temperature: float = 0.3
     
+    # Async calls arriving within batch_window_ms are dispatched together
+    # (0 disables coalescing)
+    batch_window_ms: float = 8.0
+    batch_max_size: int = 16
+    
+    # Reuse the summary of an identical query over identical rows for this
+    # many seconds (0 disables)
+    summary_cache_ttl_seconds: int = 0
+    summary_cache_max_entries: int = 1024
+    
     @classmethod
     def from_app_state(cls, app_state):
         """
@@ -150,6 +168,7 @@ class LLMConfig:
             timeout_seconds=ai_config.get('timeout_seconds', 30),
             sql_generation_temperature=ai_config.get('sql_generation_temperature', 0.1),
             summary_temperature=ai_config.get('summary_temperature', 0.3),
+            summary_cache_ttl_seconds=ai_config.get('summary_cache_ttl', 0),
         )
         
         return config
@@ -174,6 +193,26 @@ class ExecutionConfig:
     enable_query_logging: bool = True
     enable_result_caching: bool = False
     cache_ttl_seconds: int = 300
+    cache_max_entries: int = 1024
+    
+    @classmethod
+    def from_app_state(cls, app_state):
+        """
+        Create ExecutionConfig from app_state configuration
+        
+        Args:
+            app_state: Application state instance with loaded configuration
+            
+        Returns:
+            ExecutionConfig instance; result caching is on when
+            mysql.result_cache_ttl is positive
+        """
+        cache_ttl = app_state.config.get('mysql', {}).get('result_cache_ttl', 0)
+        
+        return cls(
+            enable_result_caching=cache_ttl > 0,
+            cache_ttl_seconds=cache_ttl if cache_ttl > 0 else 300,
+        )
 
 
 @dataclass
@@ -188,6 +227,11 @@ class ChainConfig:
     enable_retry_on_failure: bool = False
     max_retries: int = 1
     
+    # Reuse results for semantically equivalent queries (needs sentence-transformers)
+    enable_semantic_cache: bool = False
+    semantic_cache_threshold: float = 0.95
+    semantic_cache_ttl_seconds: int = 300
+    
     # Logging and monitoring
     enable_detailed_logging: bool = True
     enable_performance_tracking: bool = True
@@ -236,13 +280,16 @@ class DataSummarizationError(ChainError):
 
 
 # Utility functions for result creation
+_ERROR_HTML = "<p><strong>Error:</strong> %s</p>"
+
+
 def create_error_result(error_message: str, error_type: str = "error", 
                        user_query: str = None, session_id: str = None) -> SequentialChainResult:
     """Create a standardized error result with DataSummaryResult"""
     error_summary = DataSummaryResult(
         success=False,
         error=error_message,
-        html_summary=f"<p><strong>Error:</strong> {error_message}</p>",
+        html_summary=_ERROR_HTML % escape(error_message, quote=False),
         markdown_data="No data available due to error",
         key_insights=[f"Error occurred: {error_type}"],
         data_points_analyzed=0,
@@ -6,16 +6,34 @@ Contains individual processing services for the sequential chain:
 - SQL Validator: Validates SQL using security checks
 - SQL Executor: Executes SQL against MySQL database
 - Data Summarizer: Generates summaries using LLM
+- Semantic Cache: Reuses results for semantically equivalent queries
 """
 
-from .sql_generator import SQLGeneratorService
-from .sql_validator import SQLValidatorService
-from .sql_executor import SQLExecutorService
-from .data_summarizer import DataSummarizerService
+import importlib
+
+# Exported name -> defining submodule, imported on first access (PEP 562)
+# so loading one service does not load the LLM client graph of the others
+_LAZY = {
+    'SQLGeneratorService': '.sql_generator',
+    'SQLValidatorService': '.sql_validator',
+    'SQLExecutorService': '.sql_executor',
+    'DataSummarizerService': '.data_summarizer',
+    'SemanticCache': '.semantic_cache',
+}
 
 __all__ = [
     'SQLGeneratorService',
     'SQLValidatorService',
     'SQLExecutorService',
-    'DataSummarizerService'
+    'DataSummarizerService',
+    'SemanticCache'
 ]
+
+
+def __getattr__(name):
+    """Import a re-exported service on first access and cache it on the package"""
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,173 @@
+"""
+Async Micro-Batcher
+
+Coalesces calls that arrive within a few milliseconds of each other into
+one batch handed to a handler, so concurrent requests share a single
+dispatch (and identical requests a single result).
+"""
+
+import asyncio
+import functools
+import logging
+from typing import Any, Awaitable, Callable, Generic, Hashable, List, Optional, Set, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class AsyncBatcher(Generic[T, R]):
+    """
+    Collects submitted items for up to ``max_wait_ms`` or ``max_batch``
+    items, whichever comes first, then dispatches them together
+
+    The handler receives the batch and returns one result per item, in
+    order; a result that is an exception is raised to that item's caller
+    only. No background task is kept: the first item of a window arms a
+    timer on the running loop, and each batch is dispatched as its own task
+    so collection of the next window is never blocked by an in-flight one.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[List[T]], Awaitable[List[Any]]],
+        max_batch: int = 16,
+        max_wait_ms: float = 8,
+        key: Optional[Callable[[T], Hashable]] = None,
+    ):
+        """
+        Initialize Async Batcher
+
+        Args:
+            handler: Coroutine function mapping a list of items to a list of results
+            max_batch: Maximum items per dispatch
+            max_wait_ms: Longest an item waits for companions
+            key: Optional identity for items; equal keys within a window are
+                dispatched once and share the result
+        """
+        self._handler = handler
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._key = key
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: List[Tuple[T, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # The loop keeps only weak references to tasks
+        self._dispatching: Set[asyncio.Task] = set()
+
+        self.batches = 0
+        self.items = 0
+
+    async def submit(self, item: T) -> R:
+        """
+        Queue an item and wait for its result
+
+        Args:
+            item: Item to process
+
+        Returns:
+            The handler's result for this item
+        """
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            # Bind to the caller's loop; anything pending belongs to a dead one
+            self._loop = loop
+            self._pending = []
+            self._timer = None
+            self._dispatching = set()
+
+        future = loop.create_future()
+        self._pending.append((item, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Hand the current window to a dispatch task"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = self._loop.create_task(self._dispatch(batch))
+            self._dispatching.add(task)
+            task.add_done_callback(functools.partial(self._dispatch_done, batch))
+
+    def _dispatch_done(
+        self, batch: List[Tuple[T, asyncio.Future]], task: asyncio.Task
+    ) -> None:
+        """
+        Forget a finished dispatch task and release any caller it left waiting
+
+        A task cancelled before or during the handler call resolves none of
+        its futures; cancelling them is a no-op for futures already resolved.
+
+        Args:
+            batch: (item, future) pairs the task dispatched
+            task: Finished dispatch task
+        """
+        self._dispatching.discard(task)
+        for _, future in batch:
+            future.cancel()
+
+    async def _dispatch(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        """
+        Run the handler for one window and resolve its futures
+
+        Args:
+            batch: (item, future) pairs collected in one window
+        """
+        # Group equal items so each is sent once
+        if self._key is None:
+            groups = [[future] for _, future in batch]
+            items = [item for item, _ in batch]
+        else:
+            slots = {}
+            groups, items = [], []
+            for item, future in batch:
+                slot = slots.setdefault(self._key(item), len(items))
+                if slot == len(items):
+                    items.append(item)
+                    groups.append([])
+                groups[slot].append(future)
+
+        self.batches += 1
+        self.items += len(batch)
+        logger.debug("Dispatching batch of %d items (%d unique)", len(batch), len(items))
+
+        try:
+            results = await self._handler(items)
+            if len(results) != len(items):
+                raise RuntimeError(f"Batch handler returned {len(results)} results for {len(items)} items")
+        except Exception as e:
+            results = [e] * len(items)
+
+        for futures, result in zip(groups, results):
+            for future in futures:
+                if future.done():
+                    # Caller was cancelled while waiting
+                    continue
+                if isinstance(result, BaseException):
+                    future.set_exception(result)
+                else:
+                    future.set_result(result)
+
+    def get_stats(self) -> dict:
+        """
+        Get batching statistics
+
+        Returns:
+            Dictionary with dispatch and item counts
+        """
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch_size": self.items / self.batches if self.batches else 0.0,
+        }
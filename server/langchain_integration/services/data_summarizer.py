@@ -5,16 +5,28 @@ Uses LangChain with LLM to generate summaries of SQL query results.
 This is the second LLM call in the sequential chain.
 """
 
+import asyncio
+import contextlib
+import copy
+import hashlib
+import json
 import logging
+import re
+import threading
 import time
 import os
-import json
-from typing import Optional, List, Dict, Any
+from collections import Counter, OrderedDict
+from html import escape, unescape
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple, Union
 
+import orjson
 from langchain_openai import ChatOpenAI
-from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 
+from .async_batcher import AsyncBatcher
+from .http_clients import llm_http_clients
+from .token_counter import count_tokens
+from .vllm_backend import VLLMDirectBackend, is_local_llm
 from ..models.response_models import (
     DataSummaryResult,
     DataSummarizationError,
@@ -24,6 +36,67 @@ from ..models.response_models import (
 
 logger = logging.getLogger(__name__)
 
+_FALLBACK_HTML = "<p>%s</p>"
+
+# The prompt asks for key insights inside <strong> (and figures inside <em>)
+_MARKED_INSIGHT_RE = re.compile(r"<(strong|em)\b[^>]*>(.*?)</\1\s*>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+# Fixed parts of the summary prompt; _build_chain_input fills in the query
+# and its results between them
+_SUMMARY_PROMPT_INTRO = """
+You are an expert data analyst specializing in payment analytics. Your task is to analyze SQL query results and provide clear, actionable insights.
+
+"""
+
+_SUMMARY_PROMPT_INSTRUCTIONS = """
+INSTRUCTIONS:
+1. Provide a clear, concise summary of the data in EXACTLY 60 words or less (2-3 sentences maximum)
+2. Format your response as HTML using basic tags: <p>, <strong>, <em>, <span>
+3. Highlight key insights and patterns with <strong> tags
+4. Use business-friendly language (avoid technical jargon)
+5. Include specific numbers and percentages where relevant
+6. Focus on the most important findings only
+
+Example format: <p><strong>Sales analysis</strong> reveals 1,250 transactions totaling <em>$45,678</em>. Peak activity occurred on weekends with <strong>15% higher volume</strong> than weekdays.</p>
+
+HTML Summary:"""
+
+
+def _markdown_cell(value: Any) -> str:
+    """
+    Format one value as a markdown table cell
+
+    Args:
+        value: Cell value from a result row
+
+    Returns:
+        Cell text, with pipes escaped and newlines flattened
+    """
+    if value is None:
+        return "null"
+    if isinstance(value, str):
+        # Escape special markdown characters
+        return value.replace("|", "\\|").replace("\n", " ")
+    return str(value)
+
+
+def _row_json(row: Dict[str, Any]) -> str:
+    """
+    Serialize one result row for the summary prompt
+
+    Args:
+        row: Row from SQL execution
+
+    Returns:
+        Compact JSON text; values JSON cannot express are stringified
+    """
+    try:
+        return orjson.dumps(row, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
+    except orjson.JSONEncodeError:
+        # orjson rejects integers beyond 64 bits before default=str is tried
+        return json.dumps(row, default=str, separators=(",", ":"))
+
 
 class DataSummarizerService:
     """Service for generating summaries of SQL query results using LLM"""
@@ -38,8 +111,17 @@ class DataSummarizerService:
         self.config = config or LLMConfig()
         self.llm = None
         self.chain = None
+        self._batcher: Optional[AsyncBatcher] = None
+
+        # LRU of successful summaries: key -> (result, monotonic expiry)
+        self._summary_cache: "OrderedDict[bytes, Tuple[DataSummaryResult, float]]" = OrderedDict()
+        self._summary_cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
         self._initialize_llm()
         self._initialize_chain()
+        self._initialize_batcher()
 
     def _initialize_llm(self) -> None:
         """Initialize the LLM with configuration"""
@@ -49,13 +131,14 @@ class DataSummarizerService:
             api_base = self.config.api_base
             model_name = self.config.model_name
 
-            # Check if configuration is available
-            if not api_key or not api_base or not model_name:
+            # Check if configuration is available; local models need no key
+            if not (api_key or is_local_llm(api_base)) or not api_base or not model_name:
                 logger.warning(
-                    f"[DATA_SUMMARIZER] LLM configuration incomplete - "
-                    f"API Key: {'SET' if api_key else 'MISSING'}, "
-                    f"API Base: {'SET' if api_base else 'MISSING'}, "
-                    f"Model: {'SET' if model_name else 'MISSING'}"
+                    "[DATA_SUMMARIZER] LLM configuration incomplete - "
+                    "API Key: %s, API Base: %s, Model: %s",
+                    "SET" if api_key else "MISSING",
+                    "SET" if api_base else "MISSING",
+                    "SET" if model_name else "MISSING",
                 )
                 logger.warning(
                     "[DATA_SUMMARIZER] LLM will be initialized when proper config is available"
@@ -63,6 +146,14 @@ class DataSummarizerService:
                 self.llm = None
                 return
 
+            if is_local_llm(api_base):
+                # Self-hosted model served in-process by vLLM
+                self.llm = VLLMDirectBackend(
+                    model_name=model_name,
+                    temperature=self.config.summary_temperature,
+                )
+                return
+
             # Initialize ChatOpenAI with Google AI endpoint
             # Use slightly higher temperature for more creative summaries
             self.llm = ChatOpenAI(
@@ -71,10 +162,11 @@ class DataSummarizerService:
                 openai_api_key=api_key,
                 temperature=self.config.summary_temperature,
                 timeout=self.config.timeout_seconds,
+                **llm_http_clients(api_base, self.config.timeout_seconds),
             )
 
         except Exception as e:
-            logger.error(f"Failed to initialize LLM: {e}")
+            logger.error("Failed to initialize LLM: %s", e)
             self.llm = None
             logger.warning(
                 "[DATA_SUMMARIZER] LLM initialization failed, will retry when config is updated"
@@ -83,63 +175,93 @@ class DataSummarizerService:
     def _initialize_chain(self) -> None:
         """Initialize the LangChain chain for data summarization"""
         try:
-            # Create prompt template for data summarization
-            summary_prompt_template = """
-You are an expert data analyst specializing in payment analytics. Your task is to analyze SQL query results and provide clear, actionable insights.
+            # The prompt is rendered by _build_chain_input, so the chain takes
+            # the finished text and skips PromptTemplate formatting and
+            # input-variable validation on every call
+            output_parser = StrOutputParser()
+            self.chain = self.llm | output_parser
 
-Original User Query: {user_query}
+        except Exception as e:
+            logger.error("Failed to initialize chain: %s", e)
+            raise DataSummarizationError(f"Chain initialization failed: {e}", e)
 
-SQL Query Executed: {sql_query}
+    def _initialize_batcher(self) -> None:
+        """Coalesce concurrent async summaries unless disabled by config"""
+        self._batcher = None
+        if self.config.batch_window_ms > 0:
+            self._batcher = AsyncBatcher(
+                self._asummarize_window,
+                max_batch=self.config.batch_max_size,
+                max_wait_ms=self.config.batch_window_ms,
+            )
 
-Query Results:
-{data_summary}
+    async def _asummarize_window(self, chain_inputs: List[str]) -> List[object]:
+        """
+        Run one coalesced window of summaries over the shared async client
 
-Data Details:
-- Total Rows: {row_count}
-- Columns: {columns}
-- Execution Time: {execution_time_ms}ms
+        Args:
+            chain_inputs: Summary prompts collected by the batcher
 
-INSTRUCTIONS:
-1. Provide a clear, concise summary of the data in EXACTLY 60 words or less (2-3 sentences maximum)
-2. Format your response as HTML using basic tags: <p>, <strong>, <em>, <span>
-3. Highlight key insights and patterns with <strong> tags
-4. Use business-friendly language (avoid technical jargon)
-5. Include specific numbers and percentages where relevant
-6. Focus on the most important findings only
+        Returns:
+            One summary string or exception per input, in order
+        """
+        return await self.chain.abatch(chain_inputs, return_exceptions=True)
 
-Example format: <p><strong>Sales analysis</strong> reveals 1,250 transactions totaling <em>$45,678</em>. Peak activity occurred on weekends with <strong>15% higher volume</strong> than weekdays.</p>
+    def summarize_data(
+        self,
+        execution_result: SQLExecutionResult,
+        user_query: str = "",
+        sql_query: str = "",
+    ) -> DataSummaryResult:
+        """
+        Generate summary of SQL execution results
 
-HTML Summary:"""
+        Args:
+            execution_result: Result from SQL execution
+            user_query: Original user query for context
+            sql_query: SQL query that was executed
 
-            # Create prompt template
-            prompt = PromptTemplate(
-                input_variables=[
-                    "user_query",
-                    "sql_query",
-                    "data_summary",
-                    "row_count",
-                    "columns",
-                    "execution_time_ms",
-                ],
-                template=summary_prompt_template,
+        Returns:
+            DataSummaryResult with summary or error
+        """
+        start_time = time.time()
+
+        try:
+            early_result = self._summarize_without_llm(
+                execution_result, user_query, start_time
             )
+            if early_result:
+                return early_result
 
-            # Create chain with output parser
-            output_parser = StrOutputParser()
-            self.chain = prompt | self.llm | output_parser
+            cache_key = self._summary_cache_key(execution_result, user_query, sql_query)
+            cached = self._get_cached_summary(cache_key, start_time)
+            if cached:
+                return cached
+
+            chain_input = self._build_chain_input(
+                execution_result, user_query, sql_query
+            )
+
+            # Generate HTML summary using the chain
+            html_summary_text = self.chain.invoke(chain_input)
+
+            result = self._build_summary_result(
+                html_summary_text, chain_input, execution_result, start_time
+            )
+            self._store_cached_summary(cache_key, result)
+            return result
 
         except Exception as e:
-            logger.error(f"Failed to initialize chain: {e}")
-            raise DataSummarizationError(f"Chain initialization failed: {e}", e)
+            return self._summary_failed(e, execution_result, start_time)
 
-    def summarize_data(
+    async def asummarize_data(
         self,
         execution_result: SQLExecutionResult,
         user_query: str = "",
         sql_query: str = "",
     ) -> DataSummaryResult:
         """
-        Generate summary of SQL execution results
+        Generate summary of SQL execution results without blocking the event loop
 
         Args:
             execution_result: Result from SQL execution
@@ -152,108 +274,573 @@ HTML Summary:"""
         start_time = time.time()
 
         try:
-            # Validate input
-            if not execution_result:
-                return DataSummaryResult(
-                    success=False, error="No execution result provided"
-                )
+            early_result = self._summarize_without_llm(
+                execution_result, user_query, start_time
+            )
+            if early_result:
+                return early_result
 
-            if not execution_result.success:
-                return DataSummaryResult(
-                    success=False,
-                    error=f"Cannot summarize failed execution: {execution_result.error}",
-                )
+            cache_key = self._summary_cache_key(execution_result, user_query, sql_query)
+            cached = self._get_cached_summary(cache_key, start_time)
+            if cached:
+                return cached
 
-            # Check if LLM is initialized
-            if not self.llm or not self.chain:
-                logger.warning(
-                    "[DATA_SUMMARIZER] LLM not initialized, creating fallback summary"
-                )
-                fallback_summary = self.create_fallback_summary(
-                    execution_result, user_query
+            chain_input = self._build_chain_input(
+                execution_result, user_query, sql_query
+            )
+
+            if self._batcher:
+                llm_call = self._batcher.submit(chain_input)
+            else:
+                llm_call = self.chain.ainvoke(chain_input)
+
+            # The table and data insights are CPU work that does not depend
+            # on the summary, so they are built while the LLM call is in flight
+            local_parts, html_summary_text = await asyncio.gather(
+                asyncio.to_thread(self._local_summary_parts, execution_result.data),
+                llm_call,
+            )
+
+            result = self._build_summary_result(
+                html_summary_text, chain_input, execution_result, start_time, local_parts
+            )
+            self._store_cached_summary(cache_key, result)
+            return result
+
+        except Exception as e:
+            return self._summary_failed(e, execution_result, start_time)
+
+    def summarize_batch(
+        self, requests: List[Tuple[SQLExecutionResult, str, str]]
+    ) -> List[DataSummaryResult]:
+        """
+        Summarize several results, running their LLM calls concurrently
+
+        Args:
+            requests: (execution_result, user_query, sql_query) tuples
+
+        Returns:
+            One DataSummaryResult per request, in the same order
+        """
+        start_time = time.time()
+        results, pending = self._start_batch(requests, start_time)
+
+        if pending:
+            outputs = self.chain.batch(
+                [chain_input for _, chain_input, _ in pending],
+                config={"max_concurrency": self.config.batch_max_size},
+                return_exceptions=True,
+            )
+            self._finish_batch(requests, results, pending, outputs, start_time)
+
+        return results
+
+    async def asummarize_batch(
+        self, requests: List[Tuple[SQLExecutionResult, str, str]]
+    ) -> List[DataSummaryResult]:
+        """
+        Summarize several results without blocking the event loop
+
+        Args:
+            requests: (execution_result, user_query, sql_query) tuples
+
+        Returns:
+            One DataSummaryResult per request, in the same order
+        """
+        start_time = time.time()
+        results, pending = self._start_batch(requests, start_time)
+
+        if pending:
+            datasets = [requests[index][0].data for index, _, _ in pending]
+            outputs, local_parts = await asyncio.gather(
+                self.chain.abatch(
+                    [chain_input for _, chain_input, _ in pending],
+                    config={"max_concurrency": self.config.batch_max_size},
+                    return_exceptions=True,
+                ),
+                asyncio.to_thread(
+                    lambda: [self._local_summary_parts(data) for data in datasets]
+                ),
+            )
+            self._finish_batch(
+                requests, results, pending, outputs, start_time, local_parts
+            )
+
+        return results
+
+    def _start_batch(
+        self,
+        requests: List[Tuple[SQLExecutionResult, str, str]],
+        start_time: float,
+    ) -> Tuple[List[Optional[DataSummaryResult]], List[Tuple[int, str, Optional[bytes]]]]:
+        """
+        Resolve the batch entries that need no LLM call
+
+        Args:
+            requests: (execution_result, user_query, sql_query) tuples
+            start_time: time.time() when summarization started
+
+        Returns:
+            Results with None in the slots still to summarize, and
+            (index, chain_input, cache_key) for each of those slots
+        """
+        results = []
+        pending = []
+
+        for index, (execution_result, user_query, sql_query) in enumerate(requests):
+            try:
+                result = self._summarize_without_llm(
+                    execution_result, user_query, start_time
                 )
-                markdown_data = self.convert_data_to_markdown_table(
-                    execution_result.data
+                if result is None:
+                    cache_key = self._summary_cache_key(
+                        execution_result, user_query, sql_query
+                    )
+                    result = self._get_cached_summary(cache_key, start_time)
+                    if result is None:
+                        chain_input = self._build_chain_input(
+                            execution_result, user_query, sql_query
+                        )
+                        pending.append((index, chain_input, cache_key))
+            except Exception as e:
+                result = self._summary_failed(e, execution_result, start_time)
+            results.append(result)
+
+        return results, pending
+
+    def _finish_batch(
+        self,
+        requests: List[Tuple[SQLExecutionResult, str, str]],
+        results: List[Optional[DataSummaryResult]],
+        pending: List[Tuple[int, str, Optional[bytes]]],
+        outputs: List[object],
+        start_time: float,
+        local_parts: Optional[List[Tuple[str, List[str]]]] = None,
+    ) -> None:
+        """
+        Fill the pending batch slots from the LLM outputs
+
+        Args:
+            requests: (execution_result, user_query, sql_query) tuples
+            results: Results from _start_batch, updated in place
+            pending: Pending slots from _start_batch
+            outputs: One summary string or exception per pending slot
+            start_time: time.time() when summarization started
+            local_parts: _local_summary_parts for each pending slot, if
+                already computed alongside the LLM calls
+        """
+        if local_parts is None:
+            local_parts = [None] * len(pending)
+
+        for (index, chain_input, cache_key), output, parts in zip(
+            pending, outputs, local_parts
+        ):
+            execution_result = requests[index][0]
+            try:
+                if isinstance(output, Exception):
+                    raise output
+                result = self._build_summary_result(
+                    output, chain_input, execution_result, start_time, parts
                 )
+                self._store_cached_summary(cache_key, result)
+            except Exception as e:
+                result = self._summary_failed(e, execution_result, start_time)
+            results[index] = result
 
-                summary_time_ms = (time.time() - start_time) * 1000
+    async def astream_summarize(
+        self,
+        execution_result: SQLExecutionResult,
+        user_query: str = "",
+        sql_query: str = "",
+    ) -> AsyncIterator[Union[str, DataSummaryResult]]:
+        """
+        Stream the summary as the LLM produces it
+
+        Yields text chunks of the HTML summary, then exactly one
+        DataSummaryResult built from the full text (or describing the
+        failure). Results that need no LLM call are yielded alone.
+
+        Args:
+            execution_result: Result from SQL execution
+            user_query: Original user query for context
+            sql_query: SQL query that was executed
 
-                return DataSummaryResult(
+        Yields:
+            str chunks, followed by the final DataSummaryResult
+        """
+        async for item in self._astream_summary(execution_result, user_query, sql_query):
+            if not isinstance(item, asyncio.Future):
+                yield item
+
+    async def asummarize_data_stream(
+        self,
+        execution_result: SQLExecutionResult,
+        user_query: str = "",
+        sql_query: str = "",
+    ) -> AsyncIterator[DataSummaryResult]:
+        """
+        Stream progressively more complete summary results
+
+        Each LLM chunk yields a partial DataSummaryResult holding the summary
+        text so far, plus the markdown table once it has been built (usually
+        well before the LLM finishes), so a caller can render both early.
+        The last item is the same final result astream_summarize yields.
+
+        Args:
+            execution_result: Result from SQL execution
+            user_query: Original user query for context
+            sql_query: SQL query that was executed
+
+        Yields:
+            Partial DataSummaryResults, followed by the final one
+        """
+        start_time = time.time()
+        local_parts = None
+        text = ""
+
+        async for item in self._astream_summary(execution_result, user_query, sql_query):
+            if isinstance(item, asyncio.Future):
+                local_parts = item
+            elif isinstance(item, str):
+                text += item
+                markdown_data = None
+                if (
+                    local_parts.done()
+                    and not local_parts.cancelled()
+                    and not local_parts.exception()
+                ):
+                    markdown_data = local_parts.result()[0]
+                yield DataSummaryResult(
                     success=True,
-                    summary=fallback_summary,  # Keep for backward compatibility
-                    html_summary=f"<p>{fallback_summary.replace('•', '<strong>•</strong>')}</p>",  # Basic HTML format
-                    markdown_data=markdown_data,  # NEW: Markdown table
-                    key_insights=["LLM summarization not available - using fallback"],
+                    summary=text,
+                    html_summary=text,
+                    markdown_data=markdown_data,
                     data_points_analyzed=execution_result.row_count,
-                    summary_time_ms=summary_time_ms,
-                    prompt_tokens=0,
-                    completion_tokens=0,
+                    summary_time_ms=(time.time() - start_time) * 1000,
                 )
+            else:
+                yield item
 
-            # Prepare data for summarization
-            data_summary = self._prepare_data_summary(execution_result.data)
-
-            # Prepare input for the chain
-            chain_input = {
-                "user_query": user_query or "Data analysis query",
-                "sql_query": sql_query
-                or execution_result.query_executed
-                or "SQL query",
-                "data_summary": data_summary,
-                "row_count": execution_result.row_count,
-                "columns": ", ".join(execution_result.columns or []),
-                "execution_time_ms": execution_result.execution_time_ms or 0,
-            }
+    async def _astream_summary(
+        self,
+        execution_result: SQLExecutionResult,
+        user_query: str,
+        sql_query: str,
+    ) -> AsyncIterator[Union[asyncio.Future, str, DataSummaryResult]]:
+        """
+        Shared body of the streaming summaries
 
-            logger.debug(
-                f"[DATA_SUMMARIZER] Summarizing {execution_result.row_count} rows of data"
+        Args:
+            execution_result: Result from SQL execution
+            user_query: Original user query for context
+            sql_query: SQL query that was executed
+
+        Yields:
+            The future of _local_summary_parts, then str chunks, followed by
+            the final DataSummaryResult; results that need no LLM call are
+            yielded alone
+        """
+        start_time = time.time()
+
+        try:
+            early_result = self._summarize_without_llm(
+                execution_result, user_query, start_time
             )
+            if early_result:
+                yield early_result
+                return
 
-            # Generate HTML summary using the chain
-            html_summary_text = self.chain.invoke(chain_input)
+            cache_key = self._summary_cache_key(execution_result, user_query, sql_query)
+            cached = self._get_cached_summary(cache_key, start_time)
+            if cached:
+                yield cached
+                return
 
-            # Generate markdown table from data
-            markdown_data = self.convert_data_to_markdown_table(execution_result.data)
+            chain_input = self._build_chain_input(
+                execution_result, user_query, sql_query
+            )
 
-            # Extract key insights
-            key_insights = self._extract_key_insights(
-                html_summary_text, execution_result.data
+            local_parts = asyncio.ensure_future(
+                asyncio.to_thread(self._local_summary_parts, execution_result.data)
             )
+            try:
+                yield local_parts
 
-            # Calculate processing time
-            summary_time_ms = (time.time() - start_time) * 1000
+                parts = []
+                async for chunk in self.chain.astream(chain_input):
+                    parts.append(chunk)
+                    yield chunk
 
-            return DataSummaryResult(
-                success=True,
-                summary=html_summary_text.strip(),  # Keep for backward compatibility
-                html_summary=html_summary_text.strip(),  # NEW: HTML formatted summary
-                markdown_data=markdown_data,  # NEW: Markdown table
-                key_insights=key_insights,
-                data_points_analyzed=execution_result.row_count,
-                summary_time_ms=summary_time_ms,
-                # Estimate token usage
-                prompt_tokens=self._estimate_tokens(str(chain_input)),
-                completion_tokens=self._estimate_tokens(html_summary_text),
-            )
+                result = self._build_summary_result(
+                    "".join(parts), chain_input, execution_result, start_time, await local_parts
+                )
+                self._store_cached_summary(cache_key, result)
+            finally:
+                # The LLM stream failed or the consumer stopped early: do not
+                # leave the worker future pending or its error unretrieved
+                if not local_parts.done():
+                    local_parts.cancel()
+                with contextlib.suppress(Exception, asyncio.CancelledError):
+                    await local_parts
 
         except Exception as e:
-            summary_time_ms = (time.time() - start_time) * 1000
-            error_msg = f"Data summarization failed: {str(e)}"
+            result = self._summary_failed(e, execution_result, start_time)
 
-            logger.error(
-                f"[DATA_SUMMARIZER] {error_msg} (after {summary_time_ms:.2f}ms)"
-            )
+        yield result
 
+    def _summarize_without_llm(
+        self,
+        execution_result: SQLExecutionResult,
+        user_query: str,
+        start_time: float,
+    ) -> Optional[DataSummaryResult]:
+        """
+        Handle the cases that need no LLM call
+
+        Args:
+            execution_result: Result from SQL execution
+            user_query: Original user query for context
+            start_time: time.time() when summarization started
+
+        Returns:
+            Error or fallback DataSummaryResult, or None if the LLM should run
+        """
+        # Validate input
+        if not execution_result:
+            return DataSummaryResult(success=False, error="No execution result provided")
+
+        if not execution_result.success:
             return DataSummaryResult(
                 success=False,
-                error=error_msg,
-                html_summary=None,  # NEW: Ensure new fields are None on error
-                markdown_data=None,  # NEW: Ensure new fields are None on error
-                summary_time_ms=summary_time_ms,
-                data_points_analyzed=(
-                    execution_result.row_count if execution_result else 0
-                ),
+                error=f"Cannot summarize failed execution: {execution_result.error}",
+            )
+
+        # Check if LLM is initialized
+        if self.llm and self.chain:
+            return None
+
+        logger.warning("[DATA_SUMMARIZER] LLM not initialized, creating fallback summary")
+        fallback_summary = self.create_fallback_summary(execution_result, user_query)
+        markdown_data = self.convert_data_to_markdown_table(execution_result.data)
+
+        summary_time_ms = (time.time() - start_time) * 1000
+
+        return DataSummaryResult(
+            success=True,
+            summary=fallback_summary,  # Keep for backward compatibility
+            html_summary=_FALLBACK_HTML % self.fallback_summary_html(fallback_summary),  # Basic HTML format
+            markdown_data=markdown_data,  # NEW: Markdown table
+            key_insights=["LLM summarization not available - using fallback"],
+            data_points_analyzed=execution_result.row_count,
+            summary_time_ms=summary_time_ms,
+            prompt_tokens=0,
+            completion_tokens=0,
+        )
+
+    def _summary_cache_key(
+        self,
+        execution_result: SQLExecutionResult,
+        user_query: str,
+        sql_query: str,
+    ) -> Optional[bytes]:
+        """
+        Build the summary cache key for a request
+
+        Args:
+            execution_result: Result from SQL execution
+            user_query: Original user query
+            sql_query: SQL query that was executed
+
+        Returns:
+            Digest of the query, SQL and rows, or None if caching is disabled
+            or the rows cannot be serialized
+        """
+        if self.config.summary_cache_ttl_seconds <= 0:
+            return None
+
+        try:
+            payload = orjson.dumps(
+                [user_query, sql_query, execution_result.data],
+                option=orjson.OPT_SORT_KEYS,
+                default=str,
             )
+        except orjson.JSONEncodeError as e:
+            # e.g. integers beyond 64 bits, which never reach default=str;
+            # the summary is still produced, just not cached
+            logger.debug("[DATA_SUMMARIZER] Summary not cacheable: %s", e)
+            return None
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
+    def _get_cached_summary(
+        self, key: Optional[bytes], start_time: float
+    ) -> Optional[DataSummaryResult]:
+        """
+        Return a copy of a live cached summary
+
+        Args:
+            key: Key from _summary_cache_key
+            start_time: time.time() when summarization started
+
+        Returns:
+            DataSummaryResult with no token usage, or None on a miss
+        """
+        if key is None:
+            return None
+
+        with self._summary_cache_lock:
+            entry = self._summary_cache.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                if entry is not None:
+                    del self._summary_cache[key]
+                self._cache_misses += 1
+                return None
+            self._summary_cache.move_to_end(key)
+            self._cache_hits += 1
+
+        # Insight lists are shared with the cache and must be treated as read-only
+        result = copy.copy(entry[0])
+        result.summary_time_ms = (time.time() - start_time) * 1000
+        result.prompt_tokens = 0
+        result.completion_tokens = 0
+        return result
+
+    def _store_cached_summary(self, key: Optional[bytes], result: DataSummaryResult) -> None:
+        """
+        Cache a successful summary, evicting the least recently used entry
+
+        Args:
+            key: Key from _summary_cache_key
+            result: Summary to cache
+        """
+        if key is None or not result.success:
+            return
+
+        expires_at = time.monotonic() + self.config.summary_cache_ttl_seconds
+        with self._summary_cache_lock:
+            self._summary_cache[key] = (result, expires_at)
+            self._summary_cache.move_to_end(key)
+            while len(self._summary_cache) > self.config.summary_cache_max_entries:
+                self._summary_cache.popitem(last=False)
+
+    def clear_summary_cache(self) -> None:
+        """Drop every cached summary"""
+        with self._summary_cache_lock:
+            self._summary_cache.clear()
+
+    def _build_chain_input(
+        self,
+        execution_result: SQLExecutionResult,
+        user_query: str,
+        sql_query: str,
+    ) -> str:
+        """
+        Render the summary prompt
+
+        Args:
+            execution_result: Result from SQL execution
+            user_query: Original user query for context
+            sql_query: SQL query that was executed
+
+        Returns:
+            Complete prompt text for the summarization chain
+        """
+        # Prepare data for summarization
+        data_summary = self._prepare_data_summary(execution_result.data)
+
+        logger.debug(
+            "[DATA_SUMMARIZER] Summarizing %s rows of data", execution_result.row_count
+        )
+
+        return (
+            f"{_SUMMARY_PROMPT_INTRO}"
+            f"Original User Query: {user_query or 'Data analysis query'}\n\n"
+            f"SQL Query Executed: {sql_query or execution_result.query_executed or 'SQL query'}\n\n"
+            f"Query Results:\n{data_summary}\n\n"
+            f"Data Details:\n"
+            f"- Total Rows: {execution_result.row_count}\n"
+            f"- Columns: {', '.join(execution_result.columns or [])}\n"
+            f"- Execution Time: {execution_result.execution_time_ms or 0}ms\n"
+            f"{_SUMMARY_PROMPT_INSTRUCTIONS}"
+        )
+
+    def _build_summary_result(
+        self,
+        html_summary_text: str,
+        chain_input: str,
+        execution_result: SQLExecutionResult,
+        start_time: float,
+        local_parts: Optional[Tuple[str, List[str]]] = None,
+    ) -> DataSummaryResult:
+        """
+        Wrap the LLM summary in a DataSummaryResult
+
+        Args:
+            html_summary_text: Raw LLM completion
+            chain_input: Prompt the summary was generated from
+            execution_result: Result from SQL execution
+            start_time: time.time() when summarization started
+            local_parts: _local_summary_parts(execution_result.data), if
+                already computed alongside the LLM call
+
+        Returns:
+            Successful DataSummaryResult
+        """
+        # Generate markdown table and data insights from data
+        if local_parts is None:
+            local_parts = self._local_summary_parts(execution_result.data)
+        markdown_data, data_insights = local_parts
+
+        # Extract key insights
+        key_insights = self._extract_key_insights(
+            html_summary_text, execution_result.data, data_insights
+        )
+
+        # Calculate processing time
+        summary_time_ms = (time.time() - start_time) * 1000
+
+        return DataSummaryResult(
+            success=True,
+            summary=html_summary_text.strip(),  # Keep for backward compatibility
+            html_summary=html_summary_text.strip(),  # NEW: HTML formatted summary
+            markdown_data=markdown_data,  # NEW: Markdown table
+            key_insights=key_insights,
+            data_points_analyzed=execution_result.row_count,
+            summary_time_ms=summary_time_ms,
+            # Estimate token usage
+            prompt_tokens=self._estimate_tokens(chain_input),
+            completion_tokens=self._estimate_tokens(html_summary_text),
+        )
+
+    @staticmethod
+    def _summary_failed(
+        e: Exception,
+        execution_result: Optional[SQLExecutionResult],
+        start_time: float,
+    ) -> DataSummaryResult:
+        """
+        Log a failed summarization and wrap it in a DataSummaryResult
+
+        Args:
+            e: Exception that ended the summarization
+            execution_result: Result from SQL execution, if any
+            start_time: time.time() when summarization started
+
+        Returns:
+            Failed DataSummaryResult
+        """
+        summary_time_ms = (time.time() - start_time) * 1000
+        error_msg = f"Data summarization failed: {str(e)}"
+
+        logger.error("[DATA_SUMMARIZER] %s (after %.2fms)", error_msg, summary_time_ms)
+
+        return DataSummaryResult(
+            success=False,
+            error=error_msg,
+            html_summary=None,  # NEW: Ensure new fields are None on error
+            markdown_data=None,  # NEW: Ensure new fields are None on error
+            summary_time_ms=summary_time_ms,
+            data_points_analyzed=(execution_result.row_count if execution_result else 0),
+        )
 
     def _prepare_data_summary(self, data: List[Dict[str, Any]]) -> str:
         """
@@ -281,12 +868,12 @@ HTML Summary:"""
                 # Show all rows if small dataset
                 summary_parts.append("Complete Dataset:")
                 for i, row in enumerate(sample_data, 1):
-                    summary_parts.append(f"Row {i}: {json.dumps(row, default=str)}")
+                    summary_parts.append(f"Row {i}: {_row_json(row)}")
             else:
                 # Show first few and last few rows for larger datasets
                 summary_parts.append("Sample Data (First 5 rows):")
                 for i, row in enumerate(sample_data[:5], 1):
-                    summary_parts.append(f"Row {i}: {json.dumps(row, default=str)}")
+                    summary_parts.append(f"Row {i}: {_row_json(row)}")
 
                 if len(data) > max_rows_for_summary:
                     summary_parts.append(
@@ -296,16 +883,19 @@ HTML Summary:"""
                 if len(sample_data) > 5:
                     summary_parts.append("\nLast 3 rows from sample:")
                     for i, row in enumerate(sample_data[-3:], len(sample_data) - 2):
-                        summary_parts.append(f"Row {i}: {json.dumps(row, default=str)}")
+                        summary_parts.append(f"Row {i}: {_row_json(row)}")
 
             return "\n".join(summary_parts)
 
         except Exception as e:
-            logger.warning(f"[DATA_SUMMARIZER] Error preparing data summary: {e}")
+            logger.warning("[DATA_SUMMARIZER] Error preparing data summary: %s", e)
             return f"Data summary preparation failed: {str(e)}"
 
     def _extract_key_insights(
-        self, summary_text: str, data: List[Dict[str, Any]]
+        self,
+        summary_text: str,
+        data: List[Dict[str, Any]],
+        data_insights: Optional[List[str]] = None,
     ) -> List[str]:
         """
         Extract key insights from the summary and data
@@ -313,10 +903,36 @@ HTML Summary:"""
         Args:
             summary_text: Generated summary text
             data: Original data
+            data_insights: Result of _extract_data_insights(data), if already computed
 
         Returns:
             List of key insights
         """
+        if data_insights is None:
+            data_insights = self._extract_data_insights(data)
+        insights = list(data_insights)
+
+        try:
+            # Extract insights from summary text
+            text_insights = self._extract_insights_from_text(summary_text)
+            insights.extend(text_insights)
+
+        except Exception as e:
+            logger.warning("[DATA_SUMMARIZER] Error extracting insights: %s", e)
+            insights.append("Insight extraction encountered an error")
+
+        return insights[:10]  # Limit to top 10 insights
+
+    def _extract_data_insights(self, data: List[Dict[str, Any]]) -> List[str]:
+        """
+        Extract the insights that depend only on the data, not on the summary
+
+        Args:
+            data: Original data
+
+        Returns:
+            List of data insights
+        """
         insights = []
 
         try:
@@ -332,15 +948,25 @@ HTML Summary:"""
                 categorical_insights = self._analyze_categorical_data(data)
                 insights.extend(categorical_insights)
 
-            # Extract insights from summary text
-            text_insights = self._extract_insights_from_text(summary_text)
-            insights.extend(text_insights)
-
         except Exception as e:
-            logger.warning(f"[DATA_SUMMARIZER] Error extracting insights: {e}")
+            logger.warning("[DATA_SUMMARIZER] Error extracting insights: %s", e)
             insights.append("Insight extraction encountered an error")
 
-        return insights[:10]  # Limit to top 10 insights
+        return insights
+
+    def _local_summary_parts(
+        self, data: List[Dict[str, Any]]
+    ) -> Tuple[str, List[str]]:
+        """
+        Build the parts of a summary result that need no LLM output
+
+        Args:
+            data: Original data
+
+        Returns:
+            Tuple of (markdown table, data insights)
+        """
+        return self.convert_data_to_markdown_table(data), self._extract_data_insights(data)
 
     def _analyze_numeric_data(self, data: List[Dict[str, Any]]) -> List[str]:
         """Analyze numeric columns for insights"""
@@ -362,9 +988,9 @@ HTML Summary:"""
             # Analyze each numeric column
             for col in numeric_columns[:3]:  # Limit to 3 columns
                 values = [
-                    row.get(col, 0)
+                    value
                     for row in data
-                    if isinstance(row.get(col), (int, float))
+                    if isinstance(value := row.get(col), (int, float))
                 ]
                 if values:
                     avg_val = sum(values) / len(values)
@@ -375,7 +1001,7 @@ HTML Summary:"""
                     )
 
         except Exception as e:
-            logger.debug(f"Numeric analysis error: {e}")
+            logger.debug("Numeric analysis error: %s", e)
 
         return insights
 
@@ -399,37 +1025,66 @@ HTML Summary:"""
 
             # Analyze each categorical column
             for col in categorical_columns[:2]:  # Limit to 2 columns
-                values = [row.get(col) for row in data if row.get(col)]
-                if values:
-                    unique_count = len(set(values))
-                    most_common = max(set(values), key=values.count)
+                # One counting pass; max(set(values), key=values.count)
+                # rescanned the column once per distinct value
+                counts = Counter(value for row in data if (value := row.get(col)))
+                if counts:
+                    unique_count = len(counts)
+                    most_common = counts.most_common(1)[0][0]
                     insights.append(
                         f"{col}: {unique_count} unique values, most common: {most_common}"
                     )
 
         except Exception as e:
-            logger.debug(f"Categorical analysis error: {e}")
+            logger.debug("Categorical analysis error: %s", e)
 
         return insights
 
     def _extract_insights_from_text(self, summary_text: str) -> List[str]:
-        """Extract insights from the generated summary text"""
+        """
+        Extract insights from the generated summary text
+
+        Uses the phrases the LLM marked with <strong>/<em> as instructed,
+        falling back to lines with insight keywords for untagged text.
+
+        Args:
+            summary_text: Generated summary text
+
+        Returns:
+            Up to 5 text insights
+        """
         insights = []
+        for match in _MARKED_INSIGHT_RE.finditer(summary_text):
+            insight = " ".join(unescape(_TAG_RE.sub("", match.group(2))).split())
+            if insight:
+                insights.append(insight)
+                if len(insights) == 5:
+                    return insights
+        if insights:
+            return insights
 
         try:
             # Look for key phrases that indicate insights
             lines = summary_text.split("\n")
             for line in lines:
                 line = line.strip()
-                if any(
-                    keyword in line.lower()
-                    for keyword in ["shows", "indicates", "reveals", "suggests"]
+                if len(line) >= 150:  # Keep insights concise
+                    continue
+
+                # Lowercase once; the inline checks beat any() over a list
+                lowered = line.lower()
+                if (
+                    "shows" in lowered
+                    or "indicates" in lowered
+                    or "reveals" in lowered
+                    or "suggests" in lowered
                 ):
-                    if len(line) < 150:  # Keep insights concise
-                        insights.append(line)
+                    insights.append(line)
+                    if len(insights) == 5:
+                        break
 
         except Exception as e:
-            logger.debug(f"Text insight extraction error: {e}")
+            logger.debug("Text insight extraction error: %s", e)
 
         return insights[:5]  # Limit to 5 text insights
 
@@ -456,32 +1111,16 @@ HTML Summary:"""
             # Get column headers from first row
             headers = list(limited_data[0].keys())
 
-            # Create markdown table header
-            header_row = "| " + " | ".join(headers) + " |"
-            separator_row = "|" + "|".join([" --- " for _ in headers]) + "|"
-
-            # Create data rows
-            data_rows = []
-            for row in limited_data:
-                formatted_values = []
-                for header in headers:
-                    value = row.get(header, "")
-                    # Handle different data types
-                    if value is None:
-                        formatted_value = "null"
-                    elif isinstance(value, (int, float)):
-                        formatted_value = str(value)
-                    elif isinstance(value, str):
-                        # Escape special markdown characters
-                        formatted_value = value.replace("|", "\\|").replace("\n", " ")
-                    else:
-                        formatted_value = str(value)
-                    formatted_values.append(formatted_value)
-
-                data_rows.append("| " + " | ".join(formatted_values) + " |")
-
-            # Combine all parts
-            table_parts = [header_row, separator_row] + data_rows
+            # Header, separator and one line per row, each cell formatted
+            # by _markdown_cell in a single comprehension
+            table_parts = [
+                "| " + " | ".join(headers) + " |",
+                "|" + "|".join([" --- "] * len(headers)) + "|",
+            ]
+            table_parts += [
+                "| " + " | ".join([_markdown_cell(row.get(header, "")) for header in headers]) + " |"
+                for row in limited_data
+            ]
 
             # Add summary info if data was truncated
             if len(data) > max_rows:
@@ -490,21 +1129,36 @@ HTML Summary:"""
             return "\n".join(table_parts)
 
         except Exception as e:
-            logger.warning(f"Error converting data to markdown table: {e}")
+            logger.warning("Error converting data to markdown table: %s", e)
             return f"Error creating markdown table: {str(e)}"
 
     def _estimate_tokens(self, text: str) -> int:
         """
-        Estimate token count for text (rough approximation)
+        Count tokens for text
 
         Args:
-            text: Text to estimate tokens for
+            text: Text to count tokens for
 
         Returns:
-            Estimated token count
+            Token count (length-based estimate if no tiktoken encoder is available)
         """
-        # Rough estimation: ~4 characters per token for English text
-        return len(str(text)) // 4
+        return count_tokens(text, self.config.model_name)
+
+    @staticmethod
+    def fallback_summary_html(fallback_summary: str) -> str:
+        """
+        Render a create_fallback_summary text as HTML
+
+        The text carries column names and the user's query, so it is escaped
+        before the bullets are emphasized.
+
+        Args:
+            fallback_summary: Plain-text fallback summary
+
+        Returns:
+            Escaped HTML fragment (without an enclosing element)
+        """
+        return escape(fallback_summary, quote=False).replace("•", "<strong>•</strong>")
 
     def create_fallback_summary(
         self, execution_result: SQLExecutionResult, user_query: str = ""
@@ -554,6 +1208,24 @@ HTML Summary:"""
         self.config = new_config
         self._initialize_llm()
         self._initialize_chain()
+        self._initialize_batcher()
+        self.clear_summary_cache()
+
+    def get_summary_stats(self) -> dict:
+        """
+        Get summarization statistics
+
+        Returns:
+            Dictionary with summary cache statistics
+        """
+        return {
+            "summary_cache": {
+                "enabled": self.config.summary_cache_ttl_seconds > 0,
+                "entries": len(self._summary_cache),
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+            },
+        }
 
     def health_check(self) -> dict:
         """
@@ -566,30 +1238,52 @@ HTML Summary:"""
             if not self.llm or not self.chain:
                 return {"status": "unhealthy", "error": "LLM or chain not initialized"}
 
-            # Create a test execution result
-            test_data = [{"test_column": "test_value", "count": 1}]
-            test_execution_result = SQLExecutionResult(
-                success=True,
-                data=test_data,
-                row_count=1,
-                execution_time_ms=10.0,
-                query_executed="SELECT 'test' as test_column, 1 as count",
-                columns=["test_column", "count"],
-            )
-
             # Test summarization
             test_result = self.summarize_data(
-                test_execution_result, "test query", "test sql"
+                self._health_check_input(), "test query", "test sql"
             )
+            return self._health_from_result(test_result)
 
-            if test_result.success:
-                return {
-                    "status": "healthy",
-                    "model": self.config.model_name,
-                    "summary_time_ms": test_result.summary_time_ms,
-                }
-            else:
-                return {"status": "unhealthy", "error": test_result.error}
+        except Exception as e:
+            return {"status": "unhealthy", "error": str(e)}
+
+    async def ahealth_check(self) -> dict:
+        """
+        Async counterpart of health_check
+
+        Returns:
+            Health status dictionary
+        """
+        try:
+            if not self.llm or not self.chain:
+                return {"status": "unhealthy", "error": "LLM or chain not initialized"}
+
+            test_result = await self.asummarize_data(
+                self._health_check_input(), "test query", "test sql"
+            )
+            return self._health_from_result(test_result)
 
         except Exception as e:
             return {"status": "unhealthy", "error": str(e)}
+
+    @staticmethod
+    def _health_check_input() -> SQLExecutionResult:
+        """Build the one-row execution result summarized by health checks"""
+        return SQLExecutionResult(
+            success=True,
+            data=[{"test_column": "test_value", "count": 1}],
+            row_count=1,
+            execution_time_ms=10.0,
+            query_executed="SELECT 'test' as test_column, 1 as count",
+            columns=["test_column", "count"],
+        )
+
+    def _health_from_result(self, test_result: DataSummaryResult) -> dict:
+        """Map a test summarization to a health status dictionary"""
+        if test_result.success:
+            return {
+                "status": "healthy",
+                "model": self.config.model_name,
+                "summary_time_ms": test_result.summary_time_ms,
+            }
+        return {"status": "unhealthy", "error": test_result.error}
@@ -0,0 +1,91 @@
+"""
+Shared LLM HTTP Clients
+
+ChatOpenAI already keeps one keep-alive HTTP/1.1 connection pool per
+(base URL, timeout). When the optional ``h2`` package is installed, the
+services use the HTTP/2 clients built here instead, so concurrent
+requests to the provider are multiplexed over a few connections.
+
+The sync client is shared by every service for the current endpoint. An
+async client is bound to the event loop it first runs on, so each call
+gets its own; the chat handler already builds the services once per loop.
+"""
+
+import importlib.util
+import logging
+import threading
+from typing import Any, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Same bounds as the openai/httpx defaults
+_MAX_CONNECTIONS = 100
+_MAX_KEEPALIVE_CONNECTIONS = 20
+
+# (base URL, timeout) -> sync client; only the latest endpoint is kept
+_sync_clients: Dict[Tuple[str, float], Any] = {}
+_sync_clients_lock = threading.Lock()
+
+
+def _http2_available() -> bool:
+    """Whether httpx can negotiate HTTP/2 (needs the h2 package)"""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _shared_sync_client(base_url: str, timeout: float, limits: Any) -> Any:
+    """
+    Get the sync HTTP/2 client for an endpoint, creating it on first use
+
+    A new endpoint or timeout evicts the previous client. It is not closed,
+    since services built from the old config may still be using it.
+
+    Args:
+        base_url: Provider base URL
+        timeout: Request timeout in seconds
+        limits: httpx.Limits for a new client
+
+    Returns:
+        Shared httpx.Client
+    """
+    import httpx
+
+    key = (base_url, timeout)
+    with _sync_clients_lock:
+        client = _sync_clients.get(key)
+        if client is None:
+            logger.info("[LLM_HTTP] Using HTTP/2 clients for %s", base_url)
+            _sync_clients.clear()
+            client = httpx.Client(http2=True, limits=limits, timeout=timeout)
+            _sync_clients[key] = client
+        return client
+
+
+def llm_http_clients(base_url: str, timeout: float) -> Dict[str, Any]:
+    """
+    ChatOpenAI keyword arguments selecting HTTP/2 clients
+
+    Both services call this with the same endpoint and timeout, so they
+    share one sync client, and a config update that keeps them reuses its
+    open connections.
+
+    Args:
+        base_url: Provider base URL
+        timeout: Request timeout in seconds
+
+    Returns:
+        http_client/http_async_client keyword arguments, or an empty dict
+        to keep ChatOpenAI's own pooled HTTP/1.1 clients
+    """
+    if not _http2_available():
+        return {}
+
+    import httpx
+
+    limits = httpx.Limits(
+        max_connections=_MAX_CONNECTIONS,
+        max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS,
+    )
+    return {
+        "http_client": _shared_sync_client(base_url, timeout, limits),
+        "http_async_client": httpx.AsyncClient(http2=True, limits=limits, timeout=timeout),
+    }
@@ -0,0 +1,301 @@
+"""
+Semantic Cache Service
+
+Caches SequentialChainResults keyed on the embedding of the user query, so
+a question that is phrased differently but means the same thing reuses an
+earlier answer instead of re-running the whole chain.
+
+Embeddings barely move when only a literal changes ("payments in March"
+vs "in April", merchant 123 vs 124), so an entry is only reused by a query
+with exactly the same literals.
+"""
+
+import copy
+import hashlib
+import logging
+import re
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+import numpy as np
+
+from ..models.response_models import SequentialChainResult
+
+logger = logging.getLogger(__name__)
+
+# Embeds one text into a 1-D float vector
+Embedder = Callable[[str], np.ndarray]
+
+# Set bits per byte value; np.bitwise_count needs numpy 2
+_POPCOUNT = np.unpackbits(np.arange(256, dtype=np.uint8)[:, None], axis=1).sum(axis=1)
+
+_MONTHS = (
+    "january|february|march|april|may|june|july|august|september|october|"
+    "november|december|jan|feb|mar|apr|jun|jul|aug|sep|sept|oct|nov|dec"
+)
+_RELATIVE_DATES = (
+    "monday|tuesday|wednesday|thursday|friday|saturday|sunday|today|"
+    "yesterday|tomorrow|hour|day|week|month|quarter|year|last|next|previous|past|ago"
+)
+
+# Values that change the answer but hardly the embedding: quoted strings,
+# tokens containing digits (amounts, dates, IDs), upper-case codes such as
+# currencies, and calendar words
+_LITERAL_RE = re.compile(
+    r"'[^']*'|\"[^\"]*\"|\b\w*\d\w*\b|\b[A-Z]{2,}\b"
+    rf"|(?i:\b(?:{_MONTHS}|{_RELATIVE_DATES})s?\b)"
+)
+
+
+def query_literals(text: str) -> bytes:
+    """
+    Digest the literals of a query, in order
+
+    Args:
+        text: User query
+
+    Returns:
+        16-byte digest; queries with the same literals share it
+    """
+    literals = "\x1f".join(_LITERAL_RE.findall(text)).lower()
+    return hashlib.blake2b(literals.encode(), digest_size=16).digest()
+
+
+def _load_sentence_transformer(model_name: str) -> Optional[Embedder]:
+    """
+    Load a sentence-transformers model as an embedder, if the package is installed
+
+    Args:
+        model_name: sentence-transformers model name
+
+    Returns:
+        Embedder, or None if sentence-transformers is unavailable
+    """
+    try:
+        from sentence_transformers import SentenceTransformer
+    except ImportError:
+        logger.warning(
+            "[SEMANTIC_CACHE] sentence-transformers not installed, semantic cache disabled"
+        )
+        return None
+
+    model = SentenceTransformer(model_name)
+    return lambda text: model.encode(text, normalize_embeddings=True)
+
+
+class SemanticCache:
+    """
+    Cosine-similarity cache of chain results keyed on query embeddings
+
+    Each entry is kept as a sign-bit code (dim / 8 bytes) plus a float16
+    copy of the vector, about half the size of float32 storage. A lookup
+    ranks entries by Hamming distance between codes, then reranks the
+    closest ``rerank_k`` with exact cosine similarity on the float16
+    vectors. Entries expire after ``ttl`` seconds and the oldest entry is
+    overwritten once the buffer is full.
+    """
+
+    def __init__(
+        self,
+        embedder: Optional[Embedder] = None,
+        dim: int = 384,
+        threshold: float = 0.95,
+        ttl: float = 300,
+        max_entries: int = 1024,
+        model_name: str = "all-MiniLM-L6-v2",
+        rerank_k: int = 32,
+        max_hamming: Optional[int] = None,
+    ):
+        """
+        Initialize Semantic Cache
+
+        Args:
+            embedder: Text embedder; loads ``model_name`` lazily if None
+            dim: Embedding dimension
+            threshold: Minimum cosine similarity for a hit
+            ttl: Seconds an entry stays valid
+            max_entries: Ring buffer capacity
+            model_name: sentence-transformers model used when embedder is None
+            rerank_k: Candidates taken from the Hamming scan for exact rerank
+            max_hamming: Largest code distance worth reranking; defaults to
+                80 bits per 384 dimensions
+        """
+        self.threshold = threshold
+        self.ttl = ttl
+        self.model_name = model_name
+        self.rerank_k = rerank_k
+        self.max_hamming = max_hamming if max_hamming is not None else dim * 80 // 384
+        self._embedder = embedder
+        self._embedder_loaded = embedder is not None
+
+        self._codes = np.zeros((max_entries, (dim + 7) // 8), dtype=np.uint8)
+        self._vectors = np.zeros((max_entries, dim), dtype=np.float16)
+        self._expires = np.zeros(max_entries, dtype=np.float64)
+        self._results = [None] * max_entries
+        self._literals = [None] * max_entries
+        self._next = 0
+        self._size = 0
+        # Digest of the prompt prefix the entries were produced under
+        self._scope: Optional[bytes] = None
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def embed(self, text: str) -> Optional[np.ndarray]:
+        """
+        Embed a query as a unit vector
+
+        Args:
+            text: User query
+
+        Returns:
+            Normalized float32 vector, or None if no embedder is available
+        """
+        if not self._embedder_loaded:
+            with self._lock:
+                if not self._embedder_loaded:
+                    self._embedder = _load_sentence_transformer(self.model_name)
+                    self._embedder_loaded = True
+
+        if self._embedder is None:
+            return None
+
+        vector = np.asarray(self._embedder(text), dtype=np.float32).ravel()
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+
+    def lookup(
+        self, embedding: np.ndarray, scope: bytes, user_query: str
+    ) -> Optional[SequentialChainResult]:
+        """
+        Find the cached result most similar to an embedding
+
+        Args:
+            embedding: Normalized query vector from embed()
+            scope: Digest of the prompt prefix (system and tool context)
+            user_query: Query the embedding was made from; only entries
+                with the same literals are considered
+
+        Returns:
+            Cached SequentialChainResult above the threshold, or None
+        """
+        with self._lock:
+            if scope != self._scope or not self._size:
+                self.misses += 1
+                return None
+
+            distances = _POPCOUNT[self._codes[: self._size] ^ np.packbits(embedding > 0)].sum(axis=1)
+            distances[self._expires[: self._size] <= time.monotonic()] = self.max_hamming + 1
+
+            if self._size > self.rerank_k:
+                candidates = np.argpartition(distances, self.rerank_k - 1)[: self.rerank_k]
+            else:
+                candidates = np.arange(self._size)
+            candidates = candidates[distances[candidates] <= self.max_hamming]
+            literals = query_literals(user_query)
+            candidates = candidates[
+                [self._literals[candidate] == literals for candidate in candidates]
+            ]
+            if not candidates.size:
+                self.misses += 1
+                return None
+
+            scores = self._vectors[candidates].astype(np.float32) @ embedding
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            return self._results[candidates[best]]
+
+    def insert(
+        self,
+        embedding: np.ndarray,
+        result: SequentialChainResult,
+        scope: bytes,
+        user_query: str,
+    ) -> None:
+        """
+        Store a successful chain result
+
+        A new scope means the schema or system context changed, which makes
+        every stored result stale, so the cache is emptied first.
+
+        Args:
+            embedding: Normalized query vector from embed()
+            result: Result to cache
+            scope: Digest of the prompt prefix (system and tool context)
+            user_query: Query the embedding was made from
+        """
+        if not result.success:
+            return
+
+        with self._lock:
+            if scope != self._scope:
+                self._clear_locked()
+                self._scope = scope
+
+            slot = self._next
+            self._codes[slot] = np.packbits(embedding > 0)
+            self._vectors[slot] = embedding
+            self._expires[slot] = time.monotonic() + self.ttl
+            self._results[slot] = result
+            self._literals[slot] = query_literals(user_query)
+            self._next = (slot + 1) % len(self._results)
+            self._size = max(self._size, slot + 1)
+
+    @staticmethod
+    def reuse(
+        result: SequentialChainResult, user_query: str, session_id: str, start_ns: int
+    ) -> SequentialChainResult:
+        """
+        Copy a cached result for a new request
+
+        Args:
+            result: Cached result
+            user_query: Query of the new request
+            session_id: Session ID of the new request
+            start_ns: time.perf_counter_ns() at which the new request began
+
+        Returns:
+            Shallow copy carrying the new request's metadata
+        """
+        # Stage results are shared with the cached entry; only the
+        # per-request metadata below is replaced
+        reused = copy.copy(result)
+        reused.user_query = user_query
+        reused.session_id = session_id
+        reused.timestamp = datetime.now()
+        reused.total_processing_time_ms = (time.perf_counter_ns() - start_ns) / 1e6
+        return reused
+
+    def clear(self) -> None:
+        """Drop every entry"""
+        with self._lock:
+            self._clear_locked()
+
+    def _clear_locked(self) -> None:
+        self._expires[:] = 0
+        self._results = [None] * len(self._results)
+        self._literals = [None] * len(self._literals)
+        self._next = 0
+        self._size = 0
+
+    def get_stats(self) -> dict:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with size and hit/miss counts
+        """
+        return {
+            "entries": self._size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "threshold": self.threshold,
+            "enabled": self._embedder is not None or not self._embedder_loaded,
+        }
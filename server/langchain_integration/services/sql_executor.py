@@ -5,9 +5,16 @@ Executes validated SQL queries against the MySQL database.
 Integrates with the existing app_state MySQL connection pool.
 """
 
+import asyncio
+import copy
+import hashlib
 import logging
+import re
+import threading
 import time
-from typing import Optional, List, Dict, Any
+import weakref
+from collections import OrderedDict
+from typing import Optional, List, Dict, Any, Tuple
 
 from ..models.response_models import (
     SQLExecutionResult,
@@ -17,6 +24,31 @@ from ..models.response_models import (
 
 logger = logging.getLogger(__name__)
 
+# Queries whose result depends on when or how often they run are never cached
+_VOLATILE_SQL = re.compile(
+    r"\b(?:NOW|CURDATE|CURTIME|SYSDATE|UTC_DATE|UTC_TIME|UTC_TIMESTAMP|"
+    r"UNIX_TIMESTAMP|RAND|UUID)\s*\(|\bCURRENT_(?:DATE|TIME|TIMESTAMP)\b",
+    re.IGNORECASE,
+)
+_WHITESPACE = re.compile(r"\s+")
+_LEADING_SELECT = re.compile(r"^\s*SELECT\b", re.IGNORECASE)
+
+# aiomysql, imported on first async execution; False once known missing
+_aiomysql = None
+
+
+def _aiomysql_module():
+    """Import aiomysql once and return it, or None if it is not installed"""
+    global _aiomysql
+    if _aiomysql is None:
+        try:
+            import aiomysql
+            _aiomysql = aiomysql
+        except ImportError:
+            logger.info("[SQL_EXECUTOR] aiomysql not installed, async execution uses worker threads")
+            _aiomysql = False
+    return _aiomysql or None
+
 
 class SQLExecutorService:
     """Service for executing SQL queries against MySQL database"""
@@ -29,6 +61,15 @@ class SQLExecutorService:
             config: Execution configuration, uses defaults if None
         """
         self.config = config or ExecutionConfig()
+        
+        # LRU of (query digest, database) -> (result, expires_at)
+        self._result_cache: "OrderedDict[Tuple[bytes, str], Tuple[SQLExecutionResult, float]]" = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        
+        # aiomysql pools are bound to the loop that created them
+        self._async_pools: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
     
     def execute_sql(self, sql_query: str, app_state) -> SQLExecutionResult:
         """
@@ -67,68 +108,33 @@ class SQLExecutorService:
                     error="MySQL connection not available"
                 )
             
-            logger.debug(f"[SQL_EXECUTOR] Executing query: {sql_query[:100]}...")
+            logger.debug("[SQL_EXECUTOR] Executing query: %.100s...", sql_query)
             
-            # Create cursor
+            # Create cursor; autocommit is already set pool-wide, so no
+            # per-query session round trip is needed here
             cursor = connection.cursor(dictionary=True)
             
-            # Set query timeout if supported
-            if hasattr(cursor, '_connection'):
-                cursor._connection.autocommit = True
-            
             # Execute the query
             logger.info("Starting SQL execution")
-            cursor.execute(sql_query)
+            cursor.execute(self._with_time_limit(sql_query))
             logger.info("SQL execution completed")
             
-            # Fetch results
             if cursor.description:
                 # Query returns data (SELECT)
                 rows = cursor.fetchall()
-                
-                # Apply row limit
-                if len(rows) > self.config.max_rows:
-                    logger.warning(f"[SQL_EXECUTOR] Result truncated to {self.config.max_rows} rows")
-                    rows = rows[:self.config.max_rows]
-                
-                # Extract column information
-                columns = [desc[0] for desc in cursor.description]
-                data_types = self._extract_column_types(cursor.description)
-                
-                # Convert data for JSON serialization
-                serializable_data = self._make_serializable(rows)
-                
-                execution_time_ms = (time.time() - start_time) * 1000
-                
-                return SQLExecutionResult(
-                    success=True,
-                    data=serializable_data,
-                    row_count=len(rows),
-                    execution_time_ms=execution_time_ms,
-                    query_executed=sql_query,
-                    columns=columns,
-                    data_types=data_types
-                )
             else:
                 # Query doesn't return data (INSERT, UPDATE, DELETE)
-                affected_rows = cursor.rowcount
-                execution_time_ms = (time.time() - start_time) * 1000
-                
-                return SQLExecutionResult(
-                    success=True,
-                    data=[],
-                    row_count=affected_rows,
-                    execution_time_ms=execution_time_ms,
-                    query_executed=sql_query,
-                    columns=[],
-                    data_types={}
-                )
+                rows = None
+            
+            return self._build_result(
+                sql_query, cursor.description, rows, cursor.rowcount, start_time
+            )
                 
         except Exception as e:
             execution_time_ms = (time.time() - start_time) * 1000
             error_msg = f"SQL execution failed: {str(e)}"
             
-            logger.error(f"[SQL_EXECUTOR] {error_msg} (after {execution_time_ms:.2f}ms)")
+            logger.error("[SQL_EXECUTOR] %s (after %.2fms)", error_msg, execution_time_ms)
             
             return SQLExecutionResult(
                 success=False,
@@ -145,7 +151,81 @@ class SQLExecutorService:
                 if connection:
                     connection.close()
             except Exception as cleanup_error:
-                logger.warning(f"[SQL_EXECUTOR] Cleanup error: {cleanup_error}")
+                logger.warning("[SQL_EXECUTOR] Cleanup error: %s", cleanup_error)
+    
+    def _with_time_limit(self, sql_query: str) -> str:
+        """
+        Add a MAX_EXECUTION_TIME optimizer hint to a SELECT
+        
+        The server then aborts runaway queries itself, with no extra
+        session statement per query.
+        
+        Args:
+            sql_query: Validated SQL query
+            
+        Returns:
+            Query with the hint, or unchanged if it is not a SELECT
+        """
+        timeout_ms = int(self.config.timeout_seconds * 1000)
+        if timeout_ms <= 0:
+            return sql_query
+        return _LEADING_SELECT.sub(
+            f"SELECT /*+ MAX_EXECUTION_TIME({timeout_ms}) */", sql_query, count=1
+        )
+    
+    def _build_result(
+        self, sql_query: str, description, rows: Optional[List[Dict[str, Any]]],
+        rowcount: int, start_time: float
+    ) -> SQLExecutionResult:
+        """
+        Turn fetched rows into a SQLExecutionResult
+        
+        Args:
+            sql_query: Query as submitted (without the time-limit hint)
+            description: Cursor description, None for statements without rows
+            rows: Fetched dictionary rows, None for statements without rows
+            rowcount: Cursor rowcount, used when there are no rows
+            start_time: time.time() when execution started
+            
+        Returns:
+            Successful SQLExecutionResult
+        """
+        if rows is None:
+            execution_time_ms = (time.time() - start_time) * 1000
+            
+            return SQLExecutionResult(
+                success=True,
+                data=[],
+                row_count=rowcount,
+                execution_time_ms=execution_time_ms,
+                query_executed=sql_query,
+                columns=[],
+                data_types={}
+            )
+        
+        # Apply row limit
+        if len(rows) > self.config.max_rows:
+            logger.warning("[SQL_EXECUTOR] Result truncated to %s rows", self.config.max_rows)
+            rows = rows[:self.config.max_rows]
+        
+        # Extract column information
+        columns = [desc[0] for desc in description]
+        data_types = self._extract_column_types(description)
+        
+        # Convert data for JSON serialization
+        serializable_data = self._make_serializable(rows)
+        
+        execution_time_ms = (time.time() - start_time) * 1000
+        
+        return SQLExecutionResult(
+            success=True,
+            data=serializable_data,
+            row_count=len(rows),
+            execution_time_ms=execution_time_ms,
+            query_executed=sql_query,
+            columns=columns,
+            data_types=data_types
+        )
     
     def execute_sql_with_context(self, sql_query: str, app_state, context: dict) -> SQLExecutionResult:
         """
@@ -164,19 +244,231 @@ class SQLExecutorService:
             session_id = context.get('session_id', 'unknown')
             user_query = context.get('user_query', 'unknown')
             
+            key = self._result_cache_key(sql_query, app_state)
+            if key is not None:
+                cached = self._get_cached_result(key)
+                if cached is not None:
+                    return cached
+            
             # Execute the query
             result = self.execute_sql(sql_query, app_state)
             
+            # Only row-returning results are worth keeping
+            if key is not None and result.success and result.columns:
+                self._store_cached_result(key, result)
+            
+            return result
+            
+        except Exception as e:
+            logger.error("[SQL_EXECUTOR] Context execution error: %s", e)
+            return SQLExecutionResult(
+                success=False,
+                error=f"Context execution error: {str(e)}",
+                query_executed=sql_query
+            )
+    
+    async def aexecute_sql_with_context(self, sql_query: str, app_state, context: dict) -> SQLExecutionResult:
+        """
+        Execute SQL query on the running event loop
+        
+        Uses a per-loop aiomysql pool when aiomysql is installed, otherwise
+        runs execute_sql in a worker thread. The result cache is shared with
+        the sync path.
+        
+        Args:
+            sql_query: Validated SQL query to execute
+            app_state: Application state with MySQL configuration and pool
+            context: Additional context (session_id, user_info, etc.)
+            
+        Returns:
+            SQLExecutionResult with data or error
+        """
+        try:
+            key = self._result_cache_key(sql_query, app_state)
+            if key is not None:
+                cached = self._get_cached_result(key)
+                if cached is not None:
+                    return cached
+            
+            pool = await self._get_async_pool(app_state)
+            if pool is None:
+                result = await asyncio.to_thread(self.execute_sql, sql_query, app_state)
+            else:
+                result = await self._aexecute_sql(sql_query, pool)
+            
+            if key is not None and result.success and result.columns:
+                self._store_cached_result(key, result)
+            
             return result
             
         except Exception as e:
-            logger.error(f"[SQL_EXECUTOR] Context execution error: {e}")
+            logger.error("[SQL_EXECUTOR] Context execution error: %s", e)
             return SQLExecutionResult(
                 success=False,
                 error=f"Context execution error: {str(e)}",
                 query_executed=sql_query
             )
     
+    async def _aexecute_sql(self, sql_query: str, pool) -> SQLExecutionResult:
+        """
+        Execute SQL query on an aiomysql pool
+        
+        Args:
+            sql_query: Validated SQL query to execute
+            pool: aiomysql pool for the running loop
+            
+        Returns:
+            SQLExecutionResult with data or error
+        """
+        start_time = time.time()
+        
+        if not sql_query or not sql_query.strip():
+            return SQLExecutionResult(
+                success=False,
+                error="Empty SQL query provided"
+            )
+        
+        try:
+            async with pool.acquire() as connection:
+                async with connection.cursor(_aiomysql.DictCursor) as cursor:
+                    await cursor.execute(self._with_time_limit(sql_query))
+                    rows = await cursor.fetchall() if cursor.description else None
+                    return self._build_result(
+                        sql_query, cursor.description, rows, cursor.rowcount, start_time
+                    )
+                    
+        except Exception as e:
+            execution_time_ms = (time.time() - start_time) * 1000
+            error_msg = f"SQL execution failed: {str(e)}"
+            
+            logger.error("[SQL_EXECUTOR] %s (after %.2fms)", error_msg, execution_time_ms)
+            
+            return SQLExecutionResult(
+                success=False,
+                error=error_msg,
+                execution_time_ms=execution_time_ms,
+                query_executed=sql_query
+            )
+    
+    async def _get_async_pool(self, app_state):
+        """
+        Return the aiomysql pool for the running loop, creating it on first use
+        
+        Args:
+            app_state: Application state with MySQL configuration
+            
+        Returns:
+            aiomysql pool, or None if aiomysql is not installed
+        """
+        aiomysql = _aiomysql_module()
+        if aiomysql is None:
+            return None
+        
+        loop = asyncio.get_running_loop()
+        pool = self._async_pools.get(loop)
+        if pool is not None:
+            return pool
+        
+        mysql_config = app_state.config['mysql']
+        pool_size = max(mysql_config.get('pool_size', 32), 1)
+        pool = await aiomysql.create_pool(
+            host=mysql_config['host'],
+            port=mysql_config['port'],
+            user=mysql_config['user'],
+            password=mysql_config['password'],
+            db=mysql_config['database'],
+            charset=mysql_config['charset'],
+            autocommit=True,
+            minsize=min(4, pool_size),
+            maxsize=pool_size,
+            pool_recycle=1800,
+        )
+        
+        # Another task on this loop may have created one meanwhile
+        existing = self._async_pools.setdefault(loop, pool)
+        if existing is not pool:
+            pool.close()
+            await pool.wait_closed()
+        return existing
+    
+    async def aclose(self) -> None:
+        """Close the aiomysql pool of the running loop, if any"""
+        pool = self._async_pools.pop(asyncio.get_running_loop(), None)
+        if pool is not None:
+            pool.close()
+            await pool.wait_closed()
+    
+    def _result_cache_key(self, sql_query: str, app_state) -> Optional[Tuple[bytes, str]]:
+        """
+        Build the result cache key for a query
+        
+        Args:
+            sql_query: Validated SQL query
+            app_state: Application state, used for the database name
+            
+        Returns:
+            (digest of the normalized SQL, database name), or None if the
+            query must not be cached
+        """
+        if not self.config.enable_result_caching or not sql_query:
+            return None
+        if _VOLATILE_SQL.search(sql_query):
+            return None
+        
+        try:
+            database = app_state.config['mysql']['database']
+        except Exception:
+            database = ''
+        
+        # Case is kept: string literals may be compared case-sensitively
+        normalized = _WHITESPACE.sub(' ', sql_query).strip()
+        return hashlib.blake2b(normalized.encode(), digest_size=16).digest(), database
+    
+    def _get_cached_result(self, key: Tuple[bytes, str]) -> Optional[SQLExecutionResult]:
+        """
+        Return a copy of a live cached result
+        
+        Args:
+            key: Key from _result_cache_key
+            
+        Returns:
+            SQLExecutionResult with zero execution time, or None on a miss
+        """
+        with self._result_cache_lock:
+            entry = self._result_cache.get(key)
+            if entry is None or entry[1] <= time.monotonic():
+                if entry is not None:
+                    del self._result_cache[key]
+                self._cache_misses += 1
+                return None
+            self._result_cache.move_to_end(key)
+            self._cache_hits += 1
+        
+        # Rows are shared with the cache and must be treated as read-only
+        result = copy.copy(entry[0])
+        result.execution_time_ms = 0.0
+        return result
+    
+    def _store_cached_result(self, key: Tuple[bytes, str], result: SQLExecutionResult) -> None:
+        """
+        Cache a successful result, evicting the least recently used entry
+        
+        Args:
+            key: Key from _result_cache_key
+            result: Result to cache
+        """
+        expires_at = time.monotonic() + self.config.cache_ttl_seconds
+        with self._result_cache_lock:
+            self._result_cache[key] = (result, expires_at)
+            self._result_cache.move_to_end(key)
+            while len(self._result_cache) > self.config.cache_max_entries:
+                self._result_cache.popitem(last=False)
+    
+    def clear_result_cache(self) -> None:
+        """Drop every cached result"""
+        with self._result_cache_lock:
+            self._result_cache.clear()
+    
     def _extract_column_types(self, description) -> Dict[str, str]:
         """
         Extract column data types from cursor description
@@ -199,7 +491,7 @@ class SQLExecutorService:
                 data_types[column_name] = type_name
                 
         except Exception as e:
-            logger.warning(f"[SQL_EXECUTOR] Error extracting column types: {e}")
+            logger.warning("[SQL_EXECUTOR] Error extracting column types: %s", e)
         
         return data_types
     
@@ -319,7 +611,13 @@ class SQLExecutorService:
             "config": {
                 "max_rows": self.config.max_rows,
                 "timeout_seconds": self.config.timeout_seconds,
-                "query_logging": self.config.enable_query_logging
+                "query_logging": self.config.enable_query_logging,
+                "result_caching": self.config.enable_result_caching
+            },
+            "result_cache": {
+                "entries": len(self._result_cache),
+                "hits": self._cache_hits,
+                "misses": self._cache_misses
             },
             "status": "active"
         }
@@ -332,6 +630,7 @@ class SQLExecutorService:
             new_config: New execution configuration
         """
         self.config = new_config
+        self.clear_result_cache()
     
     def health_check(self, app_state) -> dict:
         """
@@ -369,3 +668,18 @@ class SQLExecutorService:
                 "status": "unhealthy",
                 "error": str(e)
             }
+    
+    async def ahealth_check(self, app_state) -> dict:
+        """
+        Async counterpart of health_check
+        
+        The connection test uses the synchronous pool, so it runs in a
+        worker thread rather than blocking the event loop.
+        
+        Args:
+            app_state: Application state with MySQL connection
+            
+        Returns:
+            Health status dictionary
+        """
+        return await asyncio.to_thread(self.health_check, app_state)
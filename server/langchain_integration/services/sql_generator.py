@@ -5,15 +5,21 @@ Uses LangChain with LLM to convert natural language queries to SQL.
 Processes the final_prompt from chat_handler and generates SQL queries.
 """
 
+import hashlib
 import logging
+import re
 import time
 import os
-from typing import Optional
+from typing import Dict, Iterator, List, Optional, Tuple
 
 from langchain_openai import ChatOpenAI
-from langchain_core.prompts import PromptTemplate
-from langchain_core.output_parsers import StrOutputParser
+from langchain_core.messages import AIMessage
+from langchain_core.prompts import ChatPromptTemplate
 
+from .async_batcher import AsyncBatcher
+from .http_clients import llm_http_clients
+from .token_counter import count_tokens
+from .vllm_backend import VLLMDirectBackend, is_local_llm
 from ..models.response_models import (
     SQLGenerationResult, 
     SQLGenerationError,
@@ -23,6 +29,49 @@ from ..models.response_models import (
 
 logger = logging.getLogger(__name__)
 
+# Start of an "A[i]:" answer block in a batched completion
+_ANSWER_MARKER = re.compile(r"^\s*A\[(\d+)\]:[ \t]*", re.MULTILINE)
+
+# Start of the per-request part of a final_prompt; everything before it
+# (system and tool context) is identical across requests
+_USER_CONTEXT_MARKER = "[USER CONTEXT]"
+
+_HEALTH_CHECK_PROMPT = "Generate a simple SELECT query for payment_intent table"
+
+
+def _retry_after_seconds(error: Exception) -> Optional[float]:
+    """
+    Read the Retry-After header from a failed provider call
+    
+    Args:
+        error: Exception raised by the LLM client
+        
+    Returns:
+        Seconds to wait, or None if the response carried no numeric Retry-After
+    """
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+def prompt_prefix_digest(final_prompt: str) -> bytes:
+    """
+    Digest of the shared part of a final_prompt (system and tool context)
+    
+    Args:
+        final_prompt: Complete prompt from chat_handler
+        
+    Returns:
+        16-byte blake2b digest; equal digests mean the same schema and system context
+    """
+    prefix = final_prompt.partition(_USER_CONTEXT_MARKER)[0]
+    return hashlib.blake2b(prefix.encode(), digest_size=16).digest()
+
 
 class SQLGeneratorService:
     """Service for generating SQL from natural language using LLM"""
@@ -37,8 +86,13 @@ class SQLGeneratorService:
         self.config = config or LLMConfig()
         self.llm = None
         self.chain = None
+        self.batch_chain = None
+        # Digest of the last shared prompt prefix, to log cache-busting changes
+        self._prefix_hash: Optional[str] = None
+        self._batcher: Optional[AsyncBatcher] = None
         self._initialize_llm()
         self._initialize_chain()
+        self._initialize_batcher()
     
     def _initialize_llm(self) -> None:
         """Initialize the LLM with configuration"""
@@ -48,7 +102,7 @@ class SQLGeneratorService:
             api_base = self.config.api_base
             model_name = self.config.model_name
             
-            if not api_key:
+            if not api_key and not is_local_llm(api_base):
                 raise SQLGenerationError("AI API key not configured in app_state")
             
             if not api_base:
@@ -57,27 +111,40 @@ class SQLGeneratorService:
             if not model_name:
                 raise SQLGenerationError("AI model name not configured in app_state")
             
+            if is_local_llm(api_base):
+                # Self-hosted model served in-process by vLLM
+                self.llm = VLLMDirectBackend(
+                    model_name=model_name,
+                    temperature=self.config.sql_generation_temperature
+                )
+                return
+            
             # Initialize ChatOpenAI with Google AI endpoint
             self.llm = ChatOpenAI(
                 model=model_name,
                 openai_api_base=api_base,
                 openai_api_key=api_key,
                 temperature=self.config.sql_generation_temperature,
-                timeout=self.config.timeout_seconds
+                timeout=self.config.timeout_seconds,
+                **llm_http_clients(api_base, self.config.timeout_seconds)
             )
             
         except Exception as e:
-            logger.error(f"[SQL_GEN_CONFIG] ❌ Failed to initialize LLM: {type(e).__name__}: {e}")
+            logger.error("[SQL_GEN_CONFIG] ❌ Failed to initialize LLM: %s: %s", type(e).__name__, e)
             raise SQLGenerationError(f"LLM initialization failed: {e}", e)
     
     def _initialize_chain(self) -> None:
-        """Initialize the LangChain chain for SQL generation"""
+        """
+        Initialize the LangChain chains for SQL generation
+        
+        Static content (instructions, system and tool context) goes in the
+        system message and only the user context in the human message, so
+        every request shares the longest possible prompt prefix and the
+        provider's automatic prefix cache can skip its prefill.
+        """
         try:
             # Create prompt template for SQL generation
-            sql_prompt_template = """
-You are an expert SQL query generator for payment analytics. Your task is to convert natural language queries into valid MySQL SQL queries.
-
-{final_prompt}
+            sql_system_template = """You are an expert SQL query generator for payment analytics. Your task is to convert natural language queries into valid MySQL SQL queries.
 
 IMPORTANT INSTRUCTIONS:
 1. Generate ONLY the SQL query, no explanations or markdown formatting
@@ -88,22 +155,108 @@ IMPORTANT INSTRUCTIONS:
 6. Do not include semicolons at the end
 7. Return only the raw SQL query
 
-SQL Query:"""
+{prompt_prefix}"""
 
             # Create prompt template
-            prompt = PromptTemplate(
-                input_variables=["final_prompt"],
-                template=sql_prompt_template
-            )
+            prompt = ChatPromptTemplate.from_messages([
+                ("system", sql_system_template),
+                ("human", "{prompt_suffix}\n\nSQL Query:"),
+            ])
             
-            # Create chain with output parser
-            output_parser = StrOutputParser()
-            self.chain = prompt | self.llm | output_parser
+            # Chains return the AIMessage so token usage stays available
+            self.chain = prompt | self.llm
+            
+            # Batched variant: several numbered queries answered in one call
+            batch_system_template = """You are an expert SQL query generator for payment analytics. Your task is to convert each numbered natural language query into a valid MySQL SQL query.
+
+IMPORTANT INSTRUCTIONS:
+1. Answer every query Q[i] with one block that starts on a new line with "A[i]:" followed by its SQL query
+2. Generate ONLY the SQL queries, no explanations or markdown formatting
+3. Use proper MySQL syntax
+4. Include appropriate WHERE clauses for data filtering
+5. Use table aliases for better readability
+6. Ensure each query is safe and follows best practices
+7. Do not include semicolons at the end
+
+{prompt_prefix}"""
+            
+            batch_prompt = ChatPromptTemplate.from_messages([
+                ("system", batch_system_template),
+                ("human", "{prompt_suffix}\n\nSQL Queries:"),
+            ])
+            self.batch_chain = batch_prompt | self.llm
             
         except Exception as e:
-            logger.error(f"Failed to initialize chain: {e}")
+            logger.error("Failed to initialize chain: %s", e)
             raise SQLGenerationError(f"Chain initialization failed: {e}", e)
     
+    def _initialize_batcher(self) -> None:
+        """Coalesce concurrent async generations unless disabled by config"""
+        self._batcher = None
+        if self.config.batch_window_ms > 0:
+            # Identical prompts in one window share a single completion
+            self._batcher = AsyncBatcher(
+                self._agenerate_batch,
+                max_batch=self.config.batch_max_size,
+                max_wait_ms=self.config.batch_window_ms,
+                key=lambda prompt: prompt,
+            )
+    
+    async def _agenerate_batch(self, final_prompts: List[str]) -> List[object]:
+        """
+        Run one coalesced window of generations over the shared async client
+        
+        Args:
+            final_prompts: Distinct prompts collected by the batcher
+            
+        Returns:
+            One AIMessage or exception per prompt, in order
+        """
+        return await self.chain.abatch(
+            [self._chain_input(prompt) for prompt in final_prompts],
+            return_exceptions=True,
+        )
+    
+    def _chain_input(self, final_prompt: str) -> Dict[str, str]:
+        """
+        Split final_prompt into its shared prefix and per-request suffix
+        
+        Args:
+            final_prompt: Complete prompt from chat_handler
+            
+        Returns:
+            Variables for the generation prompt templates
+        """
+        prefix, marker, suffix = final_prompt.partition(_USER_CONTEXT_MARKER)
+        if not marker:
+            # No user context section: nothing is known to be shared
+            return {"prompt_prefix": "", "prompt_suffix": final_prompt}
+        
+        prefix_hash = hashlib.blake2b(prefix.encode(), digest_size=16).hexdigest()
+        if prefix_hash != self._prefix_hash:
+            logger.info("Prompt prefix changed (%s); provider prefix cache starts cold", prefix_hash)
+            self._prefix_hash = prefix_hash
+        
+        return {"prompt_prefix": prefix.rstrip(), "prompt_suffix": marker + suffix}
+    
+    @staticmethod
+    def _token_usage(message: AIMessage) -> Tuple[Optional[int], Optional[int], Optional[int]]:
+        """
+        Read token usage reported by the provider
+        
+        Args:
+            message: Completion returned by the chain
+            
+        Returns:
+            Tuple of (prompt tokens, completion tokens, cached prompt tokens);
+            entries are None when the provider did not report them
+        """
+        usage = getattr(message, "usage_metadata", None)
+        if not usage:
+            return None, None, None
+        details = usage.get("input_token_details") or {}
+        return usage.get("input_tokens"), usage.get("output_tokens"), details.get("cache_read")
+    
     def generate_sql(self, final_prompt: str) -> SQLGenerationResult:
         """
         Generate SQL from the final prompt
@@ -118,97 +271,275 @@ SQL Query:"""
         
         try:
             # Validate input
-            if not final_prompt or not final_prompt.strip():
-                logger.error("[SQL_GEN_DEBUG] ❌ Empty final_prompt provided")
-                return SQLGenerationResult(
-                    success=False,
-                    error="Empty final_prompt provided"
-                )
-            
-            # Check for key sections in prompt
-            has_system = "[SYSTEM CONTEXT]" in final_prompt
-            has_tool = "[TOOL CONTEXT]" in final_prompt
-            has_user = "[USER CONTEXT]" in final_prompt
-            logger.debug(f"[SQL_GEN_DEBUG]   - First 300 chars: {final_prompt[:300]}...")
-            logger.debug(f"[SQL_GEN_DEBUG]   - Last 200 chars: ...{final_prompt[-200:]}")
+            invalid = self._check_final_prompt(final_prompt)
+            if invalid:
+                return invalid
             
             # LLM invocation with logging
             logger.info("Starting LLM call")
             
             try:
-                sql_query = self.chain.invoke({"final_prompt": final_prompt})
+                message = self.chain.invoke(self._chain_input(final_prompt))
                 logger.info("LLM call completed")
             except Exception as llm_error:
-                logger.error(f"[SQL_GEN_DEBUG] ❌ LLM call failed: {type(llm_error).__name__}: {llm_error}")
-                
-                # Detailed error analysis
-                error_str = str(llm_error).lower()
-                if "authentication" in error_str or "unauthorized" in error_str:
-                    logger.error("[SQL_GEN_DEBUG] 🔑 Authentication issue detected - check API key")
-                elif "rate limit" in error_str or "quota" in error_str:
-                    logger.error("[SQL_GEN_DEBUG] 🚫 Rate limit/quota issue detected")
-                elif "model" in error_str or "not found" in error_str:
-                    logger.error("[SQL_GEN_DEBUG] 🤖 Model issue detected - check model name")
-                elif "timeout" in error_str:
-                    logger.error("[SQL_GEN_DEBUG] ⏰ Timeout issue detected")
-                elif "network" in error_str or "connection" in error_str:
-                    logger.error("[SQL_GEN_DEBUG] 🌐 Network/connection issue detected")
-                
-                raise llm_error
-            
-            # Clean up the generated SQL
-            original_sql = sql_query
-            cleaned_sql = self._clean_sql_output(sql_query)
-            
-            logger.debug(f"[SQL_GEN_DEBUG]   - Raw response: '{sql_query}'")
-            logger.debug(f"[SQL_GEN_DEBUG]   - Before cleaning: '{original_sql}'")
-            logger.debug(f"[SQL_GEN_DEBUG]   - After cleaning: '{cleaned_sql}'")
-            
-            # Validate the generated SQL
-            if not cleaned_sql or not cleaned_sql.strip():
-                logger.error("[SQL_GEN_DEBUG] ❌ Final validation failed - empty SQL after cleaning")
-                logger.error(f"[SQL_GEN_DEBUG] Debug info:")
-                logger.error(f"[SQL_GEN_DEBUG]   - Original was empty: {not original_sql}")
-                logger.error(f"[SQL_GEN_DEBUG]   - Original content: '{original_sql}'")
-                logger.error(f"[SQL_GEN_DEBUG]   - Cleaned content: '{cleaned_sql}'")
-                
-                return SQLGenerationResult(
-                    success=False,
-                    error="LLM returned empty SQL query"
-                )
+                self._log_llm_error(llm_error)
+                raise
             
-            # Determine query type
-            query_type = self._determine_query_type(cleaned_sql)
+            return self._build_generation_result(message, final_prompt, start_time)
             
-            # Calculate processing time
-            generation_time_ms = (time.time() - start_time) * 1000
+        except Exception as e:
+            return self._generation_failed(e, start_time)
+    
+    async def agenerate_sql(self, final_prompt: str) -> SQLGenerationResult:
+        """
+        Generate SQL from the final prompt without blocking the event loop
+        
+        Same contract as generate_sql; the LLM call is awaited through the
+        chain's async client so many generations can be in flight at once.
+        
+        Args:
+            final_prompt: Complete prompt from chat_handler containing system, tool, and user context
             
-            logger.debug(f"[SQL_GEN_DEBUG]   - Final SQL: {cleaned_sql[:200]}...")
+        Returns:
+            SQLGenerationResult with generated SQL or error
+        """
+        start_time = time.time()
+        
+        try:
+            invalid = self._check_final_prompt(final_prompt)
+            if invalid:
+                return invalid
             
-            return SQLGenerationResult(
-                success=True,
-                sql_query=cleaned_sql,
-                query_type=query_type,
-                generation_time_ms=generation_time_ms,
-                # Note: Token counting would require additional API calls
-                # For now, we'll estimate based on content length
-                prompt_tokens=self._estimate_tokens(final_prompt),
-                completion_tokens=self._estimate_tokens(cleaned_sql)
-            )
+            logger.info("Starting async LLM call")
+            
+            try:
+                if self._batcher:
+                    message = await self._batcher.submit(final_prompt)
+                else:
+                    message = await self.chain.ainvoke(self._chain_input(final_prompt))
+                logger.info("Async LLM call completed")
+            except Exception as llm_error:
+                self._log_llm_error(llm_error)
+                raise
+            
+            return self._build_generation_result(message, final_prompt, start_time)
             
         except Exception as e:
-            generation_time_ms = (time.time() - start_time) * 1000
-            error_msg = f"SQL generation failed: {str(e)}"
+            return self._generation_failed(e, start_time)
+    
+    @staticmethod
+    def _check_final_prompt(final_prompt: str) -> Optional[SQLGenerationResult]:
+        """
+        Reject an empty prompt before any LLM call
+        
+        Args:
+            final_prompt: Prompt about to be sent
             
-            logger.error(f"[SQL_GEN_DEBUG] ❌ Generation failed after {generation_time_ms:.2f}ms")
-            logger.error(f"[SQL_GEN_DEBUG] Error type: {type(e).__name__}")
-            logger.error(f"[SQL_GEN_DEBUG] Error message: {str(e)}")
+        Returns:
+            Failed SQLGenerationResult if the prompt is empty, None otherwise
+        """
+        if not final_prompt or not final_prompt.strip():
+            logger.error("[SQL_GEN_DEBUG] ❌ Empty final_prompt provided")
+            return SQLGenerationResult(
+                success=False,
+                error="Empty final_prompt provided"
+            )
+        
+        # %.300s truncates only if the record is emitted; the tail slice
+        # has no lazy form, so it is guarded
+        logger.debug("[SQL_GEN_DEBUG]   - First 300 chars: %.300s...", final_prompt)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("[SQL_GEN_DEBUG]   - Last 200 chars: ...%s", final_prompt[-200:])
+        return None
+    
+    @staticmethod
+    def _log_llm_error(llm_error: Exception) -> None:
+        """
+        Log a failed LLM call with a hint at the likely cause
+        
+        Args:
+            llm_error: Exception raised by the chain
+        """
+        logger.error("[SQL_GEN_DEBUG] ❌ LLM call failed: %s: %s", type(llm_error).__name__, llm_error)
+        
+        # Detailed error analysis
+        error_str = str(llm_error).lower()
+        if "authentication" in error_str or "unauthorized" in error_str:
+            logger.error("[SQL_GEN_DEBUG] 🔑 Authentication issue detected - check API key")
+        elif "rate limit" in error_str or "quota" in error_str:
+            logger.error("[SQL_GEN_DEBUG] 🚫 Rate limit/quota issue detected")
+        elif "model" in error_str or "not found" in error_str:
+            logger.error("[SQL_GEN_DEBUG] 🤖 Model issue detected - check model name")
+        elif "timeout" in error_str:
+            logger.error("[SQL_GEN_DEBUG] ⏰ Timeout issue detected")
+        elif "network" in error_str or "connection" in error_str:
+            logger.error("[SQL_GEN_DEBUG] 🌐 Network/connection issue detected")
+    
+    def _build_generation_result(self, message: AIMessage, final_prompt: str, start_time: float) -> SQLGenerationResult:
+        """
+        Clean the raw completion and wrap it in a SQLGenerationResult
+        
+        Args:
+            message: LLM completion
+            final_prompt: Prompt that produced it, for token estimation
+            start_time: time.time() when generation started
+            
+        Returns:
+            SQLGenerationResult with the cleaned SQL, or an error if it is empty
+        """
+        # Clean up the generated SQL
+        sql_query = message.content
+        original_sql = sql_query
+        cleaned_sql = self._clean_sql_output(sql_query)
+        
+        logger.debug("[SQL_GEN_DEBUG]   - Raw response: '%s'", sql_query)
+        logger.debug("[SQL_GEN_DEBUG]   - After cleaning: '%s'", cleaned_sql)
+        
+        # Validate the generated SQL
+        if not cleaned_sql or not cleaned_sql.strip():
+            logger.error("[SQL_GEN_DEBUG] ❌ Final validation failed - empty SQL after cleaning")
+            logger.error("[SQL_GEN_DEBUG] Debug info:")
+            logger.error("[SQL_GEN_DEBUG]   - Original was empty: %s", not original_sql)
+            logger.error("[SQL_GEN_DEBUG]   - Original content: '%s'", original_sql)
+            logger.error("[SQL_GEN_DEBUG]   - Cleaned content: '%s'", cleaned_sql)
             
             return SQLGenerationResult(
                 success=False,
-                error=error_msg,
-                generation_time_ms=generation_time_ms
+                error="LLM returned empty SQL query"
             )
+        
+        # Determine query type
+        query_type = self._determine_query_type(cleaned_sql)
+        
+        # Calculate processing time
+        generation_time_ms = (time.time() - start_time) * 1000
+        
+        logger.debug("[SQL_GEN_DEBUG]   - Final SQL: %.200s...", cleaned_sql)
+        
+        # Prefer provider-reported usage; estimate from length otherwise
+        prompt_tokens, completion_tokens, cached_prompt_tokens = self._token_usage(message)
+        
+        return SQLGenerationResult(
+            success=True,
+            sql_query=cleaned_sql,
+            query_type=query_type,
+            generation_time_ms=generation_time_ms,
+            prompt_tokens=prompt_tokens if prompt_tokens is not None else self._estimate_tokens(final_prompt),
+            completion_tokens=completion_tokens if completion_tokens is not None else self._estimate_tokens(cleaned_sql),
+            cached_prompt_tokens=cached_prompt_tokens
+        )
+    
+    @staticmethod
+    def _generation_failed(e: Exception, start_time: float) -> SQLGenerationResult:
+        """
+        Log a failed generation and wrap it in a SQLGenerationResult
+        
+        Args:
+            e: Exception that ended the generation
+            start_time: time.time() when generation started
+            
+        Returns:
+            Failed SQLGenerationResult
+        """
+        generation_time_ms = (time.time() - start_time) * 1000
+        error_msg = f"SQL generation failed: {str(e)}"
+        
+        logger.error("[SQL_GEN_DEBUG] ❌ Generation failed after %.2fms", generation_time_ms)
+        logger.error("[SQL_GEN_DEBUG] Error type: %s", type(e).__name__)
+        logger.error("[SQL_GEN_DEBUG] Error message: %s", str(e))
+        
+        return SQLGenerationResult(
+            success=False,
+            error=error_msg,
+            generation_time_ms=generation_time_ms,
+            retry_after_seconds=_retry_after_seconds(e)
+        )
+    
+    def generate_sql_batch(self, final_prompt: str, query_count: int) -> List[SQLGenerationResult]:
+        """
+        Generate SQL for several numbered queries with a single LLM call
+        
+        Args:
+            final_prompt: Complete prompt whose user context lists queries as Q[1]..Q[n]
+            query_count: Number of queries in the prompt
+            
+        Returns:
+            One SQLGenerationResult per query, in Q[i] order
+        """
+        start_time = time.time()
+        
+        try:
+            if not final_prompt or not final_prompt.strip():
+                return [
+                    SQLGenerationResult(success=False, error="Empty final_prompt provided")
+                    for _ in range(query_count)
+                ]
+            
+            logger.info("Starting batched LLM call for %d queries", query_count)
+            message = self.batch_chain.invoke(self._chain_input(final_prompt))
+            logger.info("Batched LLM call completed")
+            
+            answers = dict(self._iter_answer_blocks(message.content))
+            generation_time_ms = (time.time() - start_time) * 1000
+            # The shared prompt cost is split evenly across the batch
+            prompt_tokens, _, cached_prompt_tokens = self._token_usage(message)
+            if prompt_tokens is None:
+                prompt_tokens = self._estimate_tokens(final_prompt)
+            prompt_tokens //= query_count
+            if cached_prompt_tokens is not None:
+                cached_prompt_tokens //= query_count
+            
+            results = []
+            for index in range(1, query_count + 1):
+                cleaned_sql = self._clean_sql_output(answers.get(index, ""))
+                if not cleaned_sql:
+                    results.append(SQLGenerationResult(
+                        success=False,
+                        error=f"LLM returned no SQL for query {index}",
+                        generation_time_ms=generation_time_ms
+                    ))
+                    continue
+                
+                results.append(SQLGenerationResult(
+                    success=True,
+                    sql_query=cleaned_sql,
+                    query_type=self._determine_query_type(cleaned_sql),
+                    generation_time_ms=generation_time_ms,
+                    prompt_tokens=prompt_tokens,
+                    completion_tokens=self._estimate_tokens(cleaned_sql),
+                    cached_prompt_tokens=cached_prompt_tokens
+                ))
+            
+            return results
+            
+        except Exception as e:
+            generation_time_ms = (time.time() - start_time) * 1000
+            logger.error("[SQL_GEN_DEBUG] ❌ Batched generation failed after %.2fms: %s: %s", generation_time_ms, type(e).__name__, e)
+            
+            return [
+                SQLGenerationResult(
+                    success=False,
+                    error=f"SQL generation failed: {str(e)}",
+                    generation_time_ms=generation_time_ms
+                )
+                for _ in range(query_count)
+            ]
+    
+    @staticmethod
+    def _iter_answer_blocks(completion: str) -> Iterator[Tuple[int, str]]:
+        """
+        Split a batched completion into its A[i] answer blocks
+        
+        Args:
+            completion: Raw LLM output containing "A[i]:" blocks
+            
+        Yields:
+            (i, block text) pairs in the order they appear
+        """
+        matches = list(_ANSWER_MARKER.finditer(completion or ""))
+        for current, following in zip(matches, matches[1:] + [None]):
+            end = following.start() if following else len(completion)
+            yield int(current.group(1)), completion[current.end():end]
     
     def _clean_sql_output(self, sql_output: str) -> str:
         """
@@ -266,16 +597,15 @@ SQL Query:"""
     
     def _estimate_tokens(self, text: str) -> int:
         """
-        Estimate token count for text (rough approximation)
+        Count tokens for text the provider did not report usage for
         
         Args:
-            text: Text to estimate tokens for
+            text: Text to count tokens for
             
         Returns:
-            Estimated token count
+            Token count (length-based estimate if no tiktoken encoder is available)
         """
-        # Rough estimation: ~4 characters per token for English text
-        return len(text) // 4
+        return count_tokens(text, self.config.model_name)
     
     def update_config(self, new_config: LLMConfig) -> None:
         """
@@ -287,6 +617,7 @@ SQL Query:"""
         self.config = new_config
         self._initialize_llm()
         self._initialize_chain()
+        self._initialize_batcher()
     
     def health_check(self) -> dict:
         """
@@ -303,22 +634,47 @@ SQL Query:"""
                 }
             
             # Test with a simple prompt
-            test_result = self.generate_sql("Generate a simple SELECT query for payment_intent table")
-            
-            if test_result.success:
-                return {
-                    "status": "healthy",
-                    "model": self.config.model_name,
-                    "generation_time_ms": test_result.generation_time_ms
-                }
-            else:
+            test_result = self.generate_sql(_HEALTH_CHECK_PROMPT)
+            return self._health_from_result(test_result)
+                
+        except Exception as e:
+            return {
+                "status": "unhealthy",
+                "error": str(e)
+            }
+    
+    async def ahealth_check(self) -> dict:
+        """
+        Async counterpart of health_check
+        
+        Returns:
+            Health status dictionary
+        """
+        try:
+            if not self.llm or not self.chain:
                 return {
                     "status": "unhealthy",
-                    "error": test_result.error
+                    "error": "LLM or chain not initialized"
                 }
+            
+            test_result = await self.agenerate_sql(_HEALTH_CHECK_PROMPT)
+            return self._health_from_result(test_result)
                 
         except Exception as e:
             return {
                 "status": "unhealthy",
                 "error": str(e)
             }
+    
+    def _health_from_result(self, test_result: SQLGenerationResult) -> dict:
+        """Map a test generation to a health status dictionary"""
+        if test_result.success:
+            return {
+                "status": "healthy",
+                "model": self.config.model_name,
+                "generation_time_ms": test_result.generation_time_ms
+            }
+        return {
+            "status": "unhealthy",
+            "error": test_result.error
+        }
@@ -65,7 +65,7 @@ class SQLValidatorService:
                     error=f"Query too long (max {self.config.max_query_length} characters)"
                 )
             
-            logger.debug(f"[SQL_VALIDATOR] Validating query: {sql_query[:100]}...")
+            logger.debug("[SQL_VALIDATOR] Validating query: %.100s...", sql_query)
             
             # Use comprehensive validation as primary method
             # This provides better validation coverage while the full internal validator is pending
@@ -79,8 +79,8 @@ class SQLValidatorService:
                 # If basic validator gives a different result, log it but use comprehensive result
                 if basic_result.isValid != validation_result.isValid:
                     logger.warning(
-                        f"[SQL_VALIDATOR] Validation mismatch - "
-                        f"Comprehensive: {validation_result.isValid}, Basic: {basic_result.isValid}"
+                        "[SQL_VALIDATOR] Validation mismatch - Comprehensive: %s, Basic: %s",
+                        validation_result.isValid, basic_result.isValid
                     )
             
             # Calculate validation time
@@ -88,9 +88,9 @@ class SQLValidatorService:
             
             if validation_result.isValid:
                 if validation_result.validated_tables:
-                    logger.debug(f"[SQL_VALIDATOR] Validated tables: {validation_result.validated_tables}")
+                    logger.debug("[SQL_VALIDATOR] Validated tables: %s", validation_result.validated_tables)
             else:
-                logger.warning(f"[SQL_VALIDATOR] SQL validation failed in {validation_time_ms:.2f}ms: {validation_result.error}")
+                logger.warning("[SQL_VALIDATOR] SQL validation failed in %.2fms: %s", validation_time_ms, validation_result.error)
             
             return validation_result
             
@@ -98,7 +98,7 @@ class SQLValidatorService:
             validation_time_ms = (time.time() - start_time) * 1000
             error_msg = f"SQL validation error: {str(e)}"
             
-            logger.error(f"[SQL_VALIDATOR] {error_msg} (after {validation_time_ms:.2f}ms)")
+            logger.error("[SQL_VALIDATOR] %s (after %.2fms)", error_msg, validation_time_ms)
             
             return SQLValidationResult(
                 isValid=False,
@@ -140,7 +140,7 @@ class SQLValidatorService:
             return result
             
         except Exception as e:
-            logger.error(f"[SQL_VALIDATOR] Context validation error: {e}")
+            logger.error("[SQL_VALIDATOR] Context validation error: %s", e)
             return SQLValidationResult(
                 isValid=False,
                 error=f"Context validation error: {str(e)}"
@@ -190,7 +190,7 @@ class SQLValidatorService:
                 result = self.validate_sql(sql_query, f"{internal_id}_batch_{i}")
                 results.append(result)
             except Exception as e:
-                logger.error(f"[SQL_VALIDATOR] Batch validation error for query {i}: {e}")
+                logger.error("[SQL_VALIDATOR] Batch validation error for query %s: %s", i, e)
                 results.append(SQLValidationResult(
                     isValid=False,
                     error=f"Batch validation error: {str(e)}"
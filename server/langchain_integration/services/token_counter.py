@@ -0,0 +1,67 @@
+"""
+Token Counter
+
+Counts prompt and completion tokens with tiktoken's BPE encoders, falling
+back to a characters-per-token estimate when no encoder can be loaded.
+"""
+
+import logging
+from functools import lru_cache
+
+logger = logging.getLogger(__name__)
+
+# Encoder used for models tiktoken does not know (e.g. non-OpenAI models
+# behind an OpenAI-compatible endpoint)
+_DEFAULT_ENCODING = "cl100k_base"
+
+# Rough characters per token for English text
+_CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=8)
+def _encoding_for(model_name: str):
+    """
+    Load the tiktoken encoder for a model, once per model name
+
+    tiktoken downloads encoder files on first use (or reads them from
+    TIKTOKEN_CACHE_DIR), so a failure is cached as None instead of being
+    retried on every call.
+
+    Args:
+        model_name: Model name from LLMConfig
+
+    Returns:
+        tiktoken Encoding, or None if none could be loaded
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+
+    try:
+        try:
+            return tiktoken.encoding_for_model(model_name)
+        except KeyError:
+            return tiktoken.get_encoding(_DEFAULT_ENCODING)
+    except Exception as e:
+        logger.warning(
+            "[TOKEN_COUNTER] tiktoken encoder unavailable, estimating tokens from length: %s", e
+        )
+        return None
+
+
+def count_tokens(text: str, model_name: str = "") -> int:
+    """
+    Count the tokens in a text
+
+    Args:
+        text: Prompt or completion text
+        model_name: Model the text is sent to or produced by
+
+    Returns:
+        Token count, or a length-based estimate if no encoder is available
+    """
+    encoding = _encoding_for(model_name)
+    if encoding is None:
+        return len(text) // _CHARS_PER_TOKEN
+    return len(encoding.encode(text, disallowed_special=()))
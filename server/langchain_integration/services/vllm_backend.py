@@ -0,0 +1,167 @@
+"""
+vLLM Direct Backend
+
+Chat model that runs a self-hosted model in-process through vLLM's
+AsyncLLMEngine instead of calling an OpenAI-compatible HTTP endpoint. The
+services select it when ``api_base`` starts with ``local://``; it is a
+LangChain chat model, so the existing chains and parsers work unchanged.
+
+vLLM is optional and only imported when a local endpoint is configured.
+"""
+
+import asyncio
+import logging
+import threading
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.callbacks import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage, BaseMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+logger = logging.getLogger(__name__)
+
+LOCAL_LLM_SCHEME = "local://"
+
+_ROLES = {"system": "system", "human": "user", "ai": "assistant"}
+
+# One engine (and the event loop it runs on) per model, shared by every
+# service so the weights are loaded onto the GPU once
+_engines: Dict[Tuple[str, int], Tuple[Any, asyncio.AbstractEventLoop]] = {}
+_engines_lock = threading.Lock()
+
+
+def is_local_llm(api_base: Optional[str]) -> bool:
+    """Whether an API base selects the in-process vLLM backend"""
+    return bool(api_base) and api_base.startswith(LOCAL_LLM_SCHEME)
+
+
+def _shared_engine(model_name: str, max_num_seqs: int) -> Tuple[Any, asyncio.AbstractEventLoop]:
+    """
+    Get the engine for a model, starting it on first use
+
+    The engine is bound to the event loop it first generates on, so it gets
+    a private loop on a daemon thread that sync and async callers submit to.
+
+    Args:
+        model_name: Model name or path passed to vLLM
+        max_num_seqs: Most sequences vLLM batches together
+
+    Returns:
+        Tuple of (AsyncLLMEngine, event loop it runs on)
+    """
+    key = (model_name, max_num_seqs)
+    with _engines_lock:
+        if key not in _engines:
+            try:
+                from vllm import AsyncEngineArgs, AsyncLLMEngine
+            except ImportError as e:
+                raise ImportError(
+                    f"vllm is required for {LOCAL_LLM_SCHEME} LLM endpoints"
+                ) from e
+
+            logger.info("[VLLM] Starting engine for %s", model_name)
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="vllm-engine", daemon=True
+            ).start()
+            engine = AsyncLLMEngine.from_engine_args(
+                AsyncEngineArgs(model=model_name, max_num_seqs=max_num_seqs)
+            )
+            _engines[key] = (engine, loop)
+        return _engines[key]
+
+
+class VLLMDirectBackend(BaseChatModel):
+    """
+    LangChain chat model backed by an in-process vLLM engine
+
+    Concurrent requests from both services are continuously batched by the
+    one shared engine. Streaming falls back to a single chunk per call.
+    """
+
+    model_name: str
+    temperature: float = 0.1
+    # vLLM's own default is 16 tokens, too few for SQL or a summary
+    max_tokens: int = 1024
+    max_num_seqs: int = 64
+
+    @property
+    def _llm_type(self) -> str:
+        return "vllm-direct"
+
+    @property
+    def _identifying_params(self) -> Dict[str, Any]:
+        return {"model_name": self.model_name, "temperature": self.temperature}
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return self._submit(messages, stop).result()
+
+    async def _agenerate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        return await asyncio.wrap_future(self._submit(messages, stop))
+
+    def _submit(self, messages: List[BaseMessage], stop: Optional[List[str]]):
+        """Schedule a generation on the engine's loop and return its future"""
+        engine, loop = _shared_engine(self.model_name, self.max_num_seqs)
+        return asyncio.run_coroutine_threadsafe(
+            self._run(engine, messages, stop), loop
+        )
+
+    async def _run(
+        self, engine: Any, messages: List[BaseMessage], stop: Optional[List[str]]
+    ) -> ChatResult:
+        """
+        Generate one completion on the engine's loop
+
+        Args:
+            engine: Shared AsyncLLMEngine
+            messages: Chat messages to complete
+            stop: Optional stop sequences
+
+        Returns:
+            ChatResult with the completion and its token usage
+        """
+        from vllm import SamplingParams
+
+        tokenizer = await engine.get_tokenizer()
+        prompt = tokenizer.apply_chat_template(
+            [{"role": _ROLES.get(m.type, "user"), "content": m.content} for m in messages],
+            tokenize=False,
+            add_generation_prompt=True,
+        )
+        params = SamplingParams(
+            temperature=self.temperature, max_tokens=self.max_tokens, stop=stop
+        )
+
+        final = None
+        async for output in engine.generate(prompt, params, uuid.uuid4().hex):
+            final = output
+
+        completion = final.outputs[0]
+        prompt_tokens = len(final.prompt_token_ids or ())
+        completion_tokens = len(completion.token_ids)
+        message = AIMessage(
+            content=completion.text,
+            usage_metadata={
+                "input_tokens": prompt_tokens,
+                "output_tokens": completion_tokens,
+                "total_tokens": prompt_tokens + completion_tokens,
+            },
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
@@ -80,7 +80,7 @@ def is_valid_sql(query: str, req_body_internal_id: str) -> SQLValidationResult:
         )
 
     except Exception as e:
-        logger.error(f"Error in internal validator: {str(e)}")
+        logger.error("Error in internal validator: %s", str(e))
         return SQLValidationResult(
             isValid=False, error=f"Internal validation error: {str(e)}"
         )
@@ -195,5 +195,5 @@ def validate_internal_sql_comprehensive(
         )
 
     except Exception as e:
-        logger.error(f"Error in comprehensive internal validator: {str(e)}")
+        logger.error("Error in comprehensive internal validator: %s", str(e))
         return SQLValidationResult(isValid=False, error=f"Validation error: {str(e)}")
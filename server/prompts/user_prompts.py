@@ -6,7 +6,7 @@ Handles user query validation and request context formatting
 import logging
 import time
 import re
-from typing import Tuple, Optional
+from typing import List, Tuple, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -313,6 +313,26 @@ def build_user_context(user_query: str) -> str:
         raise  # Fail extensively
 
 
+# Requirements appended to every analytics user context
+_CRITICAL_REQUIREMENTS = (
+    "## Critical Requirements:",
+    "- ALWAYS apply appropriate data filtering for security",
+    "- NEVER include filtering IDs in SELECT clauses or result sets",
+    "- NEVER confuse columns between payment_intent and payment_attempt tables",
+    "- ALWAYS use table aliases (pi for payment_intent, pa for payment_attempt) when joining",
+    "- ALWAYS prefix columns with table alias when joining tables (pi.status, pa.status)",
+    "- For NON-AGGREGATE queries: SELECT comprehensive column sets but EXCLUDE filtering IDs",
+    "- For AGGREGATE queries: Apply appropriate analytics calculation based on query intent",
+    "- Replace SELECT * with explicit column lists that exclude filtering IDs",
+    "- Use exact enum values and exclude specified dropoff statuses",
+    "- Use proper JOIN syntax when combining tables",
+    "- Include appropriate column aliases for clarity (intent_status, attempt_status)",
+    "- Return ONLY the SQL query with no additional text or formatting",
+    "- Ensure proper spacing around SQL keywords (especially WHERE, JOIN, ON, AND, OR)",
+    "- When in doubt between aggregate vs non-aggregate, prefer explicit column selection without filtering IDs",
+)
+
+
 def _build_user_request_context(user_query: str) -> str:
     """
     Build user request context with query information
@@ -329,26 +349,37 @@ def _build_user_request_context(user_query: str) -> str:
         "",
         f"**User Query:** {user_query}",
         "",
-        "## Critical Requirements:",
-        "- ALWAYS apply appropriate data filtering for security",
-        "- NEVER include filtering IDs in SELECT clauses or result sets",
-        "- NEVER confuse columns between payment_intent and payment_attempt tables",
-        "- ALWAYS use table aliases (pi for payment_intent, pa for payment_attempt) when joining",
-        "- ALWAYS prefix columns with table alias when joining tables (pi.status, pa.status)",
-        "- For NON-AGGREGATE queries: SELECT comprehensive column sets but EXCLUDE filtering IDs",
-        "- For AGGREGATE queries: Apply appropriate analytics calculation based on query intent",
-        "- Replace SELECT * with explicit column lists that exclude filtering IDs",
-        "- Use exact enum values and exclude specified dropoff statuses",
-        "- Use proper JOIN syntax when combining tables",
-        "- Include appropriate column aliases for clarity (intent_status, attempt_status)",
-        "- Return ONLY the SQL query with no additional text or formatting",
-        "- Ensure proper spacing around SQL keywords (especially WHERE, JOIN, ON, AND, OR)",
-        "- When in doubt between aggregate vs non-aggregate, prefer explicit column selection without filtering IDs",
+        *_CRITICAL_REQUIREMENTS,
     ]
 
     return "\n".join(context_parts)
 
 
+def build_batch_user_context(user_queries: List[str]) -> str:
+    """
+    Build a single user context for several analytics queries
+
+    Each query is tagged with its 1-based position (Q[1], Q[2], ...) so the
+    answers can be matched back to it. The critical requirements are
+    included once for the whole batch.
+
+    Args:
+        user_queries: Natural language queries from users
+
+    Returns:
+        str: Formatted batch user context
+    """
+
+    context_parts = ["## User Request Context", "", "**User Queries:**"]
+    context_parts.extend(
+        f"Q[{i}]: {query}" for i, query in enumerate(user_queries, start=1)
+    )
+    context_parts.append("")
+    context_parts.extend(_CRITICAL_REQUIREMENTS)
+
+    return "\n".join(context_parts)
+
+
 def get_response_template(reason: str) -> str:
     """
     Get appropriate response template based on classification reason
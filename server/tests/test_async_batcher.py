@@ -0,0 +1,149 @@
+"""
+Unit tests for AsyncBatcher
+Tests flushing, deduplication, error fan-out, cancellation and loop rebinding
+"""
+
+import asyncio
+import unittest
+import sys
+import os
+
+# Add server directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from langchain_integration.services.async_batcher import AsyncBatcher
+
+
+class RecordingHandler:
+    """Batch handler that records each batch and echoes its items"""
+
+    def __init__(self):
+        self.batches = []
+
+    async def __call__(self, items):
+        self.batches.append(list(items))
+        return [f"done:{item}" for item in items]
+
+
+class TestAsyncBatcher(unittest.TestCase):
+    """Test AsyncBatcher dispatching"""
+
+    def setUp(self):
+        self.handler = RecordingHandler()
+
+    def test_window_flush(self):
+        """Test items arriving within the window are dispatched together"""
+        batcher = AsyncBatcher(self.handler, max_batch=16, max_wait_ms=5)
+
+        async def run():
+            return await asyncio.gather(*(batcher.submit(i) for i in range(3)))
+
+        results = asyncio.run(run())
+
+        self.assertEqual(results, ["done:0", "done:1", "done:2"])
+        self.assertEqual(self.handler.batches, [[0, 1, 2]])
+
+    def test_max_batch_flush(self):
+        """Test a full batch is dispatched without waiting for the window"""
+        batcher = AsyncBatcher(self.handler, max_batch=2, max_wait_ms=10_000)
+
+        async def run():
+            return await asyncio.wait_for(
+                asyncio.gather(*(batcher.submit(i) for i in range(4))), timeout=1
+            )
+
+        results = asyncio.run(run())
+
+        self.assertEqual(results, ["done:0", "done:1", "done:2", "done:3"])
+        self.assertEqual(self.handler.batches, [[0, 1], [2, 3]])
+
+    def test_key_dedup_shares_result(self):
+        """Test equal keys within a window are dispatched once"""
+        batcher = AsyncBatcher(self.handler, max_wait_ms=5, key=lambda item: item)
+
+        async def run():
+            return await asyncio.gather(*(batcher.submit(item) for item in "aab"))
+
+        results = asyncio.run(run())
+
+        self.assertEqual(results, ["done:a", "done:a", "done:b"])
+        self.assertEqual(self.handler.batches, [["a", "b"]])
+        self.assertEqual(batcher.get_stats()["items"], 3)
+
+    def test_per_item_exception_fan_out(self):
+        """Test an exception result is raised to its own caller only"""
+        error = ValueError("bad item")
+
+        async def handler(items):
+            return [error if item == 1 else item for item in items]
+
+        batcher = AsyncBatcher(handler, max_wait_ms=5)
+
+        async def run():
+            return await asyncio.gather(
+                *(batcher.submit(i) for i in range(3)), return_exceptions=True
+            )
+
+        self.assertEqual(asyncio.run(run()), [0, error, 2])
+
+    def test_handler_failure_fails_whole_batch(self):
+        """Test a raising handler fails every caller in the window"""
+        async def handler(items):
+            raise RuntimeError("provider down")
+
+        batcher = AsyncBatcher(handler, max_wait_ms=5)
+
+        async def run():
+            return await asyncio.gather(
+                *(batcher.submit(i) for i in range(2)), return_exceptions=True
+            )
+
+        results = asyncio.run(run())
+
+        self.assertTrue(all(isinstance(r, RuntimeError) for r in results))
+
+    def test_caller_cancelled_mid_window(self):
+        """Test cancelling one caller leaves the rest of the window intact"""
+        batcher = AsyncBatcher(self.handler, max_wait_ms=20)
+
+        async def run():
+            cancelled = asyncio.ensure_future(batcher.submit("gone"))
+            kept = asyncio.ensure_future(batcher.submit("kept"))
+            await asyncio.sleep(0)
+            cancelled.cancel()
+            result = await kept
+            with self.assertRaises(asyncio.CancelledError):
+                await cancelled
+            return result
+
+        self.assertEqual(asyncio.run(run()), "done:kept")
+
+    def test_cancelled_dispatch_releases_callers(self):
+        """Test callers do not hang when the dispatch task is cancelled"""
+        async def handler(items):
+            await asyncio.sleep(3600)
+
+        batcher = AsyncBatcher(handler, max_wait_ms=1)
+
+        async def run():
+            caller = asyncio.ensure_future(batcher.submit("x"))
+            while not batcher._dispatching:
+                await asyncio.sleep(0.001)
+            for task in list(batcher._dispatching):
+                task.cancel()
+            with self.assertRaises(asyncio.CancelledError):
+                await asyncio.wait_for(caller, timeout=1)
+
+        asyncio.run(run())
+
+    def test_rebinds_to_new_loop(self):
+        """Test the batcher keeps working across event loops"""
+        batcher = AsyncBatcher(self.handler, max_wait_ms=5)
+
+        self.assertEqual(asyncio.run(batcher.submit("first")), "done:first")
+        self.assertEqual(asyncio.run(batcher.submit("second")), "done:second")
+        self.assertEqual(self.handler.batches, [["first"], ["second"]])
+
+
+if __name__ == "__main__":
+    unittest.main()
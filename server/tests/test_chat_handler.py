@@ -8,6 +8,7 @@ from unittest.mock import Mock, patch, MagicMock
 import sys
 import os
 import json
+import time
 from datetime import datetime, timedelta
 
 # Add server directory to path for imports
@@ -21,6 +22,7 @@ from chat_handler import (
     SchemaFetchError,
     ChatHandlerCache,
     process_chat_request,
+    _classify_cached,
 )
 
 
@@ -91,9 +93,9 @@ class TestChatHandlerCache(unittest.TestCase):
         # Should be available immediately
         self.assertIsNotNone(self.cache.get_schema())
 
-        # Manually expire the cache by setting old timestamp
-        old_time = datetime.now() - timedelta(seconds=2)
-        self.cache.cache_timestamps["default"] = old_time
+        # Manually expire the cache by moving its expiry into the past
+        schema, _ = self.cache.schema_cache["default"]
+        self.cache.schema_cache["default"] = (schema, time.monotonic() - 1)
 
         # Should be expired now
         self.assertIsNone(self.cache.get_schema())
@@ -103,6 +105,8 @@ class TestChatHandler(unittest.TestCase):
     """Test ChatHandler main functionality"""
 
     def setUp(self):
+        # Classifications are memoized across handlers; start each test clean
+        _classify_cached.cache_clear()
         self.handler = ChatHandler()
         self.mock_app_state = Mock()
         self.mock_app_state.get_mysql_connection = Mock()
@@ -390,11 +394,27 @@ class TestChatHandler(unittest.TestCase):
         self.assertIsNone(self.handler.cache.get_schema())
         self.assertIsNone(self.handler.cache.get_system_context())
 
+    @patch("chat_handler.time.sleep")
+    def test_sync_initialization_retries_once_without_sleeping(self, mock_sleep):
+        """Test sync chain construction retries once and never sleeps under the lock"""
+        def fail(chain_config, attempt, attempts_info):
+            attempts_info.append((attempt, "boom"))
+            return None
+
+        with patch.object(ChatHandler, "_build_chain_config", return_value=Mock()), \
+                patch.object(ChatHandler, "_try_create_chain", side_effect=fail) as mock_create:
+            self.assertFalse(self.handler._ensure_langchain_initialized(self.mock_app_state))
+
+        self.assertEqual(mock_create.call_count, 2)
+        mock_sleep.assert_not_called()
+
 
 class TestChatHandlerIntegration(unittest.TestCase):
     """Integration tests for ChatHandler"""
 
     def setUp(self):
+        # Classifications are memoized across handlers; start each test clean
+        _classify_cached.cache_clear()
         self.mock_app_state = Mock()
         self.mock_app_state.get_mysql_connection = Mock()
 
@@ -446,6 +466,44 @@ class TestChatHandlerIntegration(unittest.TestCase):
         self.assertEqual(handler.processing_stats["analytics_requests"], 1)
         self.assertEqual(handler.processing_stats["total_requests"], 1)
 
+    @patch("chat_handler.is_analytics_related_query")
+    @patch("chat_handler.handle_non_analytics_query_direct")
+    @patch("chat_handler.build_internal_user_context")
+    @patch("chat_handler.get_schema")
+    def test_batch_flow_shares_one_prompt(
+        self, mock_get_schema, mock_build_system, mock_handler, mock_is_analytics
+    ):
+        """Test batched processing sends analytics queries in one prompt"""
+        mock_is_analytics.side_effect = lambda q: (
+            (False, "greeting") if q == "hello" else (True, "analytics_keywords_detected")
+        )
+        mock_handler.return_value = {"response": "Hi there"}
+        mock_build_system.return_value = "System context"
+        mock_get_schema.return_value = {"payment_intent": {"columns": []}}
+
+        handler = ChatHandler()
+        handler.sequential_chain = Mock()
+        handler.sequential_chain.process_batch.return_value = [
+            Mock(success=True, final_response="first"),
+            Mock(success=True, final_response="second"),
+        ]
+
+        with patch.object(ChatHandler, "_ensure_langchain_initialized", return_value=True):
+            results = handler.process_batch_with_langchain(
+                self.mock_app_state,
+                ["show payments", "hello", "count refunds"],
+                ["s1", "s2", "s3"],
+            )
+
+        handler.sequential_chain.process_batch.assert_called_once()
+        kwargs = handler.sequential_chain.process_batch.call_args.kwargs
+        self.assertIn("Q[1]: show payments", kwargs["final_prompt"])
+        self.assertIn("Q[2]: count refunds", kwargs["final_prompt"])
+        self.assertEqual(kwargs["session_ids"], ["s1", "s3"])
+        self.assertEqual(results[0], "first")
+        self.assertEqual(results[1].summary, "Hi there")
+        self.assertEqual(results[2], "second")
+
     def test_error_handling_invalid_input(self):
         """Test error handling for invalid inputs"""
         handler = ChatHandler()
@@ -526,10 +584,13 @@ class TestWebSocketIntegration(unittest.TestCase):
             "test_session", "test query", "test response", mock_app_state
         )
 
-        # Verify Redis calls
-        mock_redis.set.assert_called()
-        mock_redis.incr.assert_called()
-        mock_redis.expire.assert_called()
+        # Verify Redis calls are batched in one pipeline
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        mock_pipe = mock_redis.pipeline.return_value
+        mock_pipe.set.assert_called()
+        mock_pipe.incr.assert_called()
+        mock_pipe.expire.assert_called()
+        mock_pipe.execute.assert_called_once()
 
 
 if __name__ == "__main__":
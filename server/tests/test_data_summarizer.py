@@ -0,0 +1,158 @@
+"""
+Unit tests for DataSummarizerService
+Tests the summary cache, prompt rows and streaming cleanup
+"""
+
+import asyncio
+import time
+import unittest
+from unittest.mock import Mock
+import sys
+import os
+
+# Add server directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from langchain_integration.models.response_models import LLMConfig, SQLExecutionResult
+from langchain_integration.services.data_summarizer import DataSummarizerService
+
+
+def make_service(**config):
+    service = DataSummarizerService(LLMConfig(
+        model_name="test-model",
+        api_key="test-key",
+        api_base="http://localhost/v1",
+        **config
+    ))
+    service.chain = Mock()
+    service.chain.invoke.return_value = "<p><strong>Payments</strong> are steady.</p>"
+    return service
+
+
+def make_execution_result(rows):
+    return SQLExecutionResult(
+        success=True,
+        data=rows,
+        columns=list(rows[0]),
+        row_count=len(rows),
+        execution_time_ms=1.0,
+    )
+
+
+class TestSummaryCache(unittest.TestCase):
+    """Test caching of summaries for repeated queries"""
+
+    def setUp(self):
+        self.execution_result = make_execution_result([{"id": 1, "amount": 2.5}])
+
+    def test_cache_disabled_by_default(self):
+        """Test every call reaches the LLM when summary_cache_ttl_seconds is 0"""
+        service = make_service()
+
+        service.summarize_data(self.execution_result, "q", "SELECT 1")
+        service.summarize_data(self.execution_result, "q", "SELECT 1")
+
+        self.assertEqual(service.chain.invoke.call_count, 2)
+        self.assertEqual(service.get_summary_stats()["summary_cache"]["entries"], 0)
+
+    def test_cache_hit(self):
+        """Test a repeated query over the same rows reuses the summary"""
+        service = make_service(summary_cache_ttl_seconds=60)
+
+        first = service.summarize_data(self.execution_result, "q", "SELECT 1")
+        second = service.summarize_data(self.execution_result, "q", "SELECT 1")
+
+        self.assertEqual(service.chain.invoke.call_count, 1)
+        self.assertEqual(second.html_summary, first.html_summary)
+        self.assertEqual(second.prompt_tokens, 0)
+        self.assertEqual(service.get_summary_stats()["summary_cache"]["hits"], 1)
+
+    def test_cache_ttl_expiry(self):
+        """Test an expired summary is regenerated"""
+        service = make_service(summary_cache_ttl_seconds=60)
+        service.summarize_data(self.execution_result, "q", "SELECT 1")
+
+        # Move every entry's expiry into the past
+        for key, (result, _) in list(service._summary_cache.items()):
+            service._summary_cache[key] = (result, 0.0)
+
+        service.summarize_data(self.execution_result, "q", "SELECT 1")
+
+        self.assertEqual(service.chain.invoke.call_count, 2)
+
+    def test_unserializable_rows_skip_cache(self):
+        """Test rows the cache key cannot encode are still summarized"""
+        service = make_service(summary_cache_ttl_seconds=60)
+        execution_result = make_execution_result([{"id": 2 ** 70}])
+
+        result = service.summarize_data(execution_result, "q", "SELECT 1")
+
+        self.assertTrue(result.success)
+        self.assertEqual(service.get_summary_stats()["summary_cache"]["entries"], 0)
+
+
+class TestPrepareDataSummary(unittest.TestCase):
+    """Test the rows serialized into the summary prompt"""
+
+    def test_non_string_keys_and_large_ints(self):
+        """Test rows orjson rejects by default are still included"""
+        service = make_service()
+
+        summary = service._prepare_data_summary([{1: "a"}, {"id": 2 ** 70}])
+
+        self.assertIn('Row 1: {"1":"a"}', summary)
+        self.assertIn(f'Row 2: {{"id":{2 ** 70}}}', summary)
+
+
+class TestStreamingSummary(unittest.TestCase):
+    """Test the worker future behind streamed summaries is always settled"""
+
+    def setUp(self):
+        self.execution_result = make_execution_result([{"id": 1, "amount": 2.5}])
+        self.service = make_service()
+
+        # Keep the table worker running until the stream is over
+        build_parts = self.service._local_summary_parts
+        self.service._local_summary_parts = lambda data: (time.sleep(0.2), build_parts(data))[1]
+
+    def test_stream_failure_settles_local_parts(self):
+        """Test a failing LLM stream yields a failed result and settles the future"""
+        async def failing_stream(chain_input):
+            yield "<p>partial"
+            raise RuntimeError("stream dropped")
+
+        self.service.chain.astream = failing_stream
+
+        async def run():
+            items = [item async for item in self.service._astream_summary(
+                self.execution_result, "q", "SELECT 1"
+            )]
+            return items[0].done(), items[-1]
+
+        settled, result = asyncio.run(run())
+
+        self.assertTrue(settled)
+        self.assertFalse(result.success)
+        self.assertIn("stream dropped", result.error)
+
+    def test_early_close_settles_local_parts(self):
+        """Test a consumer that stops early leaves no pending worker future"""
+        async def endless_stream(chain_input):
+            while True:
+                yield "<p>more"
+                await asyncio.sleep(0)
+
+        self.service.chain.astream = endless_stream
+
+        async def run():
+            stream = self.service._astream_summary(self.execution_result, "q", "SELECT 1")
+            local_parts = await stream.__anext__()
+            await stream.__anext__()
+            await stream.aclose()
+            return local_parts.done()
+
+        self.assertTrue(asyncio.run(run()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+"""
+Unit tests for llm_http_clients
+Tests sync client sharing, per-call async clients and endpoint eviction
+"""
+
+import unittest
+from unittest.mock import Mock, patch
+import sys
+import os
+
+# Add server directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from langchain_integration.services import http_clients
+
+
+class TestLLMHttpClients(unittest.TestCase):
+    """Test the HTTP/2 clients handed to ChatOpenAI"""
+
+    def setUp(self):
+        http_clients._sync_clients.clear()
+        patchers = [
+            patch.object(http_clients, "_http2_available", return_value=True),
+            patch("httpx.Client", side_effect=lambda **kwargs: Mock()),
+            patch("httpx.AsyncClient", side_effect=lambda **kwargs: Mock()),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(http_clients._sync_clients.clear)
+
+    def test_without_h2(self):
+        """Test ChatOpenAI keeps its own clients when h2 is missing"""
+        http_clients._http2_available.return_value = False
+
+        self.assertEqual(http_clients.llm_http_clients("http://llm/v1", 30), {})
+
+    def test_sync_client_shared_async_client_per_call(self):
+        """Test services share the sync client but never an async client"""
+        first = http_clients.llm_http_clients("http://llm/v1", 30)
+        second = http_clients.llm_http_clients("http://llm/v1", 30)
+
+        self.assertIs(first["http_client"], second["http_client"])
+        self.assertIsNot(first["http_async_client"], second["http_async_client"])
+
+    def test_new_endpoint_evicts_old_client(self):
+        """Test only the latest endpoint's sync client is kept"""
+        old = http_clients.llm_http_clients("http://llm/v1", 30)["http_client"]
+        new = http_clients.llm_http_clients("http://llm/v2", 30)["http_client"]
+
+        self.assertIsNot(old, new)
+        self.assertEqual(list(http_clients._sync_clients), [("http://llm/v2", 30)])
+
+
+if __name__ == "__main__":
+    unittest.main()
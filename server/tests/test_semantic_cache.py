@@ -0,0 +1,104 @@
+"""
+Unit tests for SemanticCache
+Tests hits on paraphrases, literal isolation, expiry and scope resets
+"""
+
+import unittest
+import sys
+import os
+
+# Add server directory to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from langchain_integration.models.response_models import (
+    DataSummaryResult,
+    SequentialChainResult,
+)
+
+# numpy is only needed when AI_SEMANTIC_CACHE is enabled
+try:
+    import numpy as np
+    from langchain_integration.services.semantic_cache import SemanticCache
+except ImportError:
+    np = None
+
+DIM = 16
+
+# Paraphrases (and literal-only variants) map to the same direction, the
+# way a sentence embedding places them close together
+TOPICS = {
+    "payments in March 2024": 0,
+    "show me the payments for March 2024": 0,
+    "payments in April 2024": 0,
+    "volume of merchant 123": 1,
+    "volume of merchant 124": 1,
+}
+
+
+def embed(text):
+    vector = np.full(DIM, 0.01, dtype=np.float32)
+    vector[TOPICS[text]] = 1.0
+    return vector
+
+
+def make_result(summary):
+    return SequentialChainResult(
+        success=True,
+        final_response=DataSummaryResult(success=True, summary=summary),
+        response_type="summary",
+    )
+
+
+@unittest.skipUnless(np is not None, "numpy is not installed")
+class TestSemanticCache(unittest.TestCase):
+    """Test SemanticCache lookups"""
+
+    def setUp(self):
+        self.cache = SemanticCache(embedder=embed, dim=DIM)
+
+    def insert(self, query, summary, scope=b"scope"):
+        self.cache.insert(self.cache.embed(query), make_result(summary), scope, query)
+
+    def lookup(self, query, scope=b"scope"):
+        return self.cache.lookup(self.cache.embed(query), scope, query)
+
+    def test_paraphrase_hit(self):
+        """Test a rephrased query with the same literals reuses the result"""
+        self.insert("payments in March 2024", "march")
+
+        result = self.lookup("show me the payments for March 2024")
+
+        self.assertIsNotNone(result)
+        self.assertEqual(result.final_response.summary, "march")
+        self.assertEqual(self.cache.hits, 1)
+
+    def test_different_literal_misses(self):
+        """Test queries differing only in a date or ID never share a result"""
+        self.insert("payments in March 2024", "march")
+        self.insert("volume of merchant 123", "merchant 123")
+
+        self.assertIsNone(self.lookup("payments in April 2024"))
+        self.assertIsNone(self.lookup("volume of merchant 124"))
+        self.assertEqual(self.cache.hits, 0)
+
+    def test_ttl_expiry(self):
+        """Test expired entries are not returned"""
+        self.cache.ttl = 0
+        self.insert("payments in March 2024", "march")
+
+        self.assertIsNone(self.lookup("payments in March 2024"))
+
+    def test_scope_reset(self):
+        """Test a new prompt scope misses and then empties the cache"""
+        self.insert("payments in March 2024", "march")
+
+        self.assertIsNone(self.lookup("payments in March 2024", scope=b"new schema"))
+
+        self.insert("volume of merchant 123", "merchant 123", scope=b"new schema")
+        self.assertEqual(self.cache.get_stats()["entries"], 1)
+        self.assertIsNone(self.lookup("payments in March 2024", scope=b"new schema"))
+        self.assertIsNotNone(self.lookup("volume of merchant 123", scope=b"new schema"))
+
+
+if __name__ == "__main__":
+    unittest.main()
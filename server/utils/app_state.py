@@ -1,4 +1,4 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Mapping, Optional
 import logging
 import atexit
 from config.app_config import load_config, validate_config
@@ -13,7 +13,7 @@ class AppState:
 
     def __init__(self):
         """Initialize app state"""
-        self.config: Dict[str, Any] = {}
+        self.config: Mapping[str, Any] = {}
         self.mysql_connection: Optional[MySQLConnectionPool] = None
         self.redis_connection: Optional[RedisConnectionManager] = None
         self.websocket_config: Optional[WebSocketManager] = None
@@ -29,6 +29,21 @@ class AppState:
         Returns:
             True if initialization successful, False otherwise
         """
+        return self.load_configuration(app) and self.open_pools()
+
+    def load_configuration(self, app) -> bool:
+        """
+        Load configuration and create the fork-safe components.
+
+        Nothing here holds a socket, so it can run in a Gunicorn master
+        before workers are forked.
+
+        Args:
+            app: Flask application instance
+
+        Returns:
+            True if loading successful, False otherwise
+        """
         try:
             # Load configuration
             self.config = load_config()
@@ -36,17 +51,37 @@ class AppState:
                 logger.error("Configuration validation failed")
                 return False
 
+            # Initialize WebSocket manager
+            self.websocket_config = create_websocket_manager(
+                app, self.config["websocket"]
+            )
+
+            return True
+
+        except Exception as e:
+            logger.error(f"Error loading app configuration: {e}")
+            return False
+
+    def open_pools(self) -> bool:
+        """
+        Open the MySQL and Redis connection pools.
+
+        Must run in the process that will use them (i.e. after fork when
+        preloading under Gunicorn). Safe to call more than once.
+
+        Returns:
+            True if the pools are open, False otherwise
+        """
+        if self._initialized:
+            return True
+
+        try:
             # Initialize MySQL connection pool
             self.mysql_connection = create_mysql_pool(self.config["mysql"])
 
             # Initialize Redis connection
             self.redis_connection = create_redis_connection(self.config["redis"])
 
-            # Initialize WebSocket manager
-            self.websocket_config = create_websocket_manager(
-                app, self.config["websocket"]
-            )
-
             # Register cleanup handlers
             atexit.register(self.cleanup)
 
@@ -91,6 +126,18 @@ class AppState:
 
         return self.redis_connection.get_client()
 
+    def get_redis_raw_client(self):
+        """
+        Get the Redis client that returns raw bytes, for JSON values.
+
+        Returns:
+            Redis client object with decode_responses disabled
+        """
+        if not self.redis_connection:
+            raise Exception("Redis connection not initialized")
+
+        return self.redis_connection.get_raw_client()
+
     def get_socketio(self):
         """
         Get SocketIO instance.
@@ -119,48 +166,52 @@ class AppState:
         """
         Perform health check on all components.
 
+        Every component maps to a dict with a boolean ``ok`` and a
+        human-readable ``detail``; components that are merely not
+        initialized are reported as ok.
+
         Returns:
             Dictionary with health status of all components
         """
         health_status = {
-            "app_state": "healthy" if self._initialized else "not_initialized",
-            "mysql": "unknown",
-            "redis": "unknown",
-            "websocket": "unknown",
+            "app_state": {
+                "ok": True,
+                "detail": "healthy" if self._initialized else "not_initialized",
+            },
         }
 
         # Check MySQL
         try:
             if self.mysql_connection:
-                mysql_status = self.mysql_connection.get_pool_status()
-                health_status["mysql"] = mysql_status.get("status", "unknown")
+                mysql_status = self.mysql_connection.get_pool_status().get("status", "unknown")
+                health_status["mysql"] = {"ok": mysql_status != "error", "detail": mysql_status}
             else:
-                health_status["mysql"] = "not_initialized"
+                health_status["mysql"] = {"ok": True, "detail": "not_initialized"}
         except Exception as e:
-            health_status["mysql"] = f"error: {str(e)}"
+            health_status["mysql"] = {"ok": False, "detail": f"error: {str(e)}"}
 
         # Check Redis
         try:
             if self.redis_connection:
-                health_status["redis"] = (
-                    "healthy" if self.redis_connection.ping() else "unhealthy"
-                )
+                ok = bool(self.redis_connection.ping())
+                health_status["redis"] = {"ok": ok, "detail": "healthy" if ok else "unhealthy"}
             else:
-                health_status["redis"] = "not_initialized"
+                health_status["redis"] = {"ok": True, "detail": "not_initialized"}
         except Exception as e:
-            health_status["redis"] = f"error: {str(e)}"
+            health_status["redis"] = {"ok": False, "detail": f"error: {str(e)}"}
 
         # Check WebSocket
         try:
             if self.websocket_config:
-                health_status["websocket"] = "healthy"
-                health_status["websocket_connections"] = (
-                    self.websocket_config.get_connection_count()
-                )
+                health_status["websocket"] = {
+                    "ok": True,
+                    "detail": "healthy",
+                    "connections": self.websocket_config.get_connection_count(),
+                }
             else:
-                health_status["websocket"] = "not_initialized"
+                health_status["websocket"] = {"ok": True, "detail": "not_initialized"}
         except Exception as e:
-            health_status["websocket"] = f"error: {str(e)}"
+            health_status["websocket"] = {"ok": False, "detail": f"error: {str(e)}"}
 
         return health_status
 
@@ -249,3 +300,26 @@ def initialize_app_state(app) -> bool:
         True if initialization successful, False otherwise
     """
     return app_state.initialize(app)
+
+
+def load_app_configuration(app) -> bool:
+    """
+    Load configuration for the global app state without opening pools.
+
+    Args:
+        app: Flask application instance
+
+    Returns:
+        True if loading successful, False otherwise
+    """
+    return app_state.load_configuration(app)
+
+
+def open_app_pools() -> bool:
+    """
+    Open the connection pools of the global app state.
+
+    Returns:
+        True if the pools are open, False otherwise
+    """
+    return app_state.open_pools()
@@ -0,0 +1,83 @@
+import orjson
+from collections.abc import Mapping
+from decimal import Decimal
+from typing import Any
+from flask.json.provider import JSONProvider
+
+# orjson natively handles datetime, date, UUID, dataclasses and numpy types;
+# anything else falls through to _default.
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Serialize the extra types Flask's default provider supports"""
+    if isinstance(obj, Decimal):
+        return str(obj)
+
+    # Read-only views such as the MappingProxyType config sections
+    if isinstance(obj, Mapping):
+        return dict(obj)
+
+    if hasattr(obj, '__html__'):
+        return str(obj.__html__())
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps_bytes(obj: Any) -> bytes:
+    """
+    Serialize an object to JSON bytes using orjson.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        UTF-8 encoded JSON document
+    """
+    return orjson.dumps(obj, default=_default, option=_DUMPS_OPTIONS)
+
+
+def dumps(obj: Any, **kwargs: Any) -> str:
+    """
+    Serialize an object to a JSON string using orjson.
+
+    Extra keyword arguments (e.g. ``separators``) are accepted for
+    compatibility with the stdlib ``json`` interface and ignored, since
+    orjson always emits compact output.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        JSON string
+    """
+    return dumps_bytes(obj).decode()
+
+
+def loads(s: Any, **kwargs: Any) -> Any:
+    """
+    Deserialize a JSON document using orjson.
+
+    Args:
+        s: JSON document as str, bytes or bytearray
+
+    Returns:
+        Deserialized Python object
+    """
+    return orjson.loads(s)
+
+
+class ORJSONProvider(JSONProvider):
+    """Flask JSON provider backed by orjson"""
+
+    mimetype = 'application/json'
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return dumps(obj, **kwargs)
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return loads(s, **kwargs)
+
+    def response(self, *args: Any, **kwargs: Any):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(dumps_bytes(obj), mimetype=self.mimetype)
@@ -1,11 +1,13 @@
 from flask_socketio import emit, disconnect
 from flask import request
 from utils.app_state import get_app_state
-from chat_handler import process_chat_request, process_chat_request_with_langchain, ChatHandler
+from chat_handler import process_chat_request, process_chat_request_with_langchain, get_chat_handler
 from langchain_integration.models.response_models import DataSummaryResult
+from utils import json_utils
 import logging
 import json
 from datetime import datetime
+from html import escape
 
 logger = logging.getLogger(__name__)
 
@@ -178,9 +180,7 @@ def register_websocket_events(socketio):
         try:
             session_id = request.sid
             
-            # Create ChatHandler instance to get stats
-            handler = ChatHandler()
-            stats = handler.get_stats()
+            stats = get_chat_handler(get_app_state()).get_stats()
             
             emit('chat_stats', {
                 'stats': stats,
@@ -198,8 +198,7 @@ def register_websocket_events(socketio):
         try:
             session_id = request.sid
             
-            handler = ChatHandler()
-            handler.clear_cache()
+            get_chat_handler(get_app_state()).clear_cache()
             
             emit('cache_cleared', {
                 'message': 'Chat handler cache cleared successfully',
@@ -231,13 +230,13 @@ def register_websocket_events(socketio):
             query_keys.sort(reverse=True)
             query_keys = query_keys[:limit]
             
-            # Fetch query data
+            # Fetch query data in one round trip, as bytes for orjson
             history = []
-            for key in query_keys:
+            raw_values = app_state.get_redis_raw_client().mget(query_keys) if query_keys else []
+            for query_data in raw_values:
                 try:
-                    query_data = redis_client.get(key)
                     if query_data:
-                        history.append(json.loads(query_data))
+                        history.append(json_utils.loads(query_data))
                 except Exception as e:
                     logger.error(f"Error parsing query history entry: {e}")
             
@@ -342,12 +341,14 @@ def store_query_history(session_id: str, query: str, response: str, app_state) -
         
         # Store individual query
         query_key = f"query:{session_id}:{datetime.now().timestamp()}"
-        redis_client.set(query_key, json.dumps(history_entry), ex=86400)
+        pipe = redis_client.pipeline(transaction=False)
+        pipe.set(query_key, json_utils.dumps(history_entry), ex=86400)
         
         # Update session query count
         session_queries_key = f"session_queries:{session_id}"
-        redis_client.incr(session_queries_key)
-        redis_client.expire(session_queries_key, 86400)
+        pipe.incr(session_queries_key)
+        pipe.expire(session_queries_key, 86400)
+        pipe.execute()
         
     except Exception as e:
         logger.error(f"Error storing query history: {e}")
@@ -397,7 +398,7 @@ def process_user_query(query: str, session_id: str, app_state) -> dict:
             'timestamp': datetime.now().isoformat(),
             'success': False,
             'summary': f"Error: {str(e)}",
-            'html_summary': f"<p><strong>Error:</strong> {str(e)}</p>",
+            'html_summary': f"<p><strong>Error:</strong> {escape(str(e), quote=False)}</p>",
             'markdown_data': None,
             'key_insights': [],
             'error': str(e),